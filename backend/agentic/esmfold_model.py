@@ -3,13 +3,18 @@
 import torch
 from esm import pretrained
 
+from backend.utils.model_cache import get_model_cache
+
 
 class ESMFoldPredictor:
     """
     Single Sequence → PDB Structure using Meta AI's ESMFold
     GPU → super fast (1~10 seconds)
+    같은 서열은 model_cache 에서 바로 반환
     """
 
+    MODEL_ID = "esmfold_v1:pdb"
+
     def __init__(self):
         device = "cuda" if torch.cuda.is_available() else "cpu"
         print(f"[ESMFold] Loading model on {device}...")
@@ -24,6 +29,9 @@ class ESMFoldPredictor:
         입력: 아미노산 서열
         출력: PDB 포맷 텍스트 (string)
         """
+        return get_model_cache().get_or_compute(self.MODEL_ID, sequence, lambda: self._infer(sequence))
+
+    def _infer(self, sequence: str) -> str:
         with torch.no_grad():
             pdb = self.model.infer_pdb(sequence)
             return pdb
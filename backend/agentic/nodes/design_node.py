@@ -8,6 +8,7 @@ from transformers import AutoTokenizer, AutoModelForCausalLM
 import esm
 
 from backend.agentic.state import HeliconState
+from backend.utils.model_cache import get_model_cache
 
 logger = logging.getLogger("DesignNode")
 logging.basicConfig(level=logging.INFO)
@@ -17,6 +18,8 @@ logging.basicConfig(level=logging.INFO)
 # ESM2 SCORER (Protein sequence scoring)
 # ============================================================
 class ESM2Scorer:
+    MODEL_ID = "esm2_t33_650M_UR50D:mean_ll"
+
     def __init__(self):
         device = "cuda" if torch.cuda.is_available() else "cpu"
         self.device = device
@@ -26,9 +29,12 @@ class ESM2Scorer:
         self.model = self.model.to(device).eval()
         self.converter = self.alphabet.get_batch_converter()
 
-    @torch.no_grad()
     def score(self, seq: str) -> float:
-        """Return per-token mean log-likelihood score."""
+        """Return per-token mean log-likelihood score (cached per sequence)."""
+        return get_model_cache().get_or_compute(self.MODEL_ID, seq, lambda: self._score(seq))
+
+    @torch.no_grad()
+    def _score(self, seq: str) -> float:
         data = [("protein", seq)]
         _, _, tokens = self.converter(data)
         tokens = tokens.to(self.device)
@@ -1,5 +1,6 @@
 # backend/agentic/nodes/graph_node.py
 
+import os
 import logging
 from typing import List, Dict, Any, Optional
 
@@ -9,6 +10,8 @@ from backend.graph.graph_search_client import GraphSearchClient
 logger = logging.getLogger("GraphNode")
 logging.basicConfig(level=logging.INFO)
 
+GRAPH_RANKING = os.getenv("GRAPH_RANKING", "cypher")
+
 
 class GraphNode:
     """
@@ -18,8 +21,9 @@ class GraphNode:
     - therapeutic_recommendation
     """
 
-    def __init__(self, top_k: int = 20):
+    def __init__(self, top_k: int = 20, ranking: str = GRAPH_RANKING):
         self.top_k = top_k
+        self.ranking = ranking  # "cypher" | "ppr"
 
     def run(self, state: HeliconState) -> HeliconState:
         intent = state.intent
@@ -49,11 +53,11 @@ class GraphNode:
                 result = client.similar_proteins(uniprot_id, self.top_k)
 
             elif intent == "disease_prediction":
-                result = client.predict_diseases(uniprot_id, self.top_k)
+                result = client.predict_diseases(uniprot_id, self.top_k, ranking=self.ranking)
 
             elif intent == "therapeutic_recommendation":
                 # 🔥 NEW: therapeutic recommendation
-                result = client.recommend_therapeutics(uniprot_id, self.top_k)
+                result = client.recommend_therapeutics(uniprot_id, self.top_k, ranking=self.ranking)
 
         finally:
             client.close()
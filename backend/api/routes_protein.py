@@ -1,9 +1,17 @@
 # backend/api/routes_protein.py
 
-from fastapi import APIRouter
-from pydantic import BaseModel
+from typing import Literal
+
+from fastapi import APIRouter, HTTPException, Query
+from pydantic import BaseModel, Field
 
 from backend.agentic.sequence_workflow import run_sequence_pipeline
+from backend.pipeline.protein_search import (
+    IndexUnavailable,
+    search_similar_sequences,
+    nearest_therapeutics_for_protein,
+    nearest_proteins_for_therapeutic,
+)
 
 router = APIRouter(
     prefix="/protein",
@@ -15,6 +23,12 @@ class SequenceQuery(BaseModel):
     sequence: str
 
 
+class SimilarityQuery(BaseModel):
+    sequence: str
+    top_k: int = Field(10, gt=0)
+    index: Literal["exact", "ivf"] = "exact"
+
+
 @router.post("/analyze")
 async def analyze_protein(payload: SequenceQuery):
     """
@@ -24,3 +38,43 @@ async def analyze_protein(payload: SequenceQuery):
     """
     result = run_sequence_pipeline(payload.sequence)
     return result
+
+
+@router.post("/similar")
+async def similar_proteins(payload: SimilarityQuery):
+    """
+    서열 유사도 검색 엔드포인트
+    - 입력: sequence, top_k, index ("exact" | "ivf")
+    - 출력: 가장 가까운 기존 단백질 top-k (uniprot_id, cosine score)
+    - index="ivf" 인데 index 가 빌드되지 않았으면 503
+    """
+    try:
+        return search_similar_sequences(payload.sequence, top_k=payload.top_k, index=payload.index)
+    except IndexUnavailable as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+
+@router.get("/{uniprot_id}/nearest-therapeutics")
+async def nearest_therapeutics(uniprot_id: str, top_k: int = Query(10, gt=0)):
+    """
+    Protein → 가장 가까운 TherapeuticProtein (embedding cosine, 그래프 탐색 없음)
+    - embedding store 가 아직 없으면 404
+    """
+    try:
+        hits = nearest_therapeutics_for_protein(uniprot_id, top_k=top_k)
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    return {"uniprot_id": uniprot_id, "hits": hits}
+
+
+@router.get("/therapeutic/{tp_id}/nearest-proteins")
+async def nearest_proteins(tp_id: str, top_k: int = Query(10, gt=0)):
+    """
+    TherapeuticProtein → 가장 가까운 Protein (embedding cosine, 그래프 탐색 없음)
+    - embedding store 가 아직 없으면 404
+    """
+    try:
+        hits = nearest_proteins_for_therapeutic(tp_id, top_k=top_k)
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    return {"tp_id": tp_id, "hits": hits}
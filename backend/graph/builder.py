@@ -22,6 +22,7 @@ Relations:
 """
 
 from pathlib import Path
+from typing import Dict
 import traceback
 
 from backend.config import Config
@@ -34,20 +35,71 @@ from backend.graph.loaders import (
     TrialLoader,
     PublicationLoader,
 )
-from backend.graph.relation_loader import RelationLoader
+from backend.graph.relation_loader import (
+    GRAPH_LOAD_WORKERS,
+    RELATION_SPECS,
+    RelationLoader,
+    ensure_similarity_migration,
+    migrate_similarity_edges,
+)
+from backend.graph.graph_search_client import drop_ppr_projection
+from backend.graph.query_preflight import PREFLIGHT_MODE, run_preflight
 
 
 # ---------------------------------------------------------
 # Safe wrapper
 # ---------------------------------------------------------
+# label → 유실 내용 (dead-letter row 수 / 중단된 단계), build 끝에 요약 출력
+_LOSSES: Dict[str, str] = {}
+
+
+def _lost_rows(result):
+    if isinstance(result, dict):
+        return result.get("lost", 0), result.get("dead_letter_path")
+    return getattr(result, "lost_rows", 0), getattr(result, "dead_letter_path", None)
+
+
 def _safe_load(label: str, func, *args, **kwargs):
     try:
         print(f"\n🚀 [{label}] 시작")
-        func(*args, **kwargs)
+        result = func(*args, **kwargs)
         print(f"✅ [{label}] 완료")
+        if result is not None:
+            print(f"📊 [{label}] {result}")
+            lost, path = _lost_rows(result)
+            if lost:
+                print(f"⚠️ [{label}] {lost} rows → dead-letter: {path}")
+                _LOSSES[label] = f"{lost} rows → {path}"
+        return result
     except Exception as e:
         print(f"❌ [{label}] 실패: {e}")
         traceback.print_exc()
+        _LOSSES[label] = f"load aborted ({e.__class__.__name__}: {e}), remaining rows not loaded"
+
+
+def _print_loss_summary():
+    print("\n===============================================")
+    if not _LOSSES:
+        print("✅ No rows lost")
+    else:
+        print("⚠️ Lost rows summary")
+        for label, detail in _LOSSES.items():
+            print(f"   - {label}: {detail}")
+    print("===============================================")
+
+
+# ---------------------------------------------------------
+# Incremental relations (RELATION_SPECS 기반)
+# ---------------------------------------------------------
+def _load_relation_changes(rel: RelationLoader, roots):
+    from backend.graph.bulk_import import find_relation_file
+
+    for spec in RELATION_SPECS:
+        path = find_relation_file(spec, roots)
+        if path is None:
+            print(f"ℹ️ Optional missing: {spec.name} ({', '.join(spec.filenames)})")
+            continue
+        _safe_load(f"{spec.rel_type} ({spec.name}, changes)", rel.load_changes, spec, str(path))
 
 
 # ---------------------------------------------------------
@@ -56,7 +108,16 @@ def _safe_load(label: str, func, *args, **kwargs):
 def build_full_graph(
     node_root: Path | str | None = None,
     relations_root: Path | str | None = None,
+    incremental: bool = False,
+    preflight: str = PREFLIGHT_MODE,
 ):
+    """
+    incremental=True 면 change-aware 모드:
+      이전 실행 snapshot (processed/load_snapshots) 과 row_hash 를 비교해서
+      추가 / 변경 / 삭제된 노드와 관계만 Neo4j 로 보낸다.
+
+    preflight (warn | fail | off): 적재 전에 constraint 확인 + 모든 Cypher EXPLAIN (query_preflight)
+    """
 
     if node_root is None:
         node_root = Config.RAW_DATA_ROOT
@@ -66,6 +127,7 @@ def build_full_graph(
     node_root = Path(node_root)
     relations_root = Path(relations_root)
     processed_root = Config.PROCESSED_DATA_ROOT
+    _LOSSES.clear()
 
     print("\n===============================================")
     print("🧬 ReBio GraphDB Builder (OpenTargets Version)")
@@ -73,7 +135,10 @@ def build_full_graph(
     print(f"📁 Node CSV Root      : {node_root}")
     print(f"📁 Relation CSV Root  : {relations_root}")
     print(f"📁 Processed Data Root: {processed_root}")
-    print(f"🔗 Neo4j URI          : {Config.NEO4J_URI}\n")
+    print(f"🔗 Neo4j URI          : {Config.NEO4J_URI}")
+    print(f"🧵 Writer workers     : {GRAPH_LOAD_WORKERS}")
+    print(f"♻️ Incremental        : {incremental}")
+    print(f"🔍 Preflight          : {preflight}\n")
 
     # -------------------------------------------------
     # 1) LOAD NODES
@@ -81,6 +146,13 @@ def build_full_graph(
     driver = get_driver()
 
     try:
+        if preflight != "off":
+            print("\n===============================================")
+            print(f"🔍 Query-plan Preflight ({preflight})")
+            print("===============================================")
+            checks = run_preflight(driver, mode=preflight)
+            print(f"✅ {sum(c.ok for c in checks)}/{len(checks)} statements use index-backed plans")
+
         print("\n===============================================")
         print("📌 Loading Nodes")
         print("===============================================")
@@ -96,7 +168,9 @@ def build_full_graph(
         for label, (filename, LoaderClass) in csv_map.items():
             path = node_root / filename
             if path.exists():
-                _safe_load(label, LoaderClass(driver).load_from_csv, str(path))
+                loader = LoaderClass(driver, workers=GRAPH_LOAD_WORKERS)
+                load = loader.load_changes_from_csv if incremental else loader.load_from_csv
+                _safe_load(label, load, str(path))
             else:
                 print(f"ℹ️ Optional missing: {path}")
 
@@ -111,6 +185,22 @@ def build_full_graph(
     print("===============================================")
 
     rel = RelationLoader()
+    # 이전 형식 SIMILAR_TO (method 없음) 정리 — DB 당 한 번 (Migration marker)
+    ensure_similarity_migration(rel.driver)
+
+    if incremental:
+        try:
+            _load_relation_changes(rel, [processed_root, relations_root])
+            # 바뀐 그래프로 다음 PPR 요청에서 다시 projection
+            drop_ppr_projection(rel.driver)
+        finally:
+            rel.close()
+
+        _print_loss_summary()
+        print("\n===============================================")
+        print("🎉 GRAPH DB INCREMENTAL UPDATE COMPLETED")
+        print("===============================================\n")
+        return
 
     try:
         # ------------------------------- 
@@ -148,6 +238,16 @@ def build_full_graph(
         else:
             print(f"ℹ️ Optional missing: {sim_file}")
 
+        kmer_sim = relations_root / "protein_similarity_kmer.csv"
+        if kmer_sim.exists():
+            _safe_load(
+                "Protein Similarity (SIMILAR_TO, k-mer)",
+                rel.load_protein_kmer_similarity,
+                str(kmer_sim),
+            )
+        else:
+            print(f"ℹ️ Optional missing: {kmer_sim}")
+
         # ------------------------------- 
         # 2-3) TherapeuticProtein → Protein TARGETS
         # -------------------------------
@@ -200,9 +300,13 @@ def build_full_graph(
         else:
             print(f"ℹ️ Optional missing: {pm}")
 
+        # 바뀐 그래프로 다음 PPR 요청에서 다시 projection
+        drop_ppr_projection(rel.driver)
+
     finally:
         rel.close()
 
+    _print_loss_summary()
     print("\n===============================================")
     print("🎉 GRAPH DB BUILD COMPLETED (OpenTargets Version)")
     print("===============================================\n")
@@ -216,9 +320,62 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--node-root", type=str, default=str(Config.RAW_DATA_ROOT))
     parser.add_argument("--relations-root", type=str, default=str(Config.RAW_DATA_ROOT))
+    parser.add_argument(
+        "--export-bulk-import",
+        action="store_true",
+        help="neo4j-admin database import 용 파일만 생성 (cold rebuild)",
+    )
+    parser.add_argument(
+        "--create-only",
+        action="store_true",
+        help="빈 DB 에 MERGE 없이 CREATE 로 적재",
+    )
+    parser.add_argument(
+        "--server-side",
+        action="store_true",
+        help="CSV 를 Neo4j import 디렉터리에 staging 후 LOAD CSV ... IN TRANSACTIONS 로 서버에서 적재",
+    )
+    parser.add_argument("--import-dir", type=str, default=None, help="Neo4j import 디렉터리 (기본: NEO4J_IMPORT_DIR)")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="이전 snapshot 과 비교해서 바뀐 노드 / 관계만 적재 (row_hash)",
+    )
+    parser.add_argument(
+        "--migrate-similarity",
+        action="store_true",
+        help="이전 형식 SIMILAR_TO 를 method / sim_score 형식으로 변환만 하고 종료 (marker 와 무관하게 다시 실행)",
+    )
+    parser.add_argument(
+        "--preflight",
+        choices=("warn", "fail", "off"),
+        default=PREFLIGHT_MODE,
+        help="적재 전 constraint 확인 + query plan 검사",
+    )
     args = parser.parse_args()
 
-    build_full_graph(
-        node_root=Path(args.node_root),
-        relations_root=Path(args.relations_root),
-    )
+    if args.migrate_similarity:
+        try:
+            migrate_similarity_edges(get_driver())
+        finally:
+            close_driver()
+    elif args.export_bulk_import:
+        from backend.graph.bulk_import import export_bulk_import
+        export_bulk_import(Path(args.node_root), Path(args.relations_root))
+    elif args.create_only:
+        from backend.graph.bulk_import import create_only_load
+        create_only_load(Path(args.node_root), Path(args.relations_root))
+    elif args.server_side:
+        from backend.graph.server_side_loader import NEO4J_IMPORT_DIR, server_side_load
+        server_side_load(
+            Path(args.node_root),
+            Path(args.relations_root),
+            import_dir=args.import_dir or NEO4J_IMPORT_DIR,
+        )
+    else:
+        build_full_graph(
+            node_root=Path(args.node_root),
+            relations_root=Path(args.relations_root),
+            incremental=args.incremental,
+            preflight=args.preflight,
+        )
@@ -0,0 +1,320 @@
+# backend/graph/bulk_import.py
+
+"""
+Cold rebuild paths (empty database)
+
+1) export_bulk_import()
+   raw CSV → neo4j-admin database import 용 header / data 파일
+
+       data/bulk_import/
+           nodes_Protein_header.csv, nodes_Protein.csv, ...
+           rels_protein_disease_header.csv, rels_protein_disease.csv, ...
+           import_command.txt
+
+   - 노드는 loader 의 _preprocess_row 를 그대로 사용 (Bolt 로딩과 같은 정제 규칙)
+   - 같은 key 는 MERGE + coalesce 와 같은 의미로 병합 (나중 값이 null 이 아니면 덮어씀)
+   - label 마다 별도 id space (Protein / TherapeuticProtein 은 같은 uniprot_id 를 공유하므로)
+   - 양 끝 노드가 없는 관계는 MATCH 기반 loader 와 같이 제외
+   - property type 은 값에서 추론 (int → long, float → double, date, list → string[])
+
+2) create_only_load()
+   같은 중복 제거 결과를 MERGE 없이 CREATE 로 빈 DB 에 batch 적재 (Bolt, neo4j-admin 불가 환경용)
+"""
+
+import csv
+import time
+import logging
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+from backend.config import Config
+from backend.graph.loaders import (
+    get_driver,
+    ProteinLoader,
+    DiseaseLoader,
+    TherapeuticProteinLoader,
+    TrialLoader,
+    PublicationLoader,
+)
+from backend.graph.loaders.utils import batched, execute_write_with_retry, read_csv_dicts
+from backend.graph.graph_search_client import drop_ppr_projection
+from backend.graph.relation_loader import RELATION_SPECS, RelationSpec
+
+logger = logging.getLogger("bulk_import")
+
+BULK_IMPORT_ROOT = Config.DATA_ROOT / "bulk_import"
+
+NODE_FILES = (
+    ("proteins.csv", ProteinLoader),
+    ("diseases.csv", DiseaseLoader),
+    ("therapeutic_proteins.csv", TherapeuticProteinLoader),
+    ("trials.csv", TrialLoader),
+    ("publications.csv", PublicationLoader),
+)
+
+ARRAY_DELIMITER = ";"
+
+
+# ---------------------------------------------------------
+# Collect + dedupe
+# ---------------------------------------------------------
+def _is_empty(value: Any) -> bool:
+    return value is None or value == [] or value == ""
+
+
+def collect_nodes(loader, path: Path) -> Dict[str, Dict[str, Any]]:
+    """key → 병합된 property dict (coalesce 의미: null 이 아닌 나중 값이 우선)"""
+    nodes: Dict[str, Dict[str, Any]] = {}
+    for raw in read_csv_dicts(str(path)):
+        row = loader._preprocess_row(raw)
+        key = row.get(loader.key)
+        if not key:
+            continue
+        merged = nodes.setdefault(key, {})
+        merged.update({k: v for k, v in row.items() if not _is_empty(v)})
+    return nodes
+
+
+def find_relation_file(spec: RelationSpec, roots: List[Path]) -> Path | None:
+    for name in spec.filenames:
+        for root in roots:
+            if (root / name).exists():
+                return root / name
+    return None
+
+
+def collect_relations(
+    spec: RelationSpec,
+    path: Path,
+    node_ids: Dict[str, set],
+) -> Tuple[Dict[tuple, Dict[str, Any]], int]:
+    """
+    (start, end, *identity) → property dict.
+    반환: (관계 dict, 끝점 노드가 없어서 제외된 행 수)
+    """
+    (s_label, s_col), (e_label, e_col) = spec.start, spec.end
+    rels: Dict[tuple, Dict[str, Any]] = {}
+    dangling = 0
+
+    for row in read_csv_dicts(str(path)):
+        s, e = (row.get(s_col) or "").strip(), (row.get(e_col) or "").strip()
+        if s not in node_ids.get(s_label, ()) or e not in node_ids.get(e_label, ()):
+            dangling += 1
+            continue
+
+        props = spec.row_properties(row)
+        ident = tuple(props.get(p) for p in spec.identity)
+        rels.setdefault((s, e) + ident, {}).update(props)
+
+    return rels, dangling
+
+
+# ---------------------------------------------------------
+# Type inference / formatting
+# ---------------------------------------------------------
+def _neo4j_type(value: Any) -> str:
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, int):
+        return "long"
+    if isinstance(value, float):
+        return "double"
+    if isinstance(value, date):
+        return "date"
+    if isinstance(value, list):
+        return "string[]"
+    return "string"
+
+
+def _format(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, list):
+        return ARRAY_DELIMITER.join(str(v) for v in value)
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+
+def infer_property_types(rows: Iterator[Dict[str, Any]], skip: Tuple[str, ...] = ()) -> Dict[str, str]:
+    """컬럼별 첫 non-null 값의 type (모두 null 이면 string)"""
+    types: Dict[str, str] = {}
+    for row in rows:
+        for k, v in row.items():
+            if k in skip or k in types and types[k] != "?":
+                continue
+            types[k] = "?" if _is_empty(v) else _neo4j_type(v)
+    return {k: ("string" if t == "?" else t) for k, t in types.items()}
+
+
+def _write_pair(out_dir: Path, stem: str, header: List[str], rows: Iterator[List[str]]) -> Tuple[Path, Path, int]:
+    header_path = out_dir / f"{stem}_header.csv"
+    data_path = out_dir / f"{stem}.csv"
+
+    with open(header_path, "w", newline="", encoding="utf-8") as f:
+        csv.writer(f).writerow(header)
+
+    n = 0
+    with open(data_path, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        for r in rows:
+            w.writerow(r)
+            n += 1
+
+    return header_path, data_path, n
+
+
+# ---------------------------------------------------------
+# Shared: collect everything once
+# ---------------------------------------------------------
+def collect_graph(node_root: Path, relations_root: Path, processed_root: Path):
+    """반환: (nodes {label: (loader, {key: props})}, relations [(spec, rels)])"""
+    driver = get_driver()  # loader 생성용 (연결은 실제 쿼리 시점에만 맺어짐)
+
+    nodes = {}
+    for filename, LoaderClass in NODE_FILES:
+        path = node_root / filename
+        if not path.exists():
+            print(f"ℹ️ Optional missing: {path}")
+            continue
+        loader = LoaderClass(driver)
+        nodes[loader.label] = (loader, collect_nodes(loader, path))
+        print(f"📦 {loader.label}: {len(nodes[loader.label][1])} unique nodes")
+
+    node_ids = {label: set(items) for label, (_, items) in nodes.items()}
+
+    relations = []
+    for spec in RELATION_SPECS:
+        path = find_relation_file(spec, [processed_root, relations_root])
+        if path is None:
+            print(f"ℹ️ Optional missing: {spec.filenames[0]}")
+            continue
+        rels, dangling = collect_relations(spec, path, node_ids)
+        relations.append((spec, rels))
+        print(f"🔗 {spec.name} ({spec.rel_type}): {len(rels)} unique, {dangling} without endpoints skipped")
+
+    return nodes, relations
+
+
+# ---------------------------------------------------------
+# 1) neo4j-admin export
+# ---------------------------------------------------------
+def export_bulk_import(
+    node_root: Path | None = None,
+    relations_root: Path | None = None,
+    out_dir: Path = BULK_IMPORT_ROOT,
+    database: str = "neo4j",
+) -> str:
+    node_root = Path(node_root or Config.RAW_DATA_ROOT)
+    relations_root = Path(relations_root or Config.RAW_DATA_ROOT)
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    print("\n===============================================")
+    print("📤 Exporting neo4j-admin bulk import files")
+    print("===============================================")
+
+    t0 = time.time()
+    nodes, relations = collect_graph(node_root, relations_root, Config.PROCESSED_DATA_ROOT)
+
+    args = []
+    for label, (loader, items) in nodes.items():
+        types = infer_property_types(items.values(), skip=(loader.key,))
+        props = sorted(types)
+        header = [f"{loader.key}:ID({label})"] + [f"{p}:{types[p]}" for p in props]
+        rows = ([key] + [_format(v.get(p)) for p in props] for key, v in items.items())
+        h, d, n = _write_pair(out_dir, f"nodes_{label}", header, rows)
+        args.append(f"--nodes={label}={h.name},{d.name}")
+        print(f"💾 nodes {label}: {n}")
+
+    for spec, rels in relations:
+        header = [f":START_ID({spec.start[0]})", f":END_ID({spec.end[0]})"]
+        header += [f"{prop}:{typ}" for _, prop, typ, _ in spec.properties]
+        rows = (
+            [k[0], k[1]] + [_format(props.get(prop)) for _, prop, _, _ in spec.properties]
+            for k, props in rels.items()
+        )
+        h, d, n = _write_pair(out_dir, f"rels_{spec.name}", header, rows)
+        args.append(f"--relationships={spec.rel_type}={h.name},{d.name}")
+        print(f"💾 rels {spec.name}: {n}")
+
+    command = (
+        f"cd {out_dir} && neo4j-admin database import full {database} "
+        f"--overwrite-destination --array-delimiter='{ARRAY_DELIMITER}' "
+        + " ".join(args)
+    )
+    (out_dir / "import_command.txt").write_text(command + "\n", encoding="utf-8")
+
+    print(f"\n🎉 Export done in {time.time() - t0:.1f}s → {out_dir}")
+    print("   (Neo4j 중지 후 실행, 이후 schema_generator 로 constraint / index 생성)")
+    print(f"   {command}\n")
+    return command
+
+
+# ---------------------------------------------------------
+# 2) CREATE-only fast path (empty DB)
+# ---------------------------------------------------------
+def create_only_load(
+    node_root: Path | None = None,
+    relations_root: Path | None = None,
+    batch_size: int = 10_000,
+    force: bool = False,
+):
+    """
+    빈 DB 전용: MERGE 대신 CREATE.
+    중복 제거는 로컬에서 끝났으므로 노드는 lookup 없이 생성, 관계는 key index 로 양 끝만 MATCH.
+    """
+    from backend.graph.schema_generator import Neo4jSchemaGenerator
+
+    node_root = Path(node_root or Config.RAW_DATA_ROOT)
+    relations_root = Path(relations_root or Config.RAW_DATA_ROOT)
+    driver = get_driver()
+
+    with driver.session() as s:
+        existing = s.run("MATCH (n) RETURN count(n) > 0 AS non_empty").single()["non_empty"]
+    if existing and not force:
+        raise RuntimeError("❌ CREATE-only load requires an empty database (use force=True to override)")
+
+    # 관계 MATCH 가 index 를 쓰도록 constraint 먼저
+    schema = Neo4jSchemaGenerator()
+    try:
+        schema.apply_schema()
+    finally:
+        schema.close()
+
+    t0 = time.time()
+    nodes, relations = collect_graph(node_root, relations_root, Config.PROCESSED_DATA_ROOT)
+
+    for label, (loader, items) in nodes.items():
+        cypher = f"UNWIND $rows AS row CREATE (n:{label}) SET n = row"
+        total = 0
+        for batch in batched(iter(items.values()), batch_size):
+            execute_write_with_retry(driver, lambda tx, b: tx.run(cypher, rows=b).consume(), batch, what=f"[CREATE] {label}")
+            total += len(batch)
+        print(f"✅ CREATE {label}: {total}")
+
+    node_keys = {label: loader.key for label, (loader, _) in nodes.items()}
+    for spec, rels in relations:
+        s_label, e_label = spec.start[0], spec.end[0]
+        cypher = f"""
+        UNWIND $rows AS row
+        MATCH (a:{s_label} {{{node_keys[s_label]}: row.s}})
+        MATCH (b:{e_label} {{{node_keys[e_label]}: row.e}})
+        CREATE (a)-[r:{spec.rel_type}]->(b)
+        SET r = row.props
+        """
+        rows = ({"s": k[0], "e": k[1], "props": p} for k, p in rels.items())
+        total = 0
+        for batch in batched(rows, batch_size):
+            execute_write_with_retry(driver, lambda tx, b: tx.run(cypher, rows=b).consume(), batch, what=f"[CREATE] {spec.name}")
+            total += len(batch)
+        print(f"✅ CREATE {spec.rel_type} ({spec.name}): {total}")
+
+    # 이전 그래프로 만든 PPR projection 이 catalog 에 남아 있으면 제거
+    drop_ppr_projection(driver)
+
+    print(f"\n🎉 CREATE-only load done in {time.time() - t0:.1f}s\n")
+
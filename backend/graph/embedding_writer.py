@@ -0,0 +1,95 @@
+# backend/graph/embedding_writer.py
+
+"""
+Batched, label-aware embedding property writer
+
+GDSClient / GDSClientCypher 공용.
+
+    - embedding 파일 (.npy store / legacy .jsonl) 을 한 행씩 stream → 전체를 메모리에 올리지 않음
+    - batch 마다 별도 execute_write 트랜잭션 (파라미터 크기 = batch_size × dim)
+    - MATCH (n:<Label> {uniprot_id: row.id}) → uniprot_id unique constraint index 사용
+    - 연결 끊김 / transient 에러는 backoff 후 같은 batch 재시도
+"""
+
+import os
+import json
+import time
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Sequence
+
+from neo4j import Driver
+
+from backend.graph.loaders.utils import batched, execute_write_with_retry
+from backend.pipeline.embedding_store import load_embedding_store, iter_embedding_rows
+
+logger = logging.getLogger("embedding_writer")
+
+EMBED_WRITE_BATCH = int(os.getenv("EMBED_WRITE_BATCH", "1000"))
+EMBED_WRITE_RETRIES = int(os.getenv("EMBED_WRITE_RETRIES", "5"))
+
+EMBEDDING_LABELS = ("Protein", "TherapeuticProtein")
+
+
+def iter_embedding_file(path: Path) -> Iterator[Dict]:
+    """{"id", "embedding"} 행을 하나씩 yield (.npy store 는 memmap, .jsonl 은 줄 단위)"""
+    path = Path(path)
+
+    if path.suffix == ".jsonl" and path.exists():
+        with path.open("r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                obj = json.loads(line)
+                if "id" in obj and "embedding" in obj:
+                    yield {"id": obj["id"], "embedding": obj["embedding"]}
+        return
+
+    ids, matrix = load_embedding_store(path)
+    yield from iter_embedding_rows(ids, matrix)
+
+
+def _label_query(label: str) -> str:
+    return f"""
+    UNWIND $rows AS row
+    MATCH (n:{label} {{uniprot_id: row.id}})
+    SET n.embedding = row.embedding
+    RETURN count(n) AS updated
+    """
+
+
+def write_embeddings(
+    driver: Driver,
+    rows: Iterable[Dict],
+    labels: Sequence[str] = EMBEDDING_LABELS,
+    batch_size: int = EMBED_WRITE_BATCH,
+    max_retries: int = EMBED_WRITE_RETRIES,
+    log_every: int = 20,
+) -> Dict[str, int]:
+    """
+    rows 를 batch 단위 트랜잭션으로 label 별 노드에 기록.
+    반환: {"rows": 처리한 행 수, "<Label>": 갱신된 노드 수, ...}
+    """
+    queries = {label: _label_query(label) for label in labels}
+    stats = {"rows": 0, **{label: 0 for label in labels}}
+
+    def _write(tx, query, batch):
+        return tx.run(query, rows=batch).single()["updated"]
+
+    t0 = time.time()
+    for n_batch, batch in enumerate(batched(rows, batch_size), start=1):
+        for label, query in queries.items():
+            stats[label] += execute_write_with_retry(
+                driver, _write, query, batch,
+                max_retries=max_retries,
+                what=f"[EmbedWriter] {label} batch {n_batch}",
+            )
+
+        stats["rows"] += len(batch)
+        if n_batch % log_every == 0:
+            rate = stats["rows"] / max(time.time() - t0, 1e-9)
+            logger.info(f"[EmbedWriter] {stats['rows']} rows written ({rate:.0f} rows/s)")
+
+    logger.info(f"[EmbedWriter] Done in {time.time() - t0:.1f}s: {stats}")
+    return stats
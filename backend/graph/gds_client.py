@@ -1,17 +1,28 @@
 # backend/graph/gds_client.py
 
 import json
+import time
 import logging
 from pathlib import Path
-from typing import List, Dict
+from typing import Dict, Iterable, List
 
 from neo4j import GraphDatabase
 from graphdatascience import GraphDataScience
 from backend.config import Config
+from backend.pipeline.embedding_store import (
+    EMBED_STORE,
+    embedding_fingerprint,
+)
+from backend.graph.embedding_writer import EMBED_WRITE_BATCH, iter_embedding_file, write_embeddings
+from backend.graph.projection_state import projection_fingerprint, save_projection_fingerprint
+from backend.graph.graph_search_client import drop_ppr_projection
+from backend.graph.relation_loader import tag_gds_similarity_edges
 
 logger = logging.getLogger("GDSClient")
 logging.basicConfig(level=logging.INFO)
 
+PROJECTION_NAME = "protein_similarity_graph"
+
 
 class GDSClient:
     """
@@ -61,33 +72,33 @@ class GDSClient:
     # ------------------------------------------------------------
     # Apply embeddings to Neo4j nodes
     # ------------------------------------------------------------
-    def apply_embeddings(self, rows: List[Dict]):
+    def apply_embeddings(self, rows: Iterable[Dict], batch_size: int = EMBED_WRITE_BATCH):
         logger.info("[GDS] Applying embeddings to Neo4j nodes...")
 
-        query = """
-        UNWIND $rows AS row
-        MATCH (n)
-        WHERE n.uniprot_id = row.id
-        SET n.embedding = row.embedding
-        """
-
-        with self.driver.session() as s:
-            s.run(query, rows=rows)
+        stats = write_embeddings(self.driver, rows, batch_size=batch_size)
 
-        logger.info("[GDS] Embeddings applied successfully")
+        logger.info(f"[GDS] Embeddings applied successfully: {stats}")
 
     # ------------------------------------------------------------
-    # Create graph projection
+    # Create graph projection (fingerprint 가 같으면 재사용)
     # ------------------------------------------------------------
-    def project_graph(self):
-        name = "protein_similarity_graph"
+    def project_graph(self, name: str = PROJECTION_NAME, fingerprint: str | None = None):
+        """
+        반환: (graph, reused)
+        fingerprint 가 주어지고 서버의 projection 이 같은 embedding 집합으로 만들어졌으면 그대로 사용.
+        """
+        exists = bool(self.gds.graph.exists(name)["exists"])
+
+        if exists and fingerprint is not None and projection_fingerprint(name) == fingerprint:
+            logger.info(f"[GDS] Reusing projection '{name}' (embedding fingerprint unchanged)")
+            return self.gds.graph.get(name), True
 
         # Drop existing projection
-        if self.gds.graph.exists(name):
+        if exists:
             logger.info("[GDS] Dropping existing graph projection")
             self.gds.graph.drop(name)
 
-        logger.info("[GDS] Creating graph projection 'protein_similarity_graph'")
+        logger.info(f"[GDS] Creating graph projection '{name}'")
 
         graph, result = self.gds.graph.project(
             name,
@@ -99,47 +110,107 @@ class GDSClient:
             {}  # no relationships
         )
 
+        save_projection_fingerprint(name, fingerprint)
         logger.info(f"[GDS] Projection created: {result}")
-        return graph
+        return graph, False
 
     # ------------------------------------------------------------
     # Run KNN → SIMILAR_TO relationships
     # ------------------------------------------------------------
-    def run_knn(self, graph, top_k=20, cutoff=0.70):
-        logger.info("[GDS] Running KNN similarity...")
-
-        result = self.gds.knn.write(
-            graph,
-            nodeProperties=["embedding"],
-            topK=top_k,
-            similarityCutoff=cutoff,
-            writeRelationshipType="SIMILAR_TO",
-            writeProperty="sim_score"
-        )
+    def run_knn(self, graph, top_k=20, cutoff=0.70, mode: str = "write"):
+        """
+        mode="write"  : gds.knn.write 로 바로 DB 에 기록
+        mode="mutate" : projection 안에만 SIMILAR_TO 추가 (다른 알고리즘이 이어서 사용 가능)
+                        → write_similarity() 로 한 번에 기록
+        """
+        logger.info(f"[GDS] Running KNN similarity ({mode})...")
+
+        if mode == "write":
+            result = self.gds.knn.write(
+                graph,
+                nodeProperties=["embedding"],
+                topK=top_k,
+                similarityCutoff=cutoff,
+                writeRelationshipType="SIMILAR_TO",
+                writeProperty="sim_score"
+            )
+        elif mode == "mutate":
+            # 재사용한 projection 에 이전 mutate 결과가 남아 있으면 제거
+            if "SIMILAR_TO" in graph.relationship_types():
+                self.gds.graph.relationships.drop(graph, "SIMILAR_TO")
+
+            result = self.gds.knn.mutate(
+                graph,
+                nodeProperties=["embedding"],
+                topK=top_k,
+                similarityCutoff=cutoff,
+                mutateRelationshipType="SIMILAR_TO",
+                mutateProperty="sim_score"
+            )
+        else:
+            raise ValueError(f"❌ Unknown KNN mode: {mode}")
 
         logger.info(f"[GDS] KNN completed: {result}")
 
+    def write_similarity(self, graph):
+        """mutate 된 SIMILAR_TO {sim_score} 를 DB 에 한 번에 기록"""
+        logger.info("[GDS] Writing mutated SIMILAR_TO relationships...")
+        result = self.gds.graph.relationship.write(graph, "SIMILAR_TO", "sim_score")
+        logger.info(f"[GDS] Relationships written: {result}")
+
     # ------------------------------------------------------------
     # MASTER PIPELINE
     # ------------------------------------------------------------
     def run_similarity_pipeline(
         self,
-        embeddings_jsonl: Path = Config.PROCESSED_DATA_ROOT / "protein_embeddings.jsonl",
+        embeddings_path: Path = EMBED_STORE,
         top_k: int = 20,
         cutoff: float = 0.70,
+        reuse_projection: bool = True,
+        knn_mode: str = "write",
     ):
         logger.info("\n===============================================")
         logger.info("🧬 GDS Similarity Pipeline Started")
         logger.info("===============================================\n")
 
-        rows = self.load_embeddings_jsonl(embeddings_jsonl)
-        self.apply_embeddings(rows)
+        # 단계별 시간 (LocalKNNClient.run_similarity_pipeline 결과와 비교용)
+        timings = {}
+        t_start = time.time()
 
-        graph = self.project_graph()
-        self.run_knn(graph, top_k=top_k, cutoff=cutoff)
+        fingerprint = embedding_fingerprint(Path(embeddings_path)) if reuse_projection else None
+        name = PROJECTION_NAME
+        reusable = (
+            fingerprint is not None
+            and projection_fingerprint(name) == fingerprint
+            and bool(self.gds.graph.exists(name)["exists"])
+        )
 
-        logger.info("\n🎉 GDS Similarity Pipeline Completed")
+        # projection 재사용 시 node property 도 이미 같은 embedding → 다시 쓰지 않음
+        if not reusable:
+            # 전체 rows 를 list 로 만들지 않고 파일에서 batch 단위로 stream
+            t0 = time.time()
+            self.apply_embeddings(iter_embedding_file(Path(embeddings_path)))
+            timings["apply_embeddings_s"] = time.time() - t0
+
+        t0 = time.time()
+        graph, reused = self.project_graph(name, fingerprint=fingerprint)
+        timings["project_s"] = time.time() - t0
+        timings["projection_reused"] = reused
+
+        t0 = time.time()
+        self.run_knn(graph, top_k=top_k, cutoff=cutoff, mode=knn_mode)
+        if knn_mode == "mutate":
+            self.write_similarity(graph)
+        # esm2 / kmer / knn edge 와 구분되도록 method 표시
+        tag_gds_similarity_edges(self.driver)
+        # 바뀐 SIMILAR_TO 로 다음 PPR 요청에서 다시 projection
+        drop_ppr_projection(self.driver)
+        timings["knn_s"] = time.time() - t0
+
+        timings["total_s"] = time.time() - t_start
 
+        logger.info("\n🎉 GDS Similarity Pipeline Completed")
+        return timings
 
 if __name__ == "__main__":
     GDSClient().run_similarity_pipeline()
@@ -1,16 +1,27 @@
 # backend/graph/gds_client_cypher.py
 
 import json
+import time
 import logging
 from pathlib import Path
-from typing import List, Dict
+from typing import Dict, Iterable, List
 
 from neo4j import GraphDatabase
 from backend.config import Config
+from backend.pipeline.embedding_store import (
+    EMBED_STORE,
+    embedding_fingerprint,
+)
+from backend.graph.embedding_writer import EMBED_WRITE_BATCH, iter_embedding_file, write_embeddings
+from backend.graph.projection_state import projection_fingerprint, save_projection_fingerprint
+from backend.graph.graph_search_client import drop_ppr_projection
+from backend.graph.relation_loader import tag_gds_similarity_edges
 
 logger = logging.getLogger("GDSClientCypher")
 logging.basicConfig(level=logging.INFO)
 
+PROJECTION_NAME = "protein_similarity_graph"
+
 
 class GDSClientCypher:
     """
@@ -57,24 +68,29 @@ class GDSClientCypher:
     # ------------------------------------------------------------
     # Apply embedding property to nodes
     # ------------------------------------------------------------
-    def apply_embeddings(self, rows: List[Dict]):
+    def apply_embeddings(self, rows: Iterable[Dict], batch_size: int = EMBED_WRITE_BATCH):
         logger.info("[GDS-CYPHER] Applying embeddings to nodes...")
 
-        query = """
-        UNWIND $rows AS row
-        MATCH (n {uniprot_id: row.id})
-        SET n.embedding = row.embedding
-        """
+        stats = write_embeddings(self.driver, rows, batch_size=batch_size)
 
-        with self.driver.session() as s:
-            s.run(query, rows=rows)
-
-        logger.info("[GDS-CYPHER] Embedding properties applied")
+        logger.info(f"[GDS-CYPHER] Embedding properties applied: {stats}")
 
     # ------------------------------------------------------------
-    # Create GDS projection via Cypher
+    # Create GDS projection via Cypher (fingerprint 가 같으면 재사용)
     # ------------------------------------------------------------
-    def create_projection(self, name="protein_similarity_graph"):
+    def projection_exists(self, name=PROJECTION_NAME) -> bool:
+        with self.driver.session() as s:
+            return bool(s.run("CALL gds.graph.exists($name) YIELD exists RETURN exists", name=name).single()["exists"])
+
+    def create_projection(self, name=PROJECTION_NAME, fingerprint: str | None = None) -> bool:
+        """
+        반환: projection 을 재사용했으면 True.
+        fingerprint 가 주어지고 서버의 projection 이 같은 embedding 집합으로 만들어졌으면 그대로 사용.
+        """
+        if fingerprint is not None and projection_fingerprint(name) == fingerprint and self.projection_exists(name):
+            logger.info(f"[GDS-CYPHER] Reusing projection '{name}' (embedding fingerprint unchanged)")
+            return True
+
         logger.info("[GDS-CYPHER] Creating GDS projection...")
 
         drop_query = """
@@ -100,26 +116,61 @@ class GDSClientCypher:
             result = s.run(create_query, name=name).data()
             logger.info(f"[GDS-CYPHER] Projection created: {result}")
 
+        save_projection_fingerprint(name, fingerprint)
+        return False
+
     # ------------------------------------------------------------
     # Run KNN to generate SIMILAR_TO
     # ------------------------------------------------------------
-    def run_knn(self, name="protein_similarity_graph", top_k=20, cutoff=0.70):
-        logger.info("[GDS-CYPHER] Running GDS KNN...")
-
-        query = """
-        CALL gds.knn.write(
-            $name,
-            {
-                nodeProperties: ['embedding'],
-                topK: $topK,
-                similarityCutoff: $cutoff,
-                writeRelationshipType: 'SIMILAR_TO',
-                writeProperty: 'sim_score'
-            }
-        )
+    def run_knn(self, name=PROJECTION_NAME, top_k=20, cutoff=0.70, mode: str = "write"):
+        """
+        mode="write"  : gds.knn.write 로 바로 DB 에 기록
+        mode="mutate" : projection 안에만 SIMILAR_TO 추가 → write_similarity() 로 한 번에 기록
         """
+        logger.info(f"[GDS-CYPHER] Running GDS KNN ({mode})...")
+
+        if mode == "write":
+            query = """
+            CALL gds.knn.write(
+                $name,
+                {
+                    nodeProperties: ['embedding'],
+                    topK: $topK,
+                    similarityCutoff: $cutoff,
+                    writeRelationshipType: 'SIMILAR_TO',
+                    writeProperty: 'sim_score'
+                }
+            )
+            """
+        elif mode == "mutate":
+            query = """
+            CALL gds.knn.mutate(
+                $name,
+                {
+                    nodeProperties: ['embedding'],
+                    topK: $topK,
+                    similarityCutoff: $cutoff,
+                    mutateRelationshipType: 'SIMILAR_TO',
+                    mutateProperty: 'sim_score'
+                }
+            )
+            """
+        else:
+            raise ValueError(f"❌ Unknown KNN mode: {mode}")
 
         with self.driver.session() as s:
+            if mode == "mutate":
+                # 재사용한 projection 에 이전 mutate 결과가 남아 있으면 제거
+                has_rel = s.run(
+                    """
+                    CALL gds.graph.list($name) YIELD relationshipTypes
+                    RETURN 'SIMILAR_TO' IN relationshipTypes AS has_rel
+                    """,
+                    name=name,
+                ).single()
+                if has_rel and has_rel["has_rel"]:
+                    s.run("CALL gds.graph.relationships.drop($name, 'SIMILAR_TO')", name=name).consume()
+
             result = s.run(
                 query,
                 name=name,
@@ -129,27 +180,72 @@ class GDSClientCypher:
 
         logger.info(f"[GDS-CYPHER] KNN result: {result}")
 
+    def write_similarity(self, name=PROJECTION_NAME):
+        """mutate 된 SIMILAR_TO {sim_score} 를 DB 에 한 번에 기록"""
+        logger.info("[GDS-CYPHER] Writing mutated SIMILAR_TO relationships...")
+
+        query = """
+        CALL gds.graph.relationship.write($name, 'SIMILAR_TO', 'sim_score')
+        YIELD relationshipsWritten
+        RETURN relationshipsWritten
+        """
+
+        with self.driver.session() as s:
+            result = s.run(query, name=name).data()
+
+        logger.info(f"[GDS-CYPHER] Relationships written: {result}")
+
     # ------------------------------------------------------------
     # Full pipeline
     # ------------------------------------------------------------
     def run_similarity_pipeline(
         self,
-        embeddings_jsonl: Path = Config.PROCESSED_DATA_ROOT / "protein_embeddings.jsonl",
+        embeddings_path: Path = EMBED_STORE,
         top_k: int = 20,
         cutoff: float = 0.70,
+        reuse_projection: bool = True,
+        knn_mode: str = "write",
     ):
         logger.info("\n====================")
         logger.info("🧬 Cypher GDS Pipeline Started")
         logger.info("====================\n")
 
-        rows = self.load_embeddings_jsonl(embeddings_jsonl)
-        self.apply_embeddings(rows)
+        # 단계별 시간 (LocalKNNClient.run_similarity_pipeline 결과와 비교용)
+        timings = {}
+        t_start = time.time()
 
-        self.create_projection()
-        self.run_knn(top_k=top_k, cutoff=cutoff)
+        fingerprint = embedding_fingerprint(Path(embeddings_path)) if reuse_projection else None
+        reusable = (
+            fingerprint is not None
+            and projection_fingerprint(PROJECTION_NAME) == fingerprint
+            and self.projection_exists(PROJECTION_NAME)
+        )
 
-        logger.info("\n🎉 Cypher GDS Pipeline Completed Successfully")
+        # projection 재사용 시 node property 도 이미 같은 embedding → 다시 쓰지 않음
+        if not reusable:
+            # 전체 rows 를 list 로 만들지 않고 파일에서 batch 단위로 stream
+            t0 = time.time()
+            self.apply_embeddings(iter_embedding_file(Path(embeddings_path)))
+            timings["apply_embeddings_s"] = time.time() - t0
+
+        t0 = time.time()
+        timings["projection_reused"] = self.create_projection(fingerprint=fingerprint)
+        timings["project_s"] = time.time() - t0
+
+        t0 = time.time()
+        self.run_knn(top_k=top_k, cutoff=cutoff, mode=knn_mode)
+        if knn_mode == "mutate":
+            self.write_similarity()
+        # esm2 / kmer / knn edge 와 구분되도록 method 표시
+        tag_gds_similarity_edges(self.driver)
+        # 바뀐 SIMILAR_TO 로 다음 PPR 요청에서 다시 projection
+        drop_ppr_projection(self.driver)
+        timings["knn_s"] = time.time() - t0
+
+        timings["total_s"] = time.time() - t_start
 
+        logger.info("\n🎉 Cypher GDS Pipeline Completed Successfully")
+        return timings
 
 if __name__ == "__main__":
     GDSClientCypher().run_similarity_pipeline()
@@ -1,9 +1,107 @@
 # backend/graph/graph_search_client.py
 
+import os
+import logging
 import statistics
 from neo4j import GraphDatabase
+from neo4j.exceptions import ClientError
 from backend.config import Config
 
+logger = logging.getLogger("GraphSearchClient")
+
+PPR_GRAPH_NAME = "rebio_ppr_graph"
+PPR_DAMPING = float(os.getenv("PPR_DAMPING", "0.85"))
+PPR_MAX_ITER = int(os.getenv("PPR_MAX_ITER", "20"))
+
+# ------------------------------------------------------------
+# Search Cypher (GraphSearchClient / query preflight 공용)
+# ------------------------------------------------------------
+SIMILAR_PROTEINS_CYPHER = """
+    MATCH (p:Protein {uniprot_id:$id})-[r:SIMILAR_TO]->(q)
+    RETURN q.uniprot_id AS uniprot_id,
+           q.name AS name,
+           q.gene AS gene,
+           r.sim_score AS score
+    ORDER BY score DESC
+    LIMIT $k
+    """
+
+PREDICT_DISEASES_CYPHER = """
+    // Direct associations
+    MATCH (p:Protein {uniprot_id:$id})-[r:ASSOCIATED_WITH]->(d)
+    RETURN d.disease_id AS disease_id,
+           d.name AS name,
+           r.score AS raw_score,
+           "direct" AS type
+
+    UNION
+
+    // Similarity-based associations
+    MATCH (p:Protein {uniprot_id:$id})-[:SIMILAR_TO]->(s)-[r:ASSOCIATED_WITH]->(d)
+    RETURN d.disease_id AS disease_id,
+           d.name AS name,
+           r.score AS raw_score,
+           "similarity" AS type
+    """
+
+RECOMMEND_THERAPEUTICS_CYPHER = """
+    // Direct TARGETS / BINDS_TO / MODULATES
+    MATCH (p:Protein {uniprot_id:$id})<- [r:TARGETS|BINDS_TO|MODULATES] - (tp:TherapeuticProtein)
+    RETURN tp.uniprot_id AS tp_id,
+           tp.name AS name,
+           r.evidence_score AS raw_score,
+           "direct" AS type
+
+    UNION
+
+    // Similarity-based
+    MATCH (p:Protein {uniprot_id:$id})-[:SIMILAR_TO]->(s)
+          <-[r:TARGETS|BINDS_TO|MODULATES]- (tp:TherapeuticProtein)
+    RETURN tp.uniprot_id AS tp_id,
+           tp.name AS name,
+           r.evidence_score AS raw_score,
+           "similarity" AS type
+    """
+
+# target 을 label 별 unique key 로 먼저 찾아서 bind (label 없는 t 는 AllNodesScan + cartesian product)
+EVIDENCE_PATHS_CYPHER = """
+    MATCH (s:Protein {uniprot_id:$id})
+    CALL {
+        WITH s
+        MATCH (t:Disease {disease_id:$target}) RETURN t
+        UNION
+        WITH s
+        MATCH (t:Protein {uniprot_id:$target}) RETURN t
+        UNION
+        WITH s
+        MATCH (t:TherapeuticProtein {uniprot_id:$target}) RETURN t
+    }
+    MATCH p = shortestPath((s)-[*..4]-(t))
+    RETURN p
+    LIMIT $limit
+    """
+
+# preflight EXPLAIN 용 (statement, 예시 파라미터) — PPR / GDS 호출은 projection 전용이라 제외
+SEARCH_CYPHERS = {
+    "similar_proteins": (SIMILAR_PROTEINS_CYPHER, {"id": "", "k": 1}),
+    "predict_diseases": (PREDICT_DISEASES_CYPHER, {"id": ""}),
+    "recommend_therapeutics": (RECOMMEND_THERAPEUTICS_CYPHER, {"id": ""}),
+    "evidence_paths": (EVIDENCE_PATHS_CYPHER, {"id": "", "target": "", "limit": 1}),
+}
+
+
+def drop_ppr_projection(driver):
+    """
+    그래프 rebuild / 적재 후 호출 → 다음 PPR 요청에서 현재 그래프로 다시 projection.
+    GDS 가 없거나 projection 이 없으면 아무것도 하지 않음.
+    """
+    try:
+        with driver.session() as s:
+            s.run("CALL gds.graph.drop($name, false)", name=PPR_GRAPH_NAME).consume()
+        logger.info(f"[GraphSearch] Dropped PPR projection '{PPR_GRAPH_NAME}'")
+    except ClientError as e:
+        logger.debug(f"[GraphSearch] PPR projection not dropped: {e}")
+
 
 class GraphSearchClient:
     """
@@ -14,6 +112,7 @@ class GraphSearchClient:
       ✔ predict_diseases()
       ✔ recommend_therapeutics()
       ✔ evidence_paths()
+      ✔ ranking="ppr" — 상주 GDS projection 위 Personalized PageRank 로 순위 계산
 
     변경사항:
       - Drug 제거
@@ -56,17 +155,8 @@ class GraphSearchClient:
     # 1) Similar Proteins
     # ==========================
     def similar_proteins(self, uniprot_id, top_k=20):
-        cypher = """
-        MATCH (p:Protein {uniprot_id:$id})-[:SIMILAR_TO]->(q)
-        RETURN q.uniprot_id AS uniprot_id,
-               q.name AS name,
-               q.gene AS gene,
-               q.sim_score AS score
-        ORDER BY score DESC
-        LIMIT $k
-        """
         with self.driver.session() as s:
-            rows = s.run(cypher, id=uniprot_id, k=top_k).data()
+            rows = s.run(SIMILAR_PROTEINS_CYPHER, id=uniprot_id, k=top_k).data()
 
         raw = [r["score"] for r in rows]
         zscores = self._zscore(raw)
@@ -79,26 +169,12 @@ class GraphSearchClient:
     # ==========================
     # 2) Disease Prediction
     # ==========================
-    def predict_diseases(self, uniprot_id, top_k=20):
-        cypher = """
-        // Direct associations
-        MATCH (p:Protein {uniprot_id:$id})-[:ASSOCIATED_WITH]->(d)
-        RETURN d.disease_id AS disease_id,
-               d.name AS name,
-               r.score AS raw_score,
-               "direct" AS type
-
-        UNION
+    def predict_diseases(self, uniprot_id, top_k=20, ranking="cypher"):
+        if ranking == "ppr":
+            return self._ppr_rank(uniprot_id, "Disease", "disease_id", "disease_id", top_k)
 
-        // Similarity-based associations
-        MATCH (p:Protein {uniprot_id:$id})-[:SIMILAR_TO]->(s)-[r:ASSOCIATED_WITH]->(d)
-        RETURN d.disease_id AS disease_id,
-               d.name AS name,
-               r.score AS raw_score,
-               "similarity" AS type
-        """
         with self.driver.session() as s:
-            rows = s.run(cypher, id=uniprot_id).data()
+            rows = s.run(PREDICT_DISEASES_CYPHER, id=uniprot_id).data()
 
         weighted = []
         for r in rows:
@@ -118,28 +194,12 @@ class GraphSearchClient:
     # ==========================
     # 3) Recommend Therapeutic Proteins
     # ==========================
-    def recommend_therapeutics(self, uniprot_id, top_k=20):
-        cypher = """
-        // Direct TARGETS / BINDS_TO / MODULATES
-        MATCH (p:Protein {uniprot_id:$id})<- [r:TARGETS|BINDS_TO|MODULATES] - (tp:TherapeuticProtein)
-        RETURN tp.uniprot_id AS tp_id,
-               tp.name AS name,
-               r.evidence_score AS raw_score,
-               "direct" AS type
-
-        UNION
-
-        // Similarity-based
-        MATCH (p:Protein {uniprot_id:$id})-[:SIMILAR_TO]->(s)
-              <-[r:TARGETS|BINDS_TO|MODULATES]- (tp:TherapeuticProtein)
-        RETURN tp.uniprot_id AS tp_id,
-               tp.name AS name,
-               r.evidence_score AS raw_score,
-               "similarity" AS type
-        """
+    def recommend_therapeutics(self, uniprot_id, top_k=20, ranking="cypher"):
+        if ranking == "ppr":
+            return self._ppr_rank(uniprot_id, "TherapeuticProtein", "uniprot_id", "tp_id", top_k)
 
         with self.driver.session() as s:
-            rows = s.run(cypher, id=uniprot_id).data()
+            rows = s.run(RECOMMEND_THERAPEUTICS_CYPHER, id=uniprot_id).data()
 
         weighted = []
         for r in rows:
@@ -160,19 +220,9 @@ class GraphSearchClient:
     # 4) Evidence Paths
     # ==========================
     def evidence_paths(self, uniprot_id, target_id, max_paths=5):
-        cypher = """
-        MATCH p = shortestPath(
-            (s:Protein {uniprot_id:$id})-[*..4]-(t)
-        )
-        WHERE t.disease_id = $target
-              OR t.uniprot_id = $target
-        RETURN p
-        LIMIT $limit
-        """
-
         with self.driver.session() as s:
             results = s.run(
-                cypher,
+                EVIDENCE_PATHS_CYPHER,
                 id=uniprot_id,
                 target=target_id,
                 limit=max_paths
@@ -218,3 +268,110 @@ class GraphSearchClient:
 
         paths.sort(key=lambda x: x["z_score"], reverse=True)
         return paths[:max_paths]
+
+    # ==========================
+    # 5) Personalized PageRank (persistent GDS projection)
+    # ==========================
+    def ensure_ppr_projection(self, refresh=False):
+        """
+        Protein / Disease / TherapeuticProtein + 가중치 관계를 in-memory projection 으로 한 번만 생성.
+        weight = WEIGHTS[관계 종류] × 관계 score (없으면 1.0), 방향 무시 (UNDIRECTED)
+        """
+        with self.driver.session() as s:
+            exists = s.run(
+                "CALL gds.graph.exists($name) YIELD exists RETURN exists",
+                name=PPR_GRAPH_NAME,
+            ).single()["exists"]
+
+            if exists and not refresh:
+                return
+
+            if exists:
+                s.run("CALL gds.graph.drop($name, false)", name=PPR_GRAPH_NAME).consume()
+
+            logger.info(f"[GraphSearch] Creating PPR projection '{PPR_GRAPH_NAME}'")
+            # 관계가 없는 Protein / TherapeuticProtein 도 projection 에 포함 (b = null → 고립 노드)
+            cypher = """
+            MATCH (a)
+            WHERE a:Protein OR a:TherapeuticProtein
+            OPTIONAL MATCH (a)-[r:ASSOCIATED_WITH|SIMILAR_TO|TARGETS|BINDS_TO|MODULATES]->(b)
+            WHERE b:Protein OR b:TherapeuticProtein OR b:Disease
+            WITH a, b,
+                 CASE type(r)
+                     WHEN 'ASSOCIATED_WITH' THEN $w_direct * coalesce(r.score, 1.0)
+                     WHEN 'SIMILAR_TO'      THEN $w_similarity * coalesce(r.sim_score, 1.0)
+                     ELSE $w_therapeutic * coalesce(r.evidence_score, 1.0)
+                 END AS weight
+            WITH gds.graph.project(
+                $name, a, b,
+                {
+                    sourceNodeLabels: labels(a),
+                    targetNodeLabels: CASE WHEN b IS NULL THEN NULL ELSE labels(b) END,
+                    relationshipProperties: CASE WHEN b IS NULL THEN NULL ELSE {weight: toFloat(weight)} END
+                },
+                {undirectedRelationshipTypes: ['*']}
+            ) AS g
+            RETURN g.nodeCount AS nodes, g.relationshipCount AS rels
+            """
+            result = s.run(
+                cypher,
+                name=PPR_GRAPH_NAME,
+                w_direct=self.WEIGHTS["direct"],
+                w_similarity=self.WEIGHTS["similarity"],
+                w_therapeutic=self.WEIGHTS["therapeutic"],
+            ).single()
+            logger.info(f"[GraphSearch] PPR projection ready: {dict(result) if result else {}}")
+
+    def _ppr_rank(self, uniprot_id, label, key, out_key, top_k):
+        """
+        Protein 하나를 source 로 한 PPR 한 번으로 다중 hop evidence 를 점수화.
+        반환 row 형태는 cypher ranking 과 동일 (type="ppr", weight=1.0).
+
+        source 가 DB 에 없으면 [] (MATCH 결과 없음).
+        GDS 가 없거나, projection 생성이 다른 요청과 겹치거나, source 가 projection 이후에 적재돼서
+        projection 에 없으면 ClientError → cypher ranking 으로 대체.
+        """
+        cypher = f"""
+        MATCH (src:Protein {{uniprot_id:$id}})
+        CALL gds.pageRank.stream($name, {{
+            sourceNodes: [src],
+            relationshipWeightProperty: 'weight',
+            dampingFactor: $damping,
+            maxIterations: $max_iter
+        }})
+        YIELD nodeId, score
+        WHERE score > 0
+        WITH gds.util.asNode(nodeId) AS n, score
+        WHERE n:{label}
+        RETURN n.{key} AS {out_key},
+               n.name AS name,
+               score AS raw_score,
+               "ppr" AS type
+        ORDER BY raw_score DESC
+        LIMIT $k
+        """
+        try:
+            self.ensure_ppr_projection()
+            with self.driver.session() as s:
+                rows = s.run(
+                    cypher,
+                    id=uniprot_id,
+                    name=PPR_GRAPH_NAME,
+                    damping=PPR_DAMPING,
+                    max_iter=PPR_MAX_ITER,
+                    k=top_k,
+                ).data()
+        except ClientError as e:
+            logger.warning(f"[GraphSearch] PPR failed for {uniprot_id} ({e.code}) → cypher ranking")
+            fallback = self.predict_diseases if label == "Disease" else self.recommend_therapeutics
+            return fallback(uniprot_id, top_k, ranking="cypher")
+
+        for r in rows:
+            r["weight"] = 1.0
+            r["final_score"] = r["raw_score"]
+
+        zscores = self._zscore([r["final_score"] for r in rows])
+        for i, r in enumerate(rows):
+            r["z_score"] = zscores[i]
+
+        return rows
@@ -0,0 +1,80 @@
+# backend/graph/load_snapshot.py
+
+"""
+Change-aware loading 용 로컬 snapshot
+
+    processed/load_snapshots/<name>.json   {row key: row_hash}
+
+row_hash 는 전처리된 row 의 내용 fingerprint. 노드 / 관계에도 row_hash property 로 같이 저장하고,
+다음 실행에서 CSV 를 이 snapshot 과 로컬로 비교해서 inserted / changed / deleted 만 Neo4j 로 보낸다.
+"""
+
+import json
+import hashlib
+import logging
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Iterable, Tuple
+
+from backend.config import Config
+
+logger = logging.getLogger("load_snapshot")
+
+SNAPSHOT_ROOT = Config.PROCESSED_DATA_ROOT / "load_snapshots"
+
+_KEY_SEP = "\x1f"
+
+
+def _default(value: Any):
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+
+def row_fingerprint(row: Dict[str, Any]) -> str:
+    """정렬된 JSON 의 blake2b (16 bytes) — 값이 같으면 컬럼 순서와 무관하게 같은 hash"""
+    payload = json.dumps(row, sort_keys=True, default=_default, ensure_ascii=False)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def snapshot_key(parts: Iterable[Any]) -> str:
+    return _KEY_SEP.join("" if p is None else str(p) for p in parts)
+
+
+def split_snapshot_key(key: str) -> Tuple[str, ...]:
+    return tuple(key.split(_KEY_SEP))
+
+
+class LoadSnapshot:
+    def __init__(self, name: str, root: Path = SNAPSHOT_ROOT):
+        self.name = name
+        self.path = Path(root) / f"{name}.json"
+
+    def load(self) -> Dict[str, str]:
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"[Snapshot] Ignoring unreadable snapshot {self.path}: {e}")
+            return {}
+
+    def save(self, hashes: Dict[str, str]):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(hashes, f)
+        tmp.replace(self.path)
+
+    def clear(self):
+        if self.path.exists():
+            self.path.unlink()
+
+
+def diff_snapshot(previous: Dict[str, str], current: Dict[str, str]):
+    """반환: (inserted keys, changed keys, deleted keys)"""
+    inserted = [k for k in current if k not in previous]
+    changed = [k for k, h in current.items() if k in previous and previous[k] != h]
+    deleted = [k for k in previous if k not in current]
+    return inserted, changed, deleted
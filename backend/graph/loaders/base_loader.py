@@ -1,51 +1,275 @@
 # backend/graph/loaders/base_loader.py
+import time
 from abc import ABC, abstractmethod
 from typing import Iterable, Dict, Any, List
 
 from neo4j import Driver
 
-from .utils import get_driver, batched, read_csv_dicts, read_jsonl_dicts, logger
+from .utils import (
+    get_driver,
+    batched,
+    execute_write_with_retry,
+    is_data_error,
+    read_csv_dicts,
+    read_jsonl_dicts,
+    logger,
+)
+from .parallel import parallel_write
+from .dead_letter import DeadLetterWriter
+from .stats import LOADER_ADAPTIVE_BATCH, AdaptiveBatchSizer, LoadStats, adaptive_batched, estimate_payload_bytes
+from backend.graph.load_snapshot import LoadSnapshot, diff_snapshot, row_fingerprint
 
 
 class BaseLoader(ABC):
     """
     공통 Loader 베이스:
       - CSV / JSONL 읽기
-      - batch 삽입
+      - batch 삽입 (batch 마다 트랜잭션, 실패 시 backoff 재시도)
+      - workers > 1 이면 partition_key 기준으로 나눠 병렬 session 으로 쓰기
+      - load_changes_from_csv: 이전 snapshot 과 비교해서 바뀐 row 만 쓰기 (row_hash)
+      - batch 크기는 latency / payload / 재시도에 따라 조정 (adaptive), load_* 는 LoadStats 반환
+      - 데이터 에러로 실패한 batch 는 반씩 나눠 다시 쓰고 (bisect), 끝까지 실패한 row 는 dead-letter 로
     """
 
-    def __init__(self, driver: Driver | None = None, batch_size: int = 500):
+    # 노드 label / unique key 컬럼 (전처리 후 이름)
+    #   - 병렬 모드: 같은 key 를 같은 worker 로 보내는 partition 기준
+    #   - bulk import / CREATE fast path: id space 와 중복 제거 기준
+    label: str | None = None
+    key: str | None = None
+
+    @property
+    def partition_key(self) -> str | None:
+        return self.key
+
+    def __init__(
+        self,
+        driver: Driver | None = None,
+        batch_size: int = 500,
+        workers: int = 1,
+        adaptive: bool = LOADER_ADAPTIVE_BATCH,
+    ):
         self.driver = driver or get_driver()
         self.batch_size = batch_size
+        self.workers = workers
+        self.adaptive = adaptive
+        self.track_row_hash = False
         self.log = logger.getChild(self.__class__.__name__)
 
     # ------------------------
     # 외부 API
     # ------------------------
-    def load_from_csv(self, path: str) -> None:
+    def load_from_csv(self, path: str) -> LoadStats:
         rows = read_csv_dicts(path)
-        self._load_from_iter(rows)
+        return self._load_from_iter(rows)
 
-    def load_from_jsonl(self, path: str) -> None:
+    def load_from_jsonl(self, path: str) -> LoadStats:
         rows = read_jsonl_dicts(path)
-        self._load_from_iter(rows)
+        return self._load_from_iter(rows)
+
+    def load_from_records(self, records: Iterable[Dict[str, Any]]) -> LoadStats:
+        return self._load_from_iter(records)
+
+    def load_changes_from_csv(self, path: str, snapshot: LoadSnapshot | None = None, verify: bool = True) -> Dict[str, int]:
+        """
+        CSV 를 이전 실행 snapshot 과 로컬로 비교해서 inserted / changed row 만 MERGE,
+        사라진 key 의 노드는 DETACH DELETE. 노드에는 row_hash property 를 같이 저장.
+
+        verify=True 면 DB 의 row_hash 노드 수가 snapshot 과 다를 때 (DB 초기화 등) snapshot 을 무시하고 전체 적재.
+        """
+        if not (self.label and self.key):
+            raise ValueError(f"❌ {self.__class__.__name__} has no label/key for change-aware loading")
+
+        snapshot = snapshot or LoadSnapshot(f"nodes_{self.label}")
+        previous = snapshot.load()
+
+        if previous and verify:
+            in_db = self._count_hashed_nodes()
+            if in_db != len(previous):
+                self.log.warning(f"Snapshot has {len(previous)} rows but DB has {in_db} hashed nodes → full load")
+                previous = {}
+
+        # 전처리 실패 row 도 _load_from_iter 와 같은 dead-letter 파일로
+        dead = DeadLetterWriter(self.__class__.__name__)
+
+        current: Dict[str, str] = {}
+        pending: Dict[str, Dict[str, Any]] = {}
+        for raw in read_csv_dicts(path):
+            row = self._safe_preprocess(raw, dead)
+            if row is None:
+                # key 를 알 수 있으면 이전 hash 유지 (삭제로 취급하지 않음) → 다음 실행에서 다시 시도
+                key = raw.get(self.key)
+                if key and key in previous:
+                    current[key] = previous[key]
+                continue
+            key = row.get(self.key)
+            if not key:
+                continue
+            h = row_fingerprint(row)
+            current[key] = h
+            if previous.get(key) != h:
+                pending[key] = raw
+            else:
+                pending.pop(key, None)
+
+        inserted, changed, deleted = diff_snapshot(previous, current)
+        unchanged = len(current) - len(inserted) - len(changed)
+
+        self.track_row_hash = True
+        try:
+            load_stats = self._load_from_iter(pending.values(), dead=dead)
+        finally:
+            self.track_row_hash = False
+
+        # dead-letter 로 빠진 row 는 snapshot 에서 제외 → 다음 실행에서 다시 시도
+        for key in load_stats.lost_keys:
+            current.pop(key, None)
+
+        if deleted:
+            cypher = f"UNWIND $keys AS k MATCH (n:{self.label} {{{self.key}: k}}) DETACH DELETE n"
+            for batch in batched(deleted, self.batch_size):
+                execute_write_with_retry(
+                    self.driver, lambda tx, b: tx.run(cypher, keys=b).consume(), batch,
+                    what=f"[{self.__class__.__name__}] delete",
+                )
+
+        snapshot.save(current)
 
-    def load_from_records(self, records: Iterable[Dict[str, Any]]) -> None:
-        self._load_from_iter(records)
+        stats = {
+            "inserted": len(inserted),
+            "changed": len(changed),
+            "deleted": len(deleted),
+            "unchanged": unchanged,
+            "lost": load_stats.lost_rows,
+            "dead_letter_path": load_stats.dead_letter_path,
+        }
+        self.log.info(f"Change-aware load done: {stats}")
+        return stats
+
+    def _count_hashed_nodes(self) -> int:
+        with self.driver.session() as s:
+            return s.run(
+                f"MATCH (n:{self.label}) WHERE n.row_hash IS NOT NULL RETURN count(n) AS c"
+            ).single()["c"]
 
     # ------------------------
     # 내부 공통 로직
     # ------------------------
-    def _load_from_iter(self, rows: Iterable[Dict[str, Any]]) -> None:
-        total = 0
-        with self.driver.session() as session:
-            for batch in batched(rows, self.batch_size):
-                batch = [self._preprocess_row(r) for r in batch]
-                cypher, params = self._prepare_cypher_and_params(batch)
-                self.log.info(f"Writing batch size={len(batch)}")
-                session.execute_write(lambda tx: tx.run(cypher, **params))
-                total += len(batch)
-        self.log.info(f"Done. Total rows inserted/merged: {total}")
+    def _load_from_iter(self, rows: Iterable[Dict[str, Any]], dead: DeadLetterWriter | None = None) -> LoadStats:
+        stats = LoadStats(self.__class__.__name__)
+        sizer = AdaptiveBatchSizer(self.batch_size, enabled=self.adaptive)
+        dead = dead or DeadLetterWriter(self.__class__.__name__)
+
+        prepared = (
+            row for row in (self._safe_preprocess(r, dead) for r in rows)
+            if row is not None
+        )
+
+        try:
+            if self.workers > 1:
+                parallel_write(
+                    self.driver,
+                    prepared,
+                    self._write_batch,
+                    workers=self.workers,
+                    batch_size=self.batch_size,
+                    partition_key=self.partition_key,
+                    name=self.__class__.__name__,
+                    sizer=sizer,
+                    stats=stats,
+                    on_batch_error=lambda batch, e: self._recover_batch(batch, e, stats, sizer, dead),
+                )
+            else:
+                for batch in adaptive_batched(prepared, sizer):
+                    self.log.info(f"Writing batch size={len(batch)}")
+                    self._write_or_bisect(batch, stats, sizer, dead)
+        finally:
+            dead.close()
+            stats.lost_rows = dead.count
+            stats.lost_keys = dead.keys
+            stats.dead_letter_path = str(dead.path) if dead.count else None
+
+        stats.finish()
+        self.log.info(f"Done. {stats}")
+        return stats
+
+    def _safe_preprocess(self, raw: Dict[str, Any], dead: DeadLetterWriter) -> Dict[str, Any] | None:
+        try:
+            return self._preprocess_row(raw)
+        except Exception as e:
+            self.log.warning(f"Preprocess failed ({e.__class__.__name__}: {e}) → dead-letter")
+            dead.write(raw, e, stage="preprocess")
+            return None
+
+    def _write_or_bisect(
+        self,
+        batch: List[Dict[str, Any]],
+        stats: LoadStats,
+        sizer: AdaptiveBatchSizer,
+        dead: DeadLetterWriter,
+    ) -> int:
+        """batch 쓰기. 데이터 에러면 bisect. 반환: 실제로 기록된 row 수"""
+        try:
+            self._write_tracked(batch, stats, sizer)
+            return len(batch)
+        except Exception as e:
+            return self._recover_batch(batch, e, stats, sizer, dead)
+
+    def _recover_batch(
+        self,
+        batch: List[Dict[str, Any]],
+        error: BaseException,
+        stats: LoadStats,
+        sizer: AdaptiveBatchSizer,
+        dead: DeadLetterWriter,
+    ) -> int:
+        """
+        데이터 에러 (type / argument / constraint) 로 실패한 batch 를 반씩 나눠 다시 쓰고,
+        한 행까지 좁혀도 실패하면 dead-letter.
+        그 밖의 에러 (재시도 후 남은 연결 / transient, syntax, 인증, 권한 등) 는 row 문제가 아니므로 그대로 raise.
+        """
+        if not is_data_error(error):
+            raise error
+
+        if len(batch) == 1:
+            row = batch[0]
+            self.log.warning(f"Row failed ({error.__class__.__name__}: {error}) → dead-letter")
+            dead.write(row, error, key=row.get(self.key) if self.key else None)
+            return 0
+
+        mid = len(batch) // 2
+        self.log.warning(f"Batch of {len(batch)} failed ({error.__class__.__name__}), bisecting")
+        return (
+            self._write_or_bisect(batch[:mid], stats, sizer, dead)
+            + self._write_or_bisect(batch[mid:], stats, sizer, dead)
+        )
+
+    def _write_tracked(self, batch: List[Dict[str, Any]], stats: LoadStats, sizer: AdaptiveBatchSizer):
+        """한 batch 쓰기 + latency / payload / 재시도 기록, 다음 batch 크기 조정"""
+        retries = []
+        t0 = time.time()
+        execute_write_with_retry(
+            self.driver, self._write_batch, batch,
+            what=f"[{self.__class__.__name__}] batch",
+            on_retry=retries.append,
+        )
+        latency = time.time() - t0
+        payload = estimate_payload_bytes(batch)
+
+        stats.record_batch(len(batch), latency, payload)
+        for _ in retries:
+            stats.record_retry()
+        sizer.observe(len(batch), latency, payload, retried=bool(retries))
+
+    def _write_batch(self, tx, batch: List[Dict[str, Any]]):
+        cypher, params = self._prepare_cypher_and_params(batch)
+        tx.run(cypher, **params).consume()
+
+        if self.track_row_hash:
+            hashes = [{"key": r[self.key], "row_hash": row_fingerprint(r)} for r in batch if r.get(self.key)]
+            tx.run(
+                f"UNWIND $rows AS row MATCH (n:{self.label} {{{self.key}: row.key}}) SET n.row_hash = row.row_hash",
+                rows=hashes,
+            ).consume()
 
     @abstractmethod
     def _prepare_cypher_and_params(self, batch: List[Dict[str, Any]]) -> tuple[str, Dict[str, Any]]:
@@ -0,0 +1,56 @@
+# backend/graph/loaders/dead_letter.py
+"""
+Dead-letter 파일
+
+batch 를 반씩 나눠 다시 써도 실패하는 row (bisect 로 한 행까지 좁힌 것) 를 JSONL 로 남기고
+적재는 계속 진행한다.
+
+    data/dead_letter/<LoaderName>_<YYYYmmdd-HHMMSS>.jsonl
+        {"loader": ..., "stage": "write" | "preprocess", "error": ..., "row": {...}}
+
+파일은 첫 실패 때 생성 (실패가 없으면 파일도 없음). worker thread 들이 같이 쓰므로 lock 사용.
+"""
+import json
+import time
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from backend.config import Config
+
+DEAD_LETTER_ROOT = Config.DATA_ROOT / "dead_letter"
+
+
+class DeadLetterWriter:
+    def __init__(self, name: str, root: Path = DEAD_LETTER_ROOT):
+        self.name = name
+        self.path = Path(root) / f"{name}_{time.strftime('%Y%m%d-%H%M%S')}.jsonl"
+        self.count = 0
+        self.keys: List[str] = []
+        self._f = None
+        self._lock = threading.Lock()
+
+    def write(self, row: Dict[str, Any], error: BaseException, stage: str = "write", key: Optional[str] = None):
+        record = {
+            "loader": self.name,
+            "stage": stage,
+            "error": f"{error.__class__.__name__}: {error}",
+            "row": row,
+        }
+        line = json.dumps(record, default=str, ensure_ascii=False)
+
+        with self._lock:
+            if self._f is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._f = open(self.path, "a", encoding="utf-8")
+            self._f.write(line + "\n")
+            self._f.flush()
+            self.count += 1
+            if key:
+                self.keys.append(key)
+
+    def close(self):
+        with self._lock:
+            if self._f is not None:
+                self._f.close()
+                self._f = None
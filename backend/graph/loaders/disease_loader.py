@@ -13,6 +13,9 @@ class DiseaseLoader(BaseLoader):
       - name
     """
 
+    label = "Disease"
+    key = "disease_id"
+
     def _preprocess_row(self, row: Dict[str, Any]) -> Dict[str, Any]:
         disease_id = (row.get("disease_id") or "").strip()
         if not disease_id:
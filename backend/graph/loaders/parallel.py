@@ -0,0 +1,134 @@
+# backend/graph/loaders/parallel.py
+"""
+Partitioned parallel writer
+
+rows 를 partition_key 의 hash 로 N 개 partition 에 나누고, partition 마다 worker thread 하나가
+자기 session 으로 batch 를 순서대로 기록한다.
+
+  - 같은 key (관계의 source 노드 등) 는 항상 같은 worker → 동시 트랜잭션이 같은 노드 lock 을 두고 경쟁하지 않음
+  - partition_key 가 없으면 round-robin
+  - worker 별 queue 크기를 제한해서 CSV 읽기가 쓰기보다 앞서 나가도 메모리가 늘지 않음
+  - batch 실패 (deadlock / 연결 끊김) 는 execute_write_with_retry 로 backoff 재시도
+  - sizer (AdaptiveBatchSizer) 가 있으면 batch 크기를 worker 들의 latency / 재시도로 조정, stats 에 telemetry 기록
+"""
+import queue
+import threading
+import time
+import zlib
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from neo4j import Driver
+
+from .stats import AdaptiveBatchSizer, LoadStats, estimate_payload_bytes
+from .utils import execute_write_with_retry, logger
+
+_DONE = object()
+
+
+def _partition(value: Any, workers: int) -> int:
+    # hash() 는 프로세스마다 달라지므로 crc32 로 고정
+    return zlib.crc32(str(value).encode("utf-8")) % workers
+
+
+def parallel_write(
+    driver: Driver,
+    rows: Iterable[Dict[str, Any]],
+    write_batch: Callable[[Any, List[Dict[str, Any]]], Any],
+    workers: int,
+    batch_size: int,
+    partition_key: Optional[str] = None,
+    max_retries: int = 5,
+    queue_depth: int = 4,
+    name: str = "ParallelWriter",
+    sizer: Optional[AdaptiveBatchSizer] = None,
+    stats: Optional[LoadStats] = None,
+    on_batch_error: Optional[Callable[[List[Dict[str, Any]], BaseException], int]] = None,
+) -> int:
+    """
+    write_batch(tx, batch) 를 worker 들이 병렬로 실행. 반환: 기록한 row 수.
+    하나라도 실패하면 나머지 worker 를 멈추고 첫 에러를 다시 raise.
+
+    on_batch_error(batch, e) 가 있으면 실패한 batch 를 worker 안에서 복구 (bisect / dead-letter) 하고
+    기록된 row 수를 받는다. 그것도 raise 하면 위와 같이 중단.
+    """
+    log = logger.getChild(name)
+    queues = [queue.Queue(maxsize=queue_depth) for _ in range(workers)]
+    errors: List[BaseException] = []
+    written = [0] * workers
+    stop = threading.Event()
+
+    def _worker(w: int):
+        n_batch = 0
+        while True:
+            batch = queues[w].get()
+            if batch is _DONE:
+                return
+            if stop.is_set():
+                continue  # 남은 batch 는 버리고 _DONE 까지 소비
+            n_batch += 1
+            retries = []
+            try:
+                t0 = time.time()
+                execute_write_with_retry(
+                    driver, write_batch, batch,
+                    max_retries=max_retries,
+                    what=f"[{name}] worker {w} batch {n_batch}",
+                    on_retry=retries.append,
+                )
+                latency = time.time() - t0
+                written[w] += len(batch)
+                if stats is not None or sizer is not None:
+                    payload = estimate_payload_bytes(batch)
+                    if stats is not None:
+                        stats.record_batch(len(batch), latency, payload)
+                        for _ in retries:
+                            stats.record_retry()
+                    if sizer is not None:
+                        sizer.observe(len(batch), latency, payload, retried=bool(retries))
+            except BaseException as e:
+                try:
+                    if on_batch_error is None or not isinstance(e, Exception):
+                        raise
+                    written[w] += on_batch_error(batch, e)
+                except BaseException as fatal:
+                    errors.append(fatal)
+                    stop.set()
+
+    threads = [threading.Thread(target=_worker, args=(w,), daemon=True) for w in range(workers)]
+    for t in threads:
+        t.start()
+
+    buffers: List[List[Dict[str, Any]]] = [[] for _ in range(workers)]
+    rr = 0
+    queued = 0
+    try:
+        for row in rows:
+            if stop.is_set():
+                break
+            if partition_key is not None:
+                w = _partition(row.get(partition_key), workers)
+            else:
+                w, rr = rr, (rr + 1) % workers
+            buffers[w].append(row)
+            if len(buffers[w]) >= (sizer.size if sizer is not None else batch_size):
+                queues[w].put(buffers[w])
+                buffers[w] = []
+                queued += 1
+                if queued % (workers * 10) == 0:
+                    log.info(f"{sum(written)} rows written ({workers} workers)")
+
+        for w in range(workers):
+            if buffers[w] and not stop.is_set():
+                queues[w].put(buffers[w])
+    finally:
+        for q in queues:
+            q.put(_DONE)
+        for t in threads:
+            t.join()
+
+    if errors:
+        raise errors[0]
+
+    total = sum(written)
+    log.info(f"Done. {total} rows written by {workers} workers")
+    return total
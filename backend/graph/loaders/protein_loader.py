@@ -17,6 +17,9 @@ class ProteinLoader(BaseLoader):
       - embedding_id
     """
 
+    label = "Protein"
+    key = "uniprot_id"
+
     def _preprocess_row(self, row: Dict[str, Any]) -> Dict[str, Any]:
         uniprot_id = (row.get("uniprot_id") or "").strip()
         if not uniprot_id:
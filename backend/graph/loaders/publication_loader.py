@@ -15,6 +15,9 @@ class PublicationLoader(BaseLoader):
       - source
     """
 
+    label = "Publication"
+    key = "pmid"
+
     def _preprocess_row(self, row: Dict[str, Any]) -> Dict[str, Any]:
         pmid = (row.get("pmid") or "").strip()
         if not pmid:
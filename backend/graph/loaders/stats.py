@@ -0,0 +1,166 @@
+# backend/graph/loaders/stats.py
+"""
+Loader telemetry + adaptive batch size
+
+LoadStats
+  - rows / batches / retries (transient 에러) / 총 시간 → rows/s
+  - batch latency percentile (p50 / p90 / p99), batch 크기, payload bytes
+
+AdaptiveBatchSizer
+  - batch 마다 (latency, payload bytes, retry 여부) 를 보고 다음 batch 크기 조정
+      retry 발생 / latency 또는 payload 초과  → 절반
+      latency, payload 모두 여유              → 1.5 배
+  - Disease 같이 작은 row 는 커지고, sequence 가 붙은 Protein row 는 작게 유지됨
+"""
+import os
+import time
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+LOADER_ADAPTIVE_BATCH = os.getenv("LOADER_ADAPTIVE_BATCH", "1") == "1"
+LOADER_TARGET_BATCH_SECONDS = float(os.getenv("LOADER_TARGET_BATCH_SECONDS", "1.0"))
+LOADER_MIN_BATCH_SIZE = int(os.getenv("LOADER_MIN_BATCH_SIZE", "50"))
+LOADER_MAX_BATCH_SIZE = int(os.getenv("LOADER_MAX_BATCH_SIZE", "20000"))
+LOADER_MAX_BATCH_BYTES = int(os.getenv("LOADER_MAX_BATCH_BYTES", str(8 * 1024 * 1024)))
+
+
+def estimate_payload_bytes(batch: List[Dict[str, Any]]) -> int:
+    """파라미터 크기 근사치 (직렬화 없이 값 길이 합)"""
+    total = 0
+    for row in batch:
+        for k, v in row.items():
+            total += len(k)
+            if isinstance(v, (list, tuple)):
+                total += sum(len(str(x)) for x in v)
+            elif v is not None:
+                total += len(str(v))
+    return total
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, max(0, round(q / 100 * (len(sorted_values) - 1))))
+    return sorted_values[idx]
+
+
+@dataclass
+class LoadStats:
+    name: str = "load"
+    rows: int = 0
+    batches: int = 0
+    retries: int = 0
+    payload_bytes: int = 0
+    elapsed_s: float = 0.0
+    batch_latencies: List[float] = field(default_factory=list)
+    batch_sizes: List[int] = field(default_factory=list)
+    # dead-letter 로 빠진 row (bisect 후에도 실패 / 전처리 실패)
+    lost_rows: int = 0
+    lost_keys: List[str] = field(default_factory=list)
+    dead_letter_path: Optional[str] = None
+
+    def __post_init__(self):
+        self._lock = threading.Lock()
+        self._t0 = time.time()
+
+    def record_batch(self, n_rows: int, latency: float, payload_bytes: int):
+        with self._lock:
+            self.rows += n_rows
+            self.batches += 1
+            self.payload_bytes += payload_bytes
+            self.batch_latencies.append(latency)
+            self.batch_sizes.append(n_rows)
+
+    def record_retry(self):
+        with self._lock:
+            self.retries += 1
+
+    def finish(self) -> "LoadStats":
+        self.elapsed_s = time.time() - self._t0
+        return self
+
+    @property
+    def rows_per_s(self) -> float:
+        return self.rows / max(self.elapsed_s, 1e-9)
+
+    def latency_percentiles(self) -> Dict[str, float]:
+        values = sorted(self.batch_latencies)
+        return {f"p{q}": _percentile(values, q) for q in (50, 90, 99)}
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "rows": self.rows,
+            "batches": self.batches,
+            "retries": self.retries,
+            "elapsed_s": round(self.elapsed_s, 3),
+            "rows_per_s": round(self.rows_per_s, 1),
+            "payload_mb": round(self.payload_bytes / 1024 / 1024, 2),
+            "batch_size_min": min(self.batch_sizes, default=0),
+            "batch_size_max": max(self.batch_sizes, default=0),
+            "lost_rows": self.lost_rows,
+            "dead_letter_path": self.dead_letter_path,
+            **{f"latency_{k}_s": round(v, 3) for k, v in self.latency_percentiles().items()},
+        }
+
+    def __str__(self) -> str:
+        lat = self.latency_percentiles()
+        text = (
+            f"{self.name}: {self.rows} rows in {self.elapsed_s:.1f}s ({self.rows_per_s:.0f} rows/s), "
+            f"{self.batches} batches, {self.retries} retries, "
+            f"latency p50/p90/p99 = {lat['p50']:.2f}/{lat['p90']:.2f}/{lat['p99']:.2f}s"
+        )
+        if self.lost_rows:
+            text += f", {self.lost_rows} rows lost → {self.dead_letter_path}"
+        return text
+
+
+class AdaptiveBatchSizer:
+    def __init__(
+        self,
+        initial: int,
+        min_size: int = LOADER_MIN_BATCH_SIZE,
+        max_size: int = LOADER_MAX_BATCH_SIZE,
+        target_latency_s: float = LOADER_TARGET_BATCH_SECONDS,
+        max_payload_bytes: int = LOADER_MAX_BATCH_BYTES,
+        enabled: bool = True,
+    ):
+        self.min_size = min(min_size, initial)
+        self.max_size = max(max_size, initial)
+        self.target_latency_s = target_latency_s
+        self.max_payload_bytes = max_payload_bytes
+        self.enabled = enabled
+        self._size = initial
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def observe(self, n_rows: int, latency: float, payload_bytes: int, retried: bool = False):
+        if not self.enabled:
+            return
+        if n_rows < self._size and not retried:
+            # 마지막 (잘린) batch / 크기 변경 전 batch 는 판단 근거로 쓰지 않음
+            return
+
+        with self._lock:
+            if retried or latency > 1.5 * self.target_latency_s or payload_bytes > self.max_payload_bytes:
+                new = self._size // 2
+            elif latency < 0.5 * self.target_latency_s and payload_bytes < self.max_payload_bytes // 2:
+                new = int(self._size * 1.5)
+            else:
+                return
+            self._size = max(self.min_size, min(self.max_size, new))
+
+
+def adaptive_batched(iterable: Iterable[Dict[str, Any]], sizer: AdaptiveBatchSizer) -> Iterator[List[Dict[str, Any]]]:
+    """batched() 와 같지만 batch 마다 sizer.size 를 다시 읽음"""
+    batch: List[Dict[str, Any]] = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) >= sizer.size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
@@ -14,6 +14,9 @@ class TherapeuticProteinLoader(BaseLoader):
       - sequence
     """
 
+    label = "TherapeuticProtein"
+    key = "uniprot_id"
+
     def _preprocess_row(self, row: Dict[str, Any]) -> Dict[str, Any]:
         uid = (row.get("uniprot_id") or "").strip()
         if not uid:
@@ -16,6 +16,9 @@ class TrialLoader(BaseLoader):
       - why_stopped
     """
 
+    label = "Trial"
+    key = "nct_id"
+
     def _preprocess_row(self, row: Dict[str, Any]) -> Dict[str, Any]:
         nct_id = (row.get("nct_id") or "").strip()
         if not nct_id:
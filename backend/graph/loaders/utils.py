@@ -2,12 +2,21 @@
 import os
 import csv
 import json
+import time
 import logging
 from dataclasses import dataclass
 from datetime import datetime, date
-from typing import Iterable, List, Dict, Any, Generator, Optional
+from typing import Callable, Iterable, List, Dict, Any, Generator, Optional
 
 from neo4j import GraphDatabase, Driver
+from neo4j.exceptions import (
+    ConstraintError,
+    CypherTypeError,
+    Neo4jError,
+    ServiceUnavailable,
+    SessionExpired,
+    TransientError,
+)
 from dotenv import load_dotenv, find_dotenv
 
 # -----------------------------
@@ -127,6 +136,58 @@ def batched(iterable: Iterable[Dict[str, Any]], batch_size: int) -> Generator[Li
         yield batch
 
 
+# -----------------------------
+# 재시도 쓰기 유틸
+# -----------------------------
+RETRYABLE_ERRORS = (ServiceUnavailable, SessionExpired, TransientError)
+
+# 특정 row 의 값 때문에 나는 에러 (bisect → dead-letter 대상)
+DATA_ERRORS = (CypherTypeError, ConstraintError)
+DATA_ERROR_CODES = frozenset({
+    "Neo.ClientError.Statement.TypeError",
+    "Neo.ClientError.Statement.ArgumentError",
+    "Neo.ClientError.Statement.ArithmeticError",
+})
+
+
+def is_data_error(error: BaseException) -> bool:
+    """
+    row 데이터 문제인지 판정.
+    syntax / 인증 / 권한 / 설정 에러는 어떤 row 로 나눠도 실패하므로 False (→ fail fast).
+    """
+    if isinstance(error, DATA_ERRORS):
+        return True
+    return isinstance(error, Neo4jError) and getattr(error, "code", None) in DATA_ERROR_CODES
+
+
+def execute_write_with_retry(
+    driver: Driver,
+    work,
+    *args,
+    max_retries: int = 5,
+    what: str = "batch",
+    on_retry: Optional[Callable[[Exception], None]] = None,
+    **kwargs,
+):
+    """
+    새 session 에서 session.execute_write(work, *args, **kwargs) 실행.
+    연결 끊김 / transient 에러 (deadlock 포함) 는 exponential backoff 후 재시도.
+    on_retry(e) 는 재시도 직전마다 호출 (telemetry 용).
+    """
+    for attempt in range(1, max_retries + 1):
+        try:
+            with driver.session() as session:
+                return session.execute_write(work, *args, **kwargs)
+        except RETRYABLE_ERRORS as e:
+            if attempt == max_retries:
+                raise
+            wait = min(2 ** attempt, 30)
+            if on_retry is not None:
+                on_retry(e)
+            logger.warning(f"{what} failed ({e.__class__.__name__}: {e}), retry {attempt}/{max_retries - 1} in {wait}s")
+            time.sleep(wait)
+
+
 # -----------------------------
 # CSV / JSONL 로더
 # -----------------------------
@@ -0,0 +1,188 @@
+# backend/graph/local_knn.py
+
+import time
+import logging
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+import numpy as np
+from neo4j import GraphDatabase
+
+from backend.config import Config
+from backend.graph.loaders.utils import batched, execute_write_with_retry
+from backend.graph.embedding_writer import write_embeddings
+from backend.graph.graph_search_client import drop_ppr_projection
+from backend.pipeline.embedding_store import EMBED_STORE, TP_EMBED_STORE, load_embedding_store
+from backend.pipeline.similarity_engine import SIM_MAX_MEMORY_MB, iter_topk, normalize_rows
+
+logger = logging.getLogger("LocalKNN")
+logging.basicConfig(level=logging.INFO)
+
+
+class LocalKNNClient:
+    """
+    GDS 플러그인 없이 SIMILAR_TO 를 만드는 drop-in 대체 (GDSClient.run_similarity_pipeline 과 같은 인자)
+
+    기능:
+      1) Protein (+ TherapeuticProtein) embedding store 를 memmap 으로 로드
+      2) similarity_engine.iter_topk 로 blocked/vectorized cosine KNN
+      3) SIMILAR_TO {method:'knn', sim_score} 를 label 별 batch 트랜잭션으로 기록
+      4) 단계별 시간 (load / knn / write) 을 반환 → GDS 경로와 비교
+    """
+
+    def __init__(self, batch_size: int = 5000):
+        self.uri = Config.NEO4J_URI
+        self.user = Config.NEO4J_USER
+        self.password = Config.NEO4J_PASSWORD
+        self.batch_size = batch_size
+
+        self.driver = GraphDatabase.driver(self.uri, auth=(self.user, self.password))
+        logger.info(f"[LocalKNN] Connected to Neo4j at {self.uri}")
+
+    def close(self):
+        self.driver.close()
+
+    # ------------------------------------------------------------
+    # Load embeddings (GDS projection 과 같은 두 label)
+    # ------------------------------------------------------------
+    def load_nodes(self, embeddings_path: Path, tp_embeddings_path: Path | None = TP_EMBED_STORE):
+        """반환: (labels, ids, matrix) — 행 i 는 (labels[i], ids[i]) 노드"""
+        ids, matrix = load_embedding_store(Path(embeddings_path))
+        labels = ["Protein"] * len(ids)
+
+        if tp_embeddings_path is not None and Path(tp_embeddings_path).exists():
+            tp_ids, tp_matrix = load_embedding_store(Path(tp_embeddings_path))
+            if tp_matrix.shape[1] == matrix.shape[1]:
+                labels += ["TherapeuticProtein"] * len(tp_ids)
+                ids = list(ids) + list(tp_ids)
+                matrix = np.vstack([matrix, tp_matrix])
+            else:
+                logger.warning("[LocalKNN] TherapeuticProtein embedding dim mismatch, skipped")
+
+        logger.info(f"[LocalKNN] Loaded {len(ids)} nodes (dim={matrix.shape[1]})")
+        return labels, list(ids), matrix
+
+    # ------------------------------------------------------------
+    # KNN → (src_label, src_id, tgt_label, tgt_id, score)
+    # ------------------------------------------------------------
+    def compute_knn(
+        self,
+        vectors: np.ndarray,
+        top_k: int,
+        cutoff: float,
+        n_jobs: int = 1,
+        max_memory_mb: int = SIM_MAX_MEMORY_MB,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """cutoff 이상인 top-k 이웃을 (src_idx, tgt_idx, score) 배열로 반환 (tuple list 보다 compact)"""
+        src, tgt, sc = [], [], []
+        blocks = iter_topk(
+            normalize_rows(vectors),
+            top_k=top_k,
+            max_memory_mb=max_memory_mb,
+            n_jobs=n_jobs,
+            normalized=True,
+        )
+        for q_idx, top_idx, top_scores in blocks:
+            keep = top_scores >= cutoff
+            src.append(np.broadcast_to(q_idx[:, None], top_idx.shape)[keep])
+            tgt.append(top_idx[keep])
+            sc.append(top_scores[keep])
+
+        if not src:
+            return np.empty(0, np.int64), np.empty(0, np.int64), np.empty(0, np.float32)
+        return np.concatenate(src), np.concatenate(tgt), np.concatenate(sc)
+
+    @staticmethod
+    def iter_edges(labels, ids, src, tgt, scores) -> Iterator[Tuple[str, str, str, str, float]]:
+        for i, j, score in zip(src, tgt, scores):
+            yield labels[i], ids[i], labels[j], ids[j], float(score)
+
+    # ------------------------------------------------------------
+    # Batched SIMILAR_TO writes (label 조합별 쿼리)
+    # ------------------------------------------------------------
+    def write_edges(self, edges: Iterator[Tuple[str, str, str, str, float]]) -> int:
+        """label 조합별 batch 를 각각 별도 트랜잭션으로 (transient 에러 / 연결 끊김은 batch 단위 재시도)"""
+        def _write(tx, query, rows):
+            tx.run(query, rows=rows).consume()
+
+        total = 0
+        for batch in batched(edges, self.batch_size):
+            groups: Dict[Tuple[str, str], List[Dict]] = {}
+            for src_label, src, tgt_label, tgt, score in batch:
+                groups.setdefault((src_label, tgt_label), []).append(
+                    {"src": src, "tgt": tgt, "score": score}
+                )
+
+            for (src_label, tgt_label), rows in groups.items():
+                query = f"""
+                UNWIND $rows AS row
+                MATCH (a:{src_label} {{uniprot_id: row.src}})
+                MATCH (b:{tgt_label} {{uniprot_id: row.tgt}})
+                MERGE (a)-[r:SIMILAR_TO {{method: 'knn'}}]->(b)
+                SET r.sim_score = row.score
+                """
+                execute_write_with_retry(
+                    self.driver, _write, query, rows,
+                    what=f"[LocalKNN] {src_label}→{tgt_label} batch",
+                )
+
+            total += len(batch)
+            logger.info(f"[LocalKNN] SIMILAR_TO written: {total}")
+        return total
+
+    # ------------------------------------------------------------
+    # MASTER PIPELINE (GDSClient.run_similarity_pipeline 과 같은 인자)
+    # ------------------------------------------------------------
+    def run_similarity_pipeline(
+        self,
+        embeddings_path: Path = EMBED_STORE,
+        top_k: int = 20,
+        cutoff: float = 0.70,
+        apply_embeddings: bool = False,
+        n_jobs: int = 1,
+    ) -> Dict[str, float]:
+        logger.info("\n===============================================")
+        logger.info("🧬 Local KNN Similarity Pipeline Started (no GDS)")
+        logger.info("===============================================\n")
+
+        timings: Dict[str, float] = {}
+        t_start = time.time()
+
+        t0 = time.time()
+        labels, ids, vectors = self.load_nodes(embeddings_path)
+        timings["load_s"] = time.time() - t0
+
+        if apply_embeddings:
+            # GDS 경로와 달리 KNN 에 node property 가 필요 없으므로 선택 사항
+            t0 = time.time()
+            for label in dict.fromkeys(labels):
+                rows = (
+                    {"id": pid, "embedding": vectors[i].tolist()}
+                    for i, pid in enumerate(ids)
+                    if labels[i] == label
+                )
+                write_embeddings(self.driver, rows, labels=(label,))
+            timings["apply_embeddings_s"] = time.time() - t0
+
+        # KNN 계산과 쓰기를 분리해서 측정
+        t0 = time.time()
+        src, tgt, scores = self.compute_knn(vectors, top_k=top_k, cutoff=cutoff, n_jobs=n_jobs)
+        timings["knn_s"] = time.time() - t0
+
+        t0 = time.time()
+        timings["edges"] = self.write_edges(self.iter_edges(labels, ids, src, tgt, scores))
+        timings["write_s"] = time.time() - t0
+        drop_ppr_projection(self.driver)
+
+        timings["total_s"] = time.time() - t_start
+
+        logger.info(
+            f"\n🎉 Local KNN Pipeline Completed: {int(timings['edges'])} edges | "
+            f"load {timings['load_s']:.1f}s, knn {timings['knn_s']:.1f}s, "
+            f"write {timings['write_s']:.1f}s, total {timings['total_s']:.1f}s"
+        )
+        return timings
+
+
+if __name__ == "__main__":
+    LocalKNNClient().run_similarity_pipeline()
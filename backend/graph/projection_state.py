@@ -0,0 +1,52 @@
+# backend/graph/projection_state.py
+
+"""
+GDS projection 재사용 상태 (로컬 JSON)
+
+    processed/gds_projection_state.json
+        {"<graph name>": {"fingerprint": "<embedding store sha256>", "projected_at": <unix time>}}
+
+projection 이 서버에 존재하고 fingerprint 가 같으면 drop / re-project 를 건너뛴다.
+"""
+
+import json
+import time
+import logging
+from pathlib import Path
+from typing import Dict
+
+from backend.config import Config
+
+logger = logging.getLogger("projection_state")
+
+PROJECTION_STATE = Config.PROCESSED_DATA_ROOT / "gds_projection_state.json"
+
+
+def load_projection_state(path: Path = PROJECTION_STATE) -> Dict:
+    if not Path(path).exists():
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"[ProjectionState] Ignoring unreadable state file {path}: {e}")
+        return {}
+
+
+def projection_fingerprint(name: str, path: Path = PROJECTION_STATE) -> str | None:
+    return load_projection_state(path).get(name, {}).get("fingerprint")
+
+
+def save_projection_fingerprint(name: str, fingerprint: str | None, path: Path = PROJECTION_STATE):
+    """fingerprint=None 이면 해당 projection 기록 삭제"""
+    state = load_projection_state(path)
+    if fingerprint is None:
+        state.pop(name, None)
+    else:
+        state[name] = {"fingerprint": fingerprint, "projected_at": time.time()}
+
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2)
+    tmp.replace(path)
@@ -0,0 +1,166 @@
+# backend/graph/query_preflight.py
+
+"""
+Query-plan preflight
+
+1) 필수 unique constraint (label → key) 확인, 없으면 Neo4jSchemaGenerator.apply_schema
+2) loader / RelationLoader / GraphSearchClient 의 모든 Cypher 를 EXPLAIN
+3) plan 에 NodeByLabelScan / AllNodesScan / CartesianProduct 가 있으면 warn 또는 fail
+
+    PREFLIGHT_MODE = warn (기본) | fail | off
+
+EXPLAIN 은 실행하지 않고 plan 만 받으므로 빈 DB 에서도 돌릴 수 있음.
+GDS 호출 (PPR / KNN projection) 은 전체 그래프를 읽는 것이 목적이라 대상에서 제외.
+"""
+
+import os
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Tuple
+
+from neo4j import Driver
+
+from backend.graph.loaders import (
+    ProteinLoader,
+    DiseaseLoader,
+    TherapeuticProteinLoader,
+    TrialLoader,
+    PublicationLoader,
+)
+from backend.graph.relation_loader import NODE_KEYS, RELATION_CYPHERS, RELATION_SPECS, RelationLoader
+from backend.graph.graph_search_client import SEARCH_CYPHERS
+
+logger = logging.getLogger("query_preflight")
+
+PREFLIGHT_MODE = os.getenv("PREFLIGHT_MODE", "warn")
+
+BAD_OPERATORS = ("NodeByLabelScan", "AllNodesScan", "CartesianProduct")
+
+NODE_LOADERS = (ProteinLoader, DiseaseLoader, TherapeuticProteinLoader, TrialLoader, PublicationLoader)
+
+
+class PreflightError(RuntimeError):
+    pass
+
+
+@dataclass
+class PlanCheck:
+    name: str
+    operators: List[str] = field(default_factory=list)
+    offending: List[str] = field(default_factory=list)
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and not self.offending
+
+
+# ---------------------------------------------------------
+# 1) Constraints
+# ---------------------------------------------------------
+def missing_constraints(driver: Driver) -> List[Tuple[str, str]]:
+    """NODE_KEYS 중 unique constraint 가 없는 (label, key)"""
+    with driver.session() as s:
+        rows = s.run("SHOW CONSTRAINTS YIELD type, labelsOrTypes, properties").data()
+
+    present = {
+        (r["labelsOrTypes"][0], r["properties"][0])
+        for r in rows
+        if ("UNIQUENESS" in r["type"] or "KEY" in r["type"])
+        and r["labelsOrTypes"] and r["properties"] and len(r["properties"]) == 1
+    }
+    return [(label, key) for label, key in NODE_KEYS.items() if (label, key) not in present]
+
+
+def ensure_constraints(driver: Driver) -> List[Tuple[str, str]]:
+    """없는 constraint 가 있으면 schema 적용 후 다시 확인. 반환: 여전히 없는 (label, key)"""
+    missing = missing_constraints(driver)
+    if not missing:
+        return []
+
+    logger.info(f"[Preflight] Missing constraints {missing} → applying schema")
+    from backend.graph.schema_generator import Neo4jSchemaGenerator
+
+    schema = Neo4jSchemaGenerator()
+    try:
+        schema.apply_schema()
+    finally:
+        schema.close()
+
+    return missing_constraints(driver)
+
+
+# ---------------------------------------------------------
+# 2) Statements
+# ---------------------------------------------------------
+def preflight_statements(driver: Driver) -> Iterable[Tuple[str, str, Dict[str, Any]]]:
+    """(이름, Cypher, EXPLAIN 용 파라미터)"""
+    for loader_cls in NODE_LOADERS:
+        cypher, params = loader_cls(driver)._prepare_cypher_and_params([])
+        yield f"loader:{loader_cls.label}", cypher, params
+
+    for name, cypher in RELATION_CYPHERS.items():
+        yield f"relation:{name}", cypher, {"rows": []}
+
+    for spec in RELATION_SPECS:
+        upsert, delete = RelationLoader._change_cypher(spec)
+        yield f"relation_changes:{spec.name}:upsert", upsert, {"rows": []}
+        yield f"relation_changes:{spec.name}:delete", delete, {"rows": []}
+
+    for name, (cypher, params) in SEARCH_CYPHERS.items():
+        yield f"search:{name}", cypher, params
+
+
+def _plan_operators(plan) -> List[str]:
+    """plan tree 의 operator 이름 (NodeByLabelScan@neo4j → NodeByLabelScan)"""
+    if plan is None:
+        return []
+    if isinstance(plan, dict):
+        op, children = plan.get("operatorType", ""), plan.get("children", [])
+    else:
+        op, children = getattr(plan, "operator_type", ""), getattr(plan, "children", [])
+
+    ops = [op.split("@")[0]]
+    for child in children:
+        ops.extend(_plan_operators(child))
+    return ops
+
+
+def explain(driver: Driver, name: str, cypher: str, params: Dict[str, Any]) -> PlanCheck:
+    check = PlanCheck(name)
+    try:
+        with driver.session() as s:
+            plan = s.run("EXPLAIN " + cypher, **params).consume().plan
+    except Exception as e:
+        check.error = f"{e.__class__.__name__}: {e}"
+        return check
+
+    check.operators = _plan_operators(plan)
+    check.offending = [op for op in check.operators if op in BAD_OPERATORS]
+    return check
+
+
+# ---------------------------------------------------------
+# 3) Preflight
+# ---------------------------------------------------------
+def run_preflight(driver: Driver, mode: str = PREFLIGHT_MODE) -> List[PlanCheck]:
+    if mode == "off":
+        return []
+
+    problems = [f"missing unique constraint :{label}({key})" for label, key in ensure_constraints(driver)]
+
+    checks = [explain(driver, *stmt) for stmt in preflight_statements(driver)]
+    for c in checks:
+        if c.error:
+            problems.append(f"{c.name}: EXPLAIN failed ({c.error})")
+        elif c.offending:
+            problems.append(f"{c.name}: {', '.join(sorted(set(c.offending)))}")
+
+    logger.info(f"[Preflight] {len(checks)} statements checked, {len(problems)} problems")
+    for p in problems:
+        logger.warning(f"[Preflight] ⚠️ {p}")
+
+    if problems and mode == "fail":
+        raise PreflightError("❌ Query-plan preflight failed:\n  " + "\n  ".join(problems))
+
+    return checks
@@ -1,24 +1,300 @@
 # backend/graph/relation_loader.py
 
+import os
 import csv
+import time
 import logging
+from dataclasses import dataclass, field
 from pathlib import Path
-from neo4j import GraphDatabase
+from typing import Any, Dict, Iterable, Iterator, Tuple
+from neo4j import Driver, GraphDatabase
 
 from backend.config import Config
+from backend.graph.loaders import (
+    ProteinLoader,
+    DiseaseLoader,
+    TherapeuticProteinLoader,
+    TrialLoader,
+    PublicationLoader,
+)
+from backend.graph.loaders.utils import batched, execute_write_with_retry
+from backend.graph.loaders.parallel import parallel_write
+from backend.graph.loaders.dead_letter import DeadLetterWriter
+from backend.graph.graph_search_client import drop_ppr_projection
+from backend.graph.load_snapshot import (
+    LoadSnapshot,
+    diff_snapshot,
+    row_fingerprint,
+    snapshot_key,
+    split_snapshot_key,
+)
 
 logger = logging.getLogger("RelationLoader")
 logging.basicConfig(level=logging.INFO)
 
+RELATION_BATCH_SIZE = int(os.getenv("RELATION_BATCH_SIZE", "5000"))
+GRAPH_LOAD_WORKERS = int(os.getenv("GRAPH_LOAD_WORKERS", "1"))
 
-def read_csv_dicts(path: str):
-    """CSV 파일을 dict 리스트로 로드"""
-    rows = []
+
+def read_csv_dicts(path: str) -> Iterator[Dict]:
+    """CSV 파일을 한 행씩 dict 로 stream (전체를 메모리에 올리지 않음)"""
     with open(path, "r", encoding="utf-8") as f:
         reader = csv.DictReader(f)
         for r in reader:
-            rows.append(r)
-    return rows
+            yield r
+
+
+# --------------------------------------------------------------
+# Relation CSV specs (bulk import export / CREATE fast path 공용)
+# --------------------------------------------------------------
+@dataclass(frozen=True)
+class RelationSpec:
+    """
+    CSV 한 종류 → (start)-[rel_type]->(end)
+
+    start / end     : (node label, CSV 컬럼)  — 노드는 label 의 unique key 로 매칭
+    properties      : (CSV 컬럼, 관계 property, neo4j-admin type, 기본값)
+    identity        : start/end 외에 관계를 구분하는 property (MERGE pattern 에 들어가는 것)
+    filenames       : 찾을 CSV 파일 이름 (processed → relations root 순)
+    """
+    name: str
+    rel_type: str
+    start: Tuple[str, str]
+    end: Tuple[str, str]
+    filenames: Tuple[str, ...]
+    properties: Tuple[Tuple[str, str, str, str | None], ...] = field(default_factory=tuple)
+    identity: Tuple[str, ...] = field(default_factory=tuple)
+
+    def row_properties(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """CSV row → 관계 property (기본값 적용, float 변환 실패 / 빈 값은 제외)"""
+        props = {}
+        for col, prop, typ, default in self.properties:
+            value = (row.get(col) or "").strip() or default
+            if value is None:
+                continue
+            if typ == "float":
+                try:
+                    value = float(value)
+                except ValueError:
+                    continue
+            props[prop] = value
+        return props
+
+
+# 노드 label → unique key property (관계 양 끝 MATCH 용)
+NODE_KEYS = {
+    loader.label: loader.key
+    for loader in (ProteinLoader, DiseaseLoader, TherapeuticProteinLoader, TrialLoader, PublicationLoader)
+}
+
+
+RELATION_SPECS = (
+    RelationSpec(
+        "protein_disease", "ASSOCIATED_WITH",
+        ("Protein", "uniprot_id"), ("Disease", "disease_id"),
+        ("disease_associations.csv", "protein_disease_relations.csv"),
+        (
+            ("score", "score", "float", None),
+            ("source", "source", "string", "OpenTargets"),
+            ("evidence_type", "evidence_type", "string", "OpenTargets"),
+            ("active", "active", "string", "true"),
+        ),
+    ),
+    RelationSpec(
+        "protein_similarity", "SIMILAR_TO",
+        ("Protein", "source_uniprot"), ("Protein", "target_uniprot"),
+        ("protein_similarity.csv",),
+        (("similarity", "sim_score", "float", None), ("method", "method", "string", "esm2")),
+        identity=("method",),
+    ),
+    RelationSpec(
+        "protein_similarity_kmer", "SIMILAR_TO",
+        ("Protein", "src_uniprot_id"), ("Protein", "tgt_uniprot_id"),
+        ("protein_similarity_kmer.csv",),
+        (("sim_score", "sim_score", "float", None), ("method", "method", "string", "kmer")),
+        identity=("method",),
+    ),
+    RelationSpec(
+        "tp_targets", "TARGETS",
+        ("TherapeuticProtein", "tp_uniprot"), ("Protein", "protein_uniprot"),
+        ("tp_targets.csv",),
+    ),
+    RelationSpec(
+        "trial_protein", "INVESTIGATES",
+        ("Trial", "trial_id"), ("Protein", "uniprot_id"),
+        ("trial_protein_relations.csv",),
+    ),
+    RelationSpec(
+        "trial_therapeutic", "USES",
+        ("Trial", "nct_id"), ("TherapeuticProtein", "tp_uniprot"),
+        ("trial_therapeutic_relations.csv",),
+    ),
+    RelationSpec(
+        "publication_mentions", "MENTIONS",
+        ("Publication", "pmid"), ("Protein", "uniprot_id"),
+        ("publication_mentions.csv",),
+    ),
+)
+
+
+# --------------------------------------------------------------
+# Relation Cypher (RelationLoader / query preflight 공용)
+# --------------------------------------------------------------
+PROTEIN_DISEASE_CYPHER = """
+    UNWIND $rows AS row
+    MATCH (p:Protein {uniprot_id: row.uniprot_id})
+    MATCH (d:Disease {disease_id: row.disease_id})
+    MERGE (p)-[r:ASSOCIATED_WITH]->(d)
+    SET r.score         = toFloat(row.score),
+        r.source        = coalesce(row.source, "OpenTargets"),
+        r.evidence_type = coalesce(row.evidence_type, "OpenTargets"),
+        r.active        = coalesce(row.active, "true")
+    """
+
+PROTEIN_SIMILARITY_CYPHER = """
+    UNWIND $rows AS row
+    MATCH (a:Protein {uniprot_id: row.source_uniprot})
+    MATCH (b:Protein {uniprot_id: row.target_uniprot})
+    MERGE (a)-[r:SIMILAR_TO {method: 'esm2'}]->(b)
+    SET r.sim_score = toFloat(row.similarity)
+    """
+
+PROTEIN_KMER_SIMILARITY_CYPHER = """
+    UNWIND $rows AS row
+    MATCH (a:Protein {uniprot_id: row.src_uniprot_id})
+    MATCH (b:Protein {uniprot_id: row.tgt_uniprot_id})
+    MERGE (a)-[r:SIMILAR_TO {method: row.method}]->(b)
+    SET r.sim_score = toFloat(row.sim_score)
+    """
+
+TP_TARGETS_CYPHER = """
+    UNWIND $rows AS row
+    MATCH (tp:TherapeuticProtein {uniprot_id: row.tp_uniprot})
+    MATCH (p:Protein {uniprot_id: row.protein_uniprot})
+    MERGE (tp)-[:TARGETS]->(p)
+    """
+
+TRIAL_PROTEIN_CYPHER = """
+    UNWIND $rows AS row
+    MATCH (t:Trial {nct_id: row.trial_id})
+    MATCH (p:Protein {uniprot_id: row.uniprot_id})
+    MERGE (t)-[:INVESTIGATES]->(p)
+    """
+
+TRIAL_THERAPEUTIC_CYPHER = """
+    UNWIND $rows AS row
+    MATCH (t:Trial {nct_id: row.nct_id})
+    MATCH (tp:TherapeuticProtein {uniprot_id: row.tp_uniprot})
+    MERGE (t)-[:USES]->(tp)
+    """
+
+PUBLICATION_MENTIONS_CYPHER = """
+    UNWIND $rows AS row
+    MATCH (pb:Publication {pmid: row.pmid})
+    MATCH (p:Protein {uniprot_id: row.uniprot_id})
+    MERGE (pb)-[:MENTIONS]->(p)
+    """
+
+SIMILARITY_DELTA_ADD_CYPHER = """
+    UNWIND $rows AS row
+    MATCH (a:Protein {uniprot_id: row.source_uniprot})
+    MATCH (b:Protein {uniprot_id: row.target_uniprot})
+    MERGE (a)-[r:SIMILAR_TO {method: 'esm2'}]->(b)
+    SET r.sim_score = toFloat(row.similarity)
+    """
+
+SIMILARITY_DELTA_REMOVE_CYPHER = """
+    UNWIND $rows AS row
+    MATCH (a:Protein {uniprot_id: row.source_uniprot})-[r:SIMILAR_TO {method: 'esm2'}]->(b:Protein {uniprot_id: row.target_uniprot})
+    DELETE r
+    """
+
+# GDS KNN (gds_client / gds_client_cypher) 가 쓴 SIMILAR_TO 의 method
+GDS_SIMILARITY_METHOD = "gds_knn"
+
+# 이전 형식 SIMILAR_TO 정리 (한 번만, batch 단위로 더 이상 바뀌는 게 없을 때까지)
+#   - r.similarity 에 점수 (이전 ESM2 CSV 적재) → method='esm2', r.sim_score
+#   - method / similarity 둘 다 없음 (이전 GDS KNN write) → method='gds_knn'
+SIMILARITY_MIGRATION_CYPHER = """
+    MATCH (:Protein)-[r:SIMILAR_TO]->(:Protein)
+    WHERE r.method IS NULL OR r.similarity IS NOT NULL
+    WITH r LIMIT $limit
+    SET r.method = coalesce(r.method, CASE WHEN r.similarity IS NOT NULL THEN 'esm2' ELSE $gds_method END),
+        r.sim_score = coalesce(r.sim_score, r.similarity)
+    REMOVE r.similarity
+    RETURN count(r) AS c
+    """
+
+# GDS KNN write 직후: 방금 쓴 (method 없는) SIMILAR_TO 에 method 표시
+GDS_SIMILARITY_TAG_CYPHER = """
+    MATCH ()-[r:SIMILAR_TO]->()
+    WHERE r.method IS NULL AND r.similarity IS NULL
+    WITH r LIMIT $limit
+    SET r.method = $gds_method
+    RETURN count(r) AS c
+    """
+
+MIGRATION_MARKER_CYPHER = "MATCH (m:Migration {name: $name}) RETURN count(m) AS c"
+SIMILARITY_MIGRATION_NAME = "similar_to_method"
+
+
+def _run_until_done(driver, cypher: str, limit: int) -> int:
+    total = 0
+    with driver.session() as s:
+        while True:
+            n = s.execute_write(
+                lambda tx: tx.run(cypher, limit=limit, gds_method=GDS_SIMILARITY_METHOD).single()["c"]
+            )
+            total += n
+            if n < limit:
+                break
+    return total
+
+
+def migrate_similarity_edges(driver, limit: int = 10000) -> int:
+    """
+    method / sim_score 가 없는 이전 SIMILAR_TO 를 현재 형식으로 바꾸고 Migration marker 를 남긴다.
+    모든 SIMILAR_TO 를 훑으므로 적재마다 부르지 말 것 → ensure_similarity_migration / builder --migrate-similarity
+    """
+    total = _run_until_done(driver, SIMILARITY_MIGRATION_CYPHER, limit)
+    with driver.session() as s:
+        s.execute_write(
+            lambda tx: tx.run(
+                "MERGE (m:Migration {name: $name}) SET m.applied_at = datetime()",
+                name=SIMILARITY_MIGRATION_NAME,
+            ).consume()
+        )
+    logger.info(f"[RelationLoader] Migrated {total} SIMILAR_TO edges → method / sim_score")
+    return total
+
+
+def ensure_similarity_migration(driver) -> int:
+    """Migration marker 가 없을 때만 migrate_similarity_edges (marker 조회 한 번)"""
+    with driver.session() as s:
+        done = s.run(MIGRATION_MARKER_CYPHER, name=SIMILARITY_MIGRATION_NAME).single()["c"]
+    if done:
+        return 0
+    return migrate_similarity_edges(driver)
+
+
+def tag_gds_similarity_edges(driver, limit: int = 10000) -> int:
+    """GDS KNN 이 쓴 SIMILAR_TO 에 method='gds_knn' (esm2 full load / delta remove 대상에서 빠지도록)"""
+    total = _run_until_done(driver, GDS_SIMILARITY_TAG_CYPHER, limit)
+    logger.info(f"[RelationLoader] Tagged {total} GDS SIMILAR_TO edges → method='{GDS_SIMILARITY_METHOD}'")
+    return total
+
+
+RELATION_CYPHERS = {
+    "protein_disease": PROTEIN_DISEASE_CYPHER,
+    "protein_similarity": PROTEIN_SIMILARITY_CYPHER,
+    "protein_similarity_kmer": PROTEIN_KMER_SIMILARITY_CYPHER,
+    "protein_similarity_delta_add": SIMILARITY_DELTA_ADD_CYPHER,
+    "protein_similarity_delta_remove": SIMILARITY_DELTA_REMOVE_CYPHER,
+    "tp_targets": TP_TARGETS_CYPHER,
+    "trial_protein": TRIAL_PROTEIN_CYPHER,
+    "trial_therapeutic": TRIAL_THERAPEUTIC_CYPHER,
+    "publication_mentions": PUBLICATION_MENTIONS_CYPHER,
+}
 
 
 class RelationLoader:
@@ -28,11 +304,20 @@ class RelationLoader:
     Other relations are optional.
     """
 
-    def __init__(self):
-        self.driver = GraphDatabase.driver(
+    def __init__(
+        self,
+        batch_size: int = RELATION_BATCH_SIZE,
+        max_retries: int = 5,
+        workers: int = GRAPH_LOAD_WORKERS,
+        driver: Driver | None = None,
+    ):
+        self.driver = driver or GraphDatabase.driver(
             Config.NEO4J_URI,
             auth=(Config.NEO4J_USER, Config.NEO4J_PASSWORD)
         )
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.workers = workers
         self.log = logger
 
     def close(self):
@@ -41,9 +326,51 @@ class RelationLoader:
     # --------------------------------------------------------------
     # Helper generic loader
     # --------------------------------------------------------------
-    def _load_generic(self, cypher: str, rows: list[dict]):
-        with self.driver.session() as s:
-            s.run(cypher, rows=rows)
+    def _load_generic(
+        self,
+        cypher: str,
+        rows: Iterable[dict],
+        partition_key: str | None = None,
+        log_every: int = 20,
+        written_keys: set | None = None,
+    ) -> int:
+        """
+        rows 를 batch_size 단위로 나눠 batch 마다 별도 execute_write 트랜잭션으로 실행.
+        transient 에러 / 연결 끊김은 batch 단위로 재시도.
+
+        workers > 1 이면 partition_key (source 노드 id 컬럼) 로 나눈 병렬 쓰기.
+        written_keys 가 주어지면 cypher 가 RETURN 한 key 컬럼을 모은다 (실제로 MATCH 되어 기록된 row).
+        """
+        def _write(tx, batch):
+            result = tx.run(cypher, rows=batch)
+            if written_keys is None:
+                result.consume()
+            else:
+                written_keys.update(rec["key"] for rec in result)
+
+        if self.workers > 1:
+            return parallel_write(
+                self.driver, rows, _write,
+                workers=self.workers,
+                batch_size=self.batch_size,
+                partition_key=partition_key,
+                max_retries=self.max_retries,
+                name="RelationLoader",
+            )
+
+        total = 0
+        t0 = time.time()
+        for n_batch, batch in enumerate(batched(rows, self.batch_size), start=1):
+            execute_write_with_retry(
+                self.driver, _write, batch,
+                max_retries=self.max_retries,
+                what=f"[RelationLoader] batch {n_batch}",
+            )
+            total += len(batch)
+            if n_batch % log_every == 0:
+                self.log.info(f"[RelationLoader] {total} rows written ({total / max(time.time() - t0, 1e-9):.0f} rows/s)")
+
+        return total
 
     # --------------------------------------------------------------
     # 1) OpenTargets Protein–Disease relationships
@@ -62,19 +389,8 @@ class RelationLoader:
         """
         rows = read_csv_dicts(path)
 
-        cypher = """
-        UNWIND $rows AS row
-        MATCH (p:Protein {uniprot_id: row.uniprot_id})
-        MATCH (d:Disease {disease_id: row.disease_id})
-        MERGE (p)-[r:ASSOCIATED_WITH]->(d)
-        SET r.score         = toFloat(row.score),
-            r.source        = coalesce(row.source, "OpenTargets"),
-            r.evidence_type = coalesce(row.evidence_type, "OpenTargets"),
-            r.active        = coalesce(row.active, "true")
-        """
-
-        self._load_generic(cypher, rows)
-        self.log.info(f"[RelationLoader] Loaded OpenTargets relationships from {path}")
+        n = self._load_generic(PROTEIN_DISEASE_CYPHER, rows, partition_key="uniprot_id")
+        self.log.info(f"[RelationLoader] Loaded OpenTargets relationships from {path} ({n} rows)")
 
     # --------------------------------------------------------------
     # 2) Protein similarity (SIMILAR_TO)
@@ -82,16 +398,37 @@ class RelationLoader:
     def load_protein_similarity(self, path: str):
         rows = read_csv_dicts(path)
 
-        cypher = """
-        UNWIND $rows AS row
-        MATCH (a:Protein {uniprot_id: row.source_uniprot})
-        MATCH (b:Protein {uniprot_id: row.target_uniprot})
-        MERGE (a)-[r:SIMILAR_TO]->(b)
-        SET r.similarity = toFloat(row.similarity)
+        n = self._load_generic(PROTEIN_SIMILARITY_CYPHER, rows, partition_key="source_uniprot")
+        self.log.info(f"[RelationLoader] Loaded SIMILAR_TO from {path} ({n} rows)")
+
+    def load_protein_kmer_similarity(self, path: str):
         """
+        k-mer MinHash/LSH 기반 유사도 (protein_similarity_kmer.csv)
 
-        self._load_generic(cypher, rows)
-        self.log.info(f"[RelationLoader] Loaded SIMILAR_TO from {path}")
+        Expected columns:
+            src_uniprot_id, tgt_uniprot_id, sim_score, method
+        """
+        rows = read_csv_dicts(path)
+
+        n = self._load_generic(PROTEIN_KMER_SIMILARITY_CYPHER, rows, partition_key="src_uniprot_id")
+        self.log.info(f"[RelationLoader] Loaded k-mer SIMILAR_TO from {path} ({n} rows)")
+
+    def apply_protein_similarity_delta(self, path: str):
+        """
+        protein_similarity_delta.csv (op = add | remove) 적용
+        - add    : MERGE + sim_score 갱신
+        - remove : 해당 SIMILAR_TO 삭제
+        """
+
+        # 파일을 두 번 stream: remove 먼저, 그 다음 add
+        removes = self._load_generic(SIMILARITY_DELTA_REMOVE_CYPHER, (r for r in read_csv_dicts(path) if r.get("op") == "remove"), partition_key="source_uniprot")
+        adds = self._load_generic(SIMILARITY_DELTA_ADD_CYPHER, (r for r in read_csv_dicts(path) if r.get("op") == "add"), partition_key="source_uniprot")
+
+        self.log.info(
+            f"[RelationLoader] Applied SIMILAR_TO delta from {path} "
+            f"(+{adds} / -{removes})"
+        )
+        drop_ppr_projection(self.driver)
 
     # --------------------------------------------------------------
     # 3) TP TARGETS Protein
@@ -99,15 +436,8 @@ class RelationLoader:
     def load_therapeutic_targets(self, path: str):
         rows = read_csv_dicts(path)
 
-        cypher = """
-        UNWIND $rows AS row
-        MATCH (tp:TherapeuticProtein {uniprot_id: row.tp_uniprot})
-        MATCH (p:Protein {uniprot_id: row.protein_uniprot})
-        MERGE (tp)-[:TARGETS]->(p)
-        """
-
-        self._load_generic(cypher, rows)
-        self.log.info(f"[RelationLoader] Loaded TP TARGETS from {path}")
+        n = self._load_generic(TP_TARGETS_CYPHER, rows, partition_key="tp_uniprot")
+        self.log.info(f"[RelationLoader] Loaded TP TARGETS from {path} ({n} rows)")
 
     # --------------------------------------------------------------
     # 4) Trial → Protein
@@ -115,31 +445,23 @@ class RelationLoader:
     def load_trial_protein_relations(self, path: str):
         rows = read_csv_dicts(path)
 
-        cypher = """
-        UNWIND $rows AS row
-        MATCH (t:Trial {trial_id: row.trial_id})
-        MATCH (p:Protein {uniprot_id: row.uniprot_id})
-        MERGE (t)-[:INVESTIGATES]->(p)
-        """
-
-        self._load_generic(cypher, rows)
-        self.log.info(f"[RelationLoader] Loaded Trial→Protein from {path}")
+        n = self._load_generic(TRIAL_PROTEIN_CYPHER, rows, partition_key="trial_id")
+        self.log.info(f"[RelationLoader] Loaded Trial→Protein from {path} ({n} rows)")
 
     # --------------------------------------------------------------
     # 5) Trial → TherapeuticProtein
     # --------------------------------------------------------------
     def load_trial_therapeutic_relations(self, path: str):
-        rows = read_csv_dicts(path)
+        """
+        step_trial_tp_relations 출력 (trial_therapeutic_relations.csv)
 
-        cypher = """
-        UNWIND $rows AS row
-        MATCH (t:Trial {trial_id: row.trial_id})
-        MATCH (tp:TherapeuticProtein {uniprot_id: row.uniprot_id})
-        MERGE (t)-[:USES]->(tp)
+        Expected columns:
+            nct_id, therapeutic_name, tp_uniprot
         """
+        rows = read_csv_dicts(path)
 
-        self._load_generic(cypher, rows)
-        self.log.info(f"[RelationLoader] Loaded Trial→TherapeuticProtein from {path}")
+        n = self._load_generic(TRIAL_THERAPEUTIC_CYPHER, rows, partition_key="nct_id")
+        self.log.info(f"[RelationLoader] Loaded Trial→TherapeuticProtein from {path} ({n} rows)")
 
     # --------------------------------------------------------------
     # 6) Publication → Protein
@@ -147,14 +469,128 @@ class RelationLoader:
     def load_publication_protein_mentions(self, path: str):
         rows = read_csv_dicts(path)
 
-        cypher = """
+        n = self._load_generic(PUBLICATION_MENTIONS_CYPHER, rows, partition_key="pmid")
+        self.log.info(f"[RelationLoader] Loaded Publication→Protein from {path} ({n} rows)")
+
+    # --------------------------------------------------------------
+    # 7) Change-aware loading (RELATION_SPECS 기반, row_hash)
+    # --------------------------------------------------------------
+    @staticmethod
+    def _change_cypher(spec: RelationSpec) -> Tuple[str, str]:
+        (s_label, _), (e_label, _) = spec.start, spec.end
+        s_key, e_key = NODE_KEYS[s_label], NODE_KEYS[e_label]
+        ident = ", ".join(f"{p}: row.ident.{p}" for p in spec.identity)
+        ident = f" {{{ident}}}" if ident else ""
+
+        upsert = f"""
+        UNWIND $rows AS row
+        MATCH (a:{s_label} {{{s_key}: row.s}})
+        MATCH (b:{e_label} {{{e_key}: row.e}})
+        MERGE (a)-[r:{spec.rel_type}{ident}]->(b)
+        SET r += row.props, r.row_hash = row.row_hash
+        RETURN row.key AS key
+        """
+
+        delete = f"""
         UNWIND $rows AS row
-        MATCH (pb:Publication {pmid: row.pmid})
-        MATCH (p:Protein {uniprot_id: row.uniprot_id})
-        MERGE (pb)-[:MENTIONS]->(p)
+        MATCH (a:{s_label} {{{s_key}: row.s}})-[r:{spec.rel_type}{ident}]->(b:{e_label} {{{e_key}: row.e}})
+        DELETE r
         """
+        return upsert, delete
+
+    def _count_hashed_relations(self, spec: RelationSpec) -> int:
+        # 같은 rel_type 을 공유하는 spec (SIMILAR_TO esm2 / kmer) 은 identity 기본값으로 구분
+        (s_label, _), (e_label, _) = spec.start, spec.end
+        ident = {
+            prop: default
+            for _, prop, _, default in spec.properties
+            if prop in spec.identity and default is not None
+        }
+        where = "".join(f" AND r.{p} = ${p}" for p in ident)
+        with self.driver.session() as s:
+            return s.run(
+                f"MATCH (:{s_label})-[r:{spec.rel_type}]->(:{e_label}) "
+                f"WHERE r.row_hash IS NOT NULL{where} RETURN count(r) AS c",
+                **ident,
+            ).single()["c"]
+
+    def load_changes(self, spec: RelationSpec, path: str, snapshot: LoadSnapshot | None = None) -> Dict[str, int]:
+        """
+        CSV 를 이전 snapshot 과 로컬로 비교해서 inserted / changed 관계만 MERGE, 사라진 관계는 DELETE.
+
+        snapshot key = (start, end, *identity), 관계에는 row_hash property 를 같이 저장.
+        DB 의 row_hash 관계 수가 snapshot 보다 적으면 (DB 초기화 등) snapshot 을 무시하고 전체 적재.
+
+        양 끝 노드가 없어 MATCH 되지 않은 row 는 아무것도 쓰지 않으므로 snapshot 에 새 hash 로 남기지 않고
+        (이전 hash 가 있으면 유지) dead-letter 로 보낸다 → lost.
+        """
+        (_, s_col), (_, e_col) = spec.start, spec.end
+        snapshot = snapshot or LoadSnapshot(f"rels_{spec.name}")
+        previous = snapshot.load()
+
+        if previous:
+            in_db = self._count_hashed_relations(spec)
+            if in_db < len(previous):
+                self.log.warning(
+                    f"[RelationLoader] {spec.name}: snapshot has {len(previous)} rows "
+                    f"but DB has {in_db} hashed relations → full load"
+                )
+                previous = {}
+
+        current: Dict[str, str] = {}
+        pending: Dict[str, Dict[str, Any]] = {}
+        for raw in read_csv_dicts(path):
+            s, e = (raw.get(s_col) or "").strip(), (raw.get(e_col) or "").strip()
+            if not s or not e:
+                continue
+            props = spec.row_properties(raw)
+            ident = {p: props.get(p) for p in spec.identity}
+            key = snapshot_key((s, e, *ident.values()))
+            h = row_fingerprint(props)
+            current[key] = h
+            if previous.get(key) != h:
+                pending[key] = {"key": key, "s": s, "e": e, "ident": ident, "props": props, "row_hash": h}
+            else:
+                pending.pop(key, None)
+
+        inserted, changed, deleted = diff_snapshot(previous, current)
+        unchanged = len(current) - len(inserted) - len(changed)
+        upsert_cypher, delete_cypher = self._change_cypher(spec)
+
+        def _deleted_rows():
+            for key in deleted:
+                s, e, *ident = split_snapshot_key(key)
+                yield {"key": key, "s": s, "e": e, "ident": dict(zip(spec.identity, ident))}
+
+        written: set = set()
+        self._load_generic(delete_cypher, _deleted_rows(), partition_key="s")
+        self._load_generic(upsert_cypher, pending.values(), partition_key="s", written_keys=written)
 
-        self._load_generic(cypher, rows)
-        self.log.info(f"[RelationLoader] Loaded Publication→Protein from {path}")
+        # MATCH 실패 (start / end 노드 없음) → 다음 실행에서 다시 시도
+        dead = DeadLetterWriter(f"RelationLoader_{spec.name}")
+        (s_label, _), (e_label, _) = spec.start, spec.end
+        for key, row in pending.items():
+            if key in written:
+                continue
+            dead.write(
+                row, LookupError(f"{s_label} {row['s']!r} or {e_label} {row['e']!r} not found"),
+                stage="match", key=key,
+            )
+            if key in previous:
+                current[key] = previous[key]
+            else:
+                current.pop(key, None)
+        dead.close()
 
+        snapshot.save(current)
 
+        stats = {
+            "inserted": len(inserted),
+            "changed": len(changed),
+            "deleted": len(deleted),
+            "unchanged": unchanged,
+            "lost": dead.count,
+            "dead_letter_path": str(dead.path) if dead.count else None,
+        }
+        self.log.info(f"[RelationLoader] Change-aware {spec.name} from {path}: {stats}")
+        return stats
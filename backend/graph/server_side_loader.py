@@ -0,0 +1,260 @@
+# backend/graph/server_side_loader.py
+
+"""
+Server-side bulk loading (LOAD CSV + CALL { ... } IN TRANSACTIONS)
+
+Neo4j 의 import 디렉터리를 이 host 에서 쓸 수 있을 때 (같은 host / volume 의 local Neo4j) 사용.
+row 를 $rows 파라미터로 Bolt 에 보내지 않고, CSV 를 import 디렉터리에 staging 한 뒤
+서버가 직접 읽어서 n 행마다 commit 한다.
+
+    NEO4J_IMPORT_DIR=/var/lib/neo4j/import
+        rebio/nodes_Protein.csv, rebio/rels_protein_disease.csv, ...
+
+  - 노드: loader 의 _preprocess_row 로 정제한 CSV 를 stream 으로 기록 (한 행씩, 메모리 일정)
+          MERGE / SET 은 loader 의 Cypher 를 그대로 사용 (row map 만 LOAD CSV 컬럼에서 타입 변환)
+  - 관계: 원본 CSV 를 그대로 hard link (안 되면 copy), RelationSpec 으로 MATCH / MERGE Cypher 생성
+  - MERGE 기반이라 중간에 실패해도 다시 실행하면 이어서 적재됨
+"""
+
+import os
+import csv
+import time
+import shutil
+import logging
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+from neo4j import Driver
+
+from backend.config import Config
+from backend.graph.loaders import get_driver
+from backend.graph.graph_search_client import drop_ppr_projection
+from backend.graph.bulk_import import (
+    ARRAY_DELIMITER,
+    NODE_FILES,
+    _format,
+    find_relation_file,
+    infer_property_types,
+)
+from backend.graph.loaders.utils import read_csv_dicts
+from backend.graph.relation_loader import NODE_KEYS, RELATION_SPECS, RelationSpec, ensure_similarity_migration
+from backend.graph.query_preflight import ensure_constraints
+
+logger = logging.getLogger("server_side_loader")
+
+NEO4J_IMPORT_DIR = os.getenv("NEO4J_IMPORT_DIR")
+LOAD_CSV_TX_ROWS = int(os.getenv("LOAD_CSV_TX_ROWS", "10000"))
+
+STAGING_SUBDIR = "rebio"
+
+# neo4j-admin type → LOAD CSV 문자열 변환 식 ({v} = line.<컬럼>)
+_CYPHER_CASTS = {
+    "string": "{v}",
+    "long": "toInteger({v})",
+    "double": "toFloat({v})",
+    "boolean": "toBoolean({v})",
+    "date": "date({v})",
+    "string[]": f"coalesce(split({{v}}, '{ARRAY_DELIMITER}'), [])",
+}
+
+
+# ---------------------------------------------------------
+# Staging
+# ---------------------------------------------------------
+def _staging_dir(import_dir: Path) -> Path:
+    out = Path(import_dir) / STAGING_SUBDIR
+    out.mkdir(parents=True, exist_ok=True)
+    return out
+
+
+def _file_url(name: str) -> str:
+    # import 디렉터리 기준 상대 경로
+    return f"file:///{STAGING_SUBDIR}/{name}"
+
+
+def _preprocessed_rows(loader, src: Path):
+    for raw in read_csv_dicts(str(src)):
+        row = loader._preprocess_row(raw)
+        if row.get(loader.key):
+            yield row
+
+
+def stage_node_csv(loader, src: Path, import_dir: Path) -> Tuple[str, Dict[str, str], int]:
+    """
+    loader._preprocess_row 로 정제한 CSV 를 import 디렉터리에 기록.
+    반환: (file URL, 컬럼 → neo4j type, 행 수)
+
+    header 는 모든 row 의 컬럼 합집합 (일부 row 에만 있는 컬럼도 포함) → CSV 를 두 번 읽음
+    """
+    name = f"nodes_{loader.label}.csv"
+    dst = _staging_dir(import_dir) / name
+    tmp = dst.with_name(name + ".tmp")
+
+    # 1) 컬럼 합집합 + 컬럼별 첫 non-null 값의 type (bulk_import 와 같은 규칙)
+    types = infer_property_types(_preprocessed_rows(loader, src))
+    columns = list(types)
+
+    # 2) 기록 (없는 컬럼은 빈 값)
+    n = 0
+    with open(tmp, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        for row in _preprocessed_rows(loader, src):
+            writer.writerow([_format(row.get(k)) for k in columns])
+            n += 1
+
+    tmp.replace(dst)
+    return _file_url(name), types, n
+
+
+def stage_relation_csv(spec: RelationSpec, src: Path, import_dir: Path) -> str:
+    """원본 관계 CSV 를 그대로 staging (같은 filesystem 이면 hard link)"""
+    name = f"rels_{spec.name}.csv"
+    dst = _staging_dir(import_dir) / name
+    if dst.exists():
+        dst.unlink()
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return _file_url(name)
+
+
+# ---------------------------------------------------------
+# Cypher
+# ---------------------------------------------------------
+def node_load_csv_cypher(loader, types: Dict[str, str], tx_rows: int) -> str:
+    """loader 의 UNWIND Cypher 에서 MERGE / SET 부분만 가져와 LOAD CSV row map 뒤에 붙임"""
+    cypher, _ = loader._prepare_cypher_and_params([])
+    head, sep, body = cypher.partition("UNWIND $rows AS row")
+    if not sep:
+        raise ValueError(f"❌ {loader.__class__.__name__} Cypher does not start with UNWIND $rows AS row")
+
+    fields = ", ".join(
+        f"{col}: " + _CYPHER_CASTS[typ].format(v=f"line.`{col}`")
+        for col, typ in types.items()
+    )
+    return f"""
+    LOAD CSV WITH HEADERS FROM $url AS line
+    WITH line WHERE line.`{loader.key}` IS NOT NULL
+    CALL {{
+        WITH line
+        WITH {{{fields}}} AS row
+        {body.strip()}
+    }} IN TRANSACTIONS OF {tx_rows} ROWS
+    """
+
+
+def relation_load_csv_cypher(spec: RelationSpec, tx_rows: int) -> str:
+    (s_label, s_col), (e_label, e_col) = spec.start, spec.end
+    s_key, e_key = NODE_KEYS[s_label], NODE_KEYS[e_label]
+
+    def _value(col: str, typ: str, default: Any) -> str:
+        v = f"trim(line.`{col}`)"
+        if typ == "float":
+            return f"toFloat({v})"
+        return f"coalesce({v}, '{default}')" if default is not None else v
+
+    values = {prop: _value(col, typ, default) for col, prop, typ, default in spec.properties}
+
+    required = [f"line.`{s_col}` IS NOT NULL", f"line.`{e_col}` IS NOT NULL"]
+    required += [
+        f"line.`{col}` IS NOT NULL"
+        for col, prop, _, default in spec.properties
+        if prop in spec.identity and default is None
+    ]
+
+    ident = ", ".join(f"{p}: {values[p]}" for p in spec.identity)
+    ident = f" {{{ident}}}" if ident else ""
+    sets = ", ".join(f"r.{p} = {v}" for p, v in values.items() if p not in spec.identity)
+    sets = f"SET {sets}" if sets else ""
+
+    return f"""
+    LOAD CSV WITH HEADERS FROM $url AS line
+    WITH line WHERE {" AND ".join(required)}
+    CALL {{
+        WITH line
+        MATCH (a:{s_label} {{{s_key}: trim(line.`{s_col}`)}})
+        MATCH (b:{e_label} {{{e_key}: trim(line.`{e_col}`)}})
+        MERGE (a)-[r:{spec.rel_type}{ident}]->(b)
+        {sets}
+    }} IN TRANSACTIONS OF {tx_rows} ROWS
+    """
+
+
+def _run_auto_commit(driver: Driver, cypher: str, url: str) -> Dict[str, int]:
+    # CALL { ... } IN TRANSACTIONS 는 auto-commit 트랜잭션에서만 실행 가능 (execute_write 불가)
+    with driver.session() as s:
+        counters = s.run(cypher, url=url).consume().counters
+    return {
+        "nodes_created": counters.nodes_created,
+        "relationships_created": counters.relationships_created,
+        "properties_set": counters.properties_set,
+    }
+
+
+# ---------------------------------------------------------
+# Main
+# ---------------------------------------------------------
+def server_side_load(
+    node_root: Path | None = None,
+    relations_root: Path | None = None,
+    import_dir: Path | str | None = NEO4J_IMPORT_DIR,
+    tx_rows: int = LOAD_CSV_TX_ROWS,
+) -> Dict[str, Dict[str, int]]:
+    if not import_dir:
+        raise ValueError("❌ NEO4J_IMPORT_DIR is not set (Neo4j import directory must be reachable)")
+
+    node_root = Path(node_root or Config.RAW_DATA_ROOT)
+    relations_root = Path(relations_root or Config.RAW_DATA_ROOT)
+    import_dir = Path(import_dir)
+    driver = get_driver()
+
+    print("\n===============================================")
+    print("🚚 Server-side LOAD CSV (CALL IN TRANSACTIONS)")
+    print("===============================================")
+    print(f"📁 Neo4j import dir : {import_dir}")
+    print(f"📦 Rows per tx      : {tx_rows}\n")
+
+    # MERGE / MATCH 가 unique index 를 쓰도록 constraint 먼저
+    missing = ensure_constraints(driver)
+    if missing:
+        raise RuntimeError(f"❌ Missing unique constraints: {missing}")
+
+    t_start = time.time()
+    results: Dict[str, Dict[str, int]] = {}
+
+    for filename, loader_cls in NODE_FILES:
+        src = node_root / filename
+        if not src.exists():
+            print(f"ℹ️ Optional missing: {src}")
+            continue
+
+        loader = loader_cls(driver)
+        t0 = time.time()
+        url, types, n = stage_node_csv(loader, src, import_dir)
+        staged = time.time() - t0
+
+        counters = _run_auto_commit(driver, node_load_csv_cypher(loader, types, tx_rows), url)
+        results[loader.label] = {"rows": n, **counters}
+        print(f"✅ {loader.label}: {n} rows (stage {staged:.1f}s, load {time.time() - t0 - staged:.1f}s) {counters}")
+
+    # 이전 method / sim_score 없는 SIMILAR_TO 가 있으면 esm2 MERGE 가 중복 edge 를 만들지 않도록 먼저 표시 (DB 당 한 번)
+    ensure_similarity_migration(driver)
+
+    for spec in RELATION_SPECS:
+        src = find_relation_file(spec, [Config.PROCESSED_DATA_ROOT, relations_root])
+        if src is None:
+            print(f"ℹ️ Optional missing: {spec.name} ({', '.join(spec.filenames)})")
+            continue
+
+        t0 = time.time()
+        url = stage_relation_csv(spec, src, import_dir)
+        counters = _run_auto_commit(driver, relation_load_csv_cypher(spec, tx_rows), url)
+        results[spec.name] = counters
+        print(f"✅ {spec.rel_type} ({spec.name}): {time.time() - t0:.1f}s {counters}")
+
+    drop_ppr_projection(driver)
+
+    print(f"\n🎉 Server-side load done in {time.time() - t_start:.1f}s\n")
+    return results
@@ -0,0 +1,378 @@
+# backend/pipeline/ann_index.py
+
+"""
+Approximate Nearest-Neighbour Index (IVF-flat, cosine)
+
+Embedding matrix 를 spherical k-means 로 nlist 개 cell 로 나누고,
+query 마다 가장 가까운 nprobe 개 cell 의 벡터만 exact 비교한다.
+
+    build  : O(iters · N · nlist · D)
+    search : O(N · (nlist + nprobe · N / nlist) · D)   (all-pairs 대비 sub-quadratic)
+
+Recall / 속도 조절:
+    nlist  ↑ → cell 이 작아져 빠르지만 recall ↓
+    nprobe ↑ → 더 많은 cell 을 보므로 recall ↑, 느려짐
+
+Persisted at:
+    Config.VECTORDB_PROTEIN / "ivf_flat" / {centroids,vectors,rows,offsets}.npy + meta.json
+    (meta.json 의 embedding fingerprint 가 다르면 재빌드)
+
+recall_report() 로 exact top-k 대비 recall@k 를 측정해서 설정을 고를 수 있다.
+"""
+
+import os
+import json
+import time
+import logging
+from pathlib import Path
+from typing import Dict, Iterator, List, Sequence
+
+import numpy as np
+
+from backend.config import Config
+from backend.pipeline.embedding_store import dump_json_atomic, save_npy_atomic, vectors_fingerprint
+from backend.pipeline.similarity_engine import Block, normalize_rows, topk_block
+
+logger = logging.getLogger("ann_index")
+
+ANN_INDEX_DIR = Config.VECTORDB_PROTEIN / "ivf_flat"
+
+ANN_NPROBE = int(os.getenv("ANN_NPROBE", "8"))
+
+
+def default_nlist(n: int) -> int:
+    """cell 수 기본값 ≈ 4·√N"""
+    return max(1, min(n, int(4 * np.sqrt(max(n, 1)))))
+
+
+class IVFFlatIndex:
+    """
+    Inverted-file index over l2-normalized float32 vectors.
+
+    vectors 는 cell 순서로 재배열해서 저장하고,
+    rows[i] 는 재배열된 i 번째 벡터의 원래 행 번호,
+    offsets[c]:offsets[c+1] 은 cell c 의 구간이다.
+    """
+
+    def __init__(
+        self,
+        nlist: int | None = None,
+        nprobe: int = ANN_NPROBE,
+        kmeans_iters: int = 20,
+        train_size: int = 100_000,
+        seed: int = 0,
+    ):
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.kmeans_iters = kmeans_iters
+        self.train_size = train_size
+        self.seed = seed
+
+        self.ids: List[str] = []
+        self.fingerprint: str | None = None
+        self.centroids: np.ndarray | None = None
+        self.vectors: np.ndarray | None = None
+        self.rows: np.ndarray | None = None
+        self.offsets: np.ndarray | None = None
+        self._inverse: np.ndarray | None = None
+
+    # ------------------------------------------------------------
+    # Build
+    # ------------------------------------------------------------
+    def _assign(self, x: np.ndarray, centroids: np.ndarray, block: int = 65536) -> np.ndarray:
+        out = np.empty(len(x), dtype=np.int64)
+        for s in range(0, len(x), block):
+            out[s:s + block] = np.argmax(x[s:s + block] @ centroids.T, axis=1)
+        return out
+
+    def _train(self, x: np.ndarray, nlist: int) -> np.ndarray:
+        rng = np.random.default_rng(self.seed)
+
+        if len(x) > self.train_size:
+            x = x[rng.choice(len(x), self.train_size, replace=False)]
+
+        centroids = x[rng.choice(len(x), nlist, replace=False)].copy()
+
+        for _ in range(self.kmeans_iters):
+            assign = self._assign(x, centroids)
+            order = np.argsort(assign, kind="stable")
+            counts = np.bincount(assign, minlength=nlist)
+
+            sums = np.zeros_like(centroids)
+            nonempty = np.flatnonzero(counts)
+            starts = np.concatenate([[0], np.cumsum(counts)[:-1]])[nonempty]
+            sums[nonempty] = np.add.reduceat(x[order], starts, axis=0)
+
+            # 빈 cell 은 임의의 점으로 재시드
+            empty = np.flatnonzero(counts == 0)
+            if len(empty):
+                sums[empty] = x[rng.choice(len(x), len(empty), replace=False)]
+
+            centroids = normalize_rows(sums)
+
+        return centroids
+
+    def build(self, ids: List[str], vectors: np.ndarray) -> "IVFFlatIndex":
+        x = normalize_rows(vectors)
+        n = len(x)
+        nlist = min(self.nlist or default_nlist(n), n)
+
+        t0 = time.time()
+        logger.info(f"[ANN] Training IVF-flat: N={n}, nlist={nlist}")
+        centroids = self._train(x, nlist)
+
+        assign = self._assign(x, centroids)
+        rows = np.argsort(assign, kind="stable")
+        counts = np.bincount(assign, minlength=nlist)
+
+        self.ids = list(ids)
+        self.nlist = nlist
+        self.centroids = centroids
+        self.vectors = np.ascontiguousarray(x[rows])
+        self.rows = rows.astype(np.int64)
+        self.offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+        self._inverse = None
+
+        logger.info(f"[ANN] Built in {time.time() - t0:.1f}s (largest cell={counts.max()})")
+        return self
+
+    # ------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------
+    def _row_positions(self) -> np.ndarray:
+        """원래 행 번호 → 재배열된 위치"""
+        if self._inverse is None:
+            inv = np.empty_like(self.rows)
+            inv[self.rows] = np.arange(len(self.rows))
+            self._inverse = inv
+        return self._inverse
+
+    def search(
+        self,
+        queries: np.ndarray,
+        top_k: int = 20,
+        nprobe: int | None = None,
+        self_rows: Sequence[int] | None = None,
+        normalized: bool = False,
+    ):
+        """
+        queries (b×D) 의 근사 top-k.
+        self_rows[r] 가 주어지면 해당 원래 행(자기 자신)은 제외.
+
+        반환: (top_idx, top_scores) — b×k, 원래 행 번호 기준.
+        후보가 k 개보다 적으면 나머지는 index -1 / score -inf.
+        """
+        q = np.ascontiguousarray(queries, dtype=np.float32) if normalized else normalize_rows(queries)
+        nprobe = min(nprobe or self.nprobe, self.nlist)
+
+        top_idx = np.full((len(q), top_k), -1, dtype=np.int64)
+        top_scores = np.full((len(q), top_k), -np.inf, dtype=np.float32)
+
+        cell_scores = q @ self.centroids.T
+        if nprobe < self.nlist:
+            probes = np.argpartition(-cell_scores, nprobe - 1, axis=1)[:, :nprobe]
+        else:
+            probes = np.broadcast_to(np.arange(self.nlist), (len(q), self.nlist))
+
+        offsets = self.offsets
+        for r in range(len(q)):
+            spans = [np.arange(offsets[c], offsets[c + 1]) for c in probes[r]]
+            cand = np.concatenate(spans) if spans else np.empty(0, dtype=np.int64)
+            if self_rows is not None:
+                cand = cand[cand != self._row_positions()[self_rows[r]]]
+            if not len(cand):
+                continue
+
+            sims = self.vectors[cand] @ q[r]
+            k = min(top_k, len(cand))
+            part = np.argpartition(sims, -k)[-k:]
+            part = part[np.argsort(-sims[part])]
+
+            top_idx[r, :k] = self.rows[cand[part]]
+            top_scores[r, :k] = sims[part]
+
+        return top_idx, top_scores
+
+    def iter_topk(
+        self,
+        vectors: np.ndarray,
+        top_k: int = 20,
+        query_indices: Sequence[int] | None = None,
+        exclude_self: bool = True,
+        nprobe: int | None = None,
+        block_rows: int = 4096,
+    ) -> Iterator[Block]:
+        """similarity_engine.iter_topk 와 같은 (q_idx, top_idx, top_scores) block 을 yield"""
+        n = len(vectors)
+        if query_indices is None:
+            query_indices = np.arange(n, dtype=np.int64)
+        else:
+            query_indices = np.asarray(query_indices, dtype=np.int64)
+
+        for s in range(0, len(query_indices), block_rows):
+            q_idx = query_indices[s:s + block_rows]
+            top_idx, top_scores = self.search(
+                vectors[q_idx],
+                top_k=top_k,
+                nprobe=nprobe,
+                self_rows=q_idx if exclude_self else None,
+            )
+            yield q_idx, top_idx, top_scores
+
+    # ------------------------------------------------------------
+    # Persist
+    # ------------------------------------------------------------
+    def save(self, path: Path = ANN_INDEX_DIR) -> Path:
+        """
+        배열은 파일마다 임시 파일 → os.replace.
+        meta.json 을 먼저 지우고 마지막에 쓰므로, 중간에 실패하면 다음 실행에서 다시 빌드된다.
+        """
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        (path / "meta.json").unlink(missing_ok=True)
+
+        save_npy_atomic(path / "centroids.npy", self.centroids)
+        save_npy_atomic(path / "vectors.npy", self.vectors)
+        save_npy_atomic(path / "rows.npy", self.rows)
+        save_npy_atomic(path / "offsets.npy", self.offsets)
+
+        dump_json_atomic(path / "meta.json", {
+            "type": "ivf_flat",
+            "nlist": self.nlist,
+            "nprobe": self.nprobe,
+            "kmeans_iters": self.kmeans_iters,
+            "fingerprint": self.fingerprint,
+            "ids": self.ids,
+        })
+
+        logger.info(f"[ANN] Index saved → {path}")
+        return path
+
+    @classmethod
+    def load(cls, path: Path = ANN_INDEX_DIR) -> "IVFFlatIndex":
+        path = Path(path)
+        with open(path / "meta.json", "r", encoding="utf-8") as f:
+            meta = json.load(f)
+
+        index = cls(nlist=meta["nlist"], nprobe=meta["nprobe"], kmeans_iters=meta["kmeans_iters"])
+        index.ids = meta["ids"]
+        index.fingerprint = meta.get("fingerprint")
+        index.centroids = np.load(path / "centroids.npy")
+        index.vectors = np.load(path / "vectors.npy", mmap_mode="r")
+        index.rows = np.load(path / "rows.npy")
+        index.offsets = np.load(path / "offsets.npy")
+
+        logger.info(f"[ANN] Index loaded ← {path} (N={len(index.ids)}, nlist={index.nlist})")
+        return index
+
+
+# -------------------------------------------------------
+# Build-or-load helper
+# -------------------------------------------------------
+def load_current_index(
+    fingerprint: str,
+    path: Path = ANN_INDEX_DIR,
+    nlist: int | None = None,
+) -> IVFFlatIndex | None:
+    """저장된 index 의 fingerprint (와 nlist) 가 같으면 로드, 없거나 오래됐으면 None"""
+    path = Path(path)
+    if not (path / "meta.json").exists():
+        return None
+    try:
+        index = IVFFlatIndex.load(path)
+    except Exception as e:
+        logger.warning(f"[ANN] Failed to load index: {e}")
+        return None
+    if index.fingerprint != fingerprint or (nlist is not None and index.nlist != nlist):
+        logger.info("[ANN] Stored index is stale")
+        return None
+    return index
+
+
+def get_or_build_index(
+    ids: List[str],
+    vectors: np.ndarray,
+    path: Path = ANN_INDEX_DIR,
+    nlist: int | None = None,
+    nprobe: int = ANN_NPROBE,
+    rebuild: bool = False,
+    fingerprint: str | None = None,
+) -> IVFFlatIndex:
+    """
+    저장된 index 의 fingerprint 가 현재 embedding 과 같으면 재사용, 아니면 새로 빌드 후 저장.
+
+    index 는 벡터 사본을 갖고 있으므로 id 목록만이 아니라 벡터 내용으로 비교한다.
+    fingerprint 를 안 주면 (ids, vectors) 로 계산 (embedding store 가 있으면 embedding_fingerprint 를 넘길 것).
+    """
+    fingerprint = fingerprint or vectors_fingerprint(ids, vectors)
+    index = None if rebuild else load_current_index(fingerprint, path, nlist)
+    if index is not None:
+        index.nprobe = nprobe
+        return index
+
+    index = IVFFlatIndex(nlist=nlist, nprobe=nprobe).build(ids, vectors)
+    index.fingerprint = fingerprint
+    index.save(path)
+    return index
+
+
+# -------------------------------------------------------
+# Recall@k report
+# -------------------------------------------------------
+def recall_at_k(
+    index: IVFFlatIndex,
+    vectors: np.ndarray,
+    top_k: int = 20,
+    nprobe: int | None = None,
+    sample: int = 1000,
+    seed: int = 0,
+) -> Dict:
+    """샘플 query 에 대해 exact top-k 대비 ANN recall@k 와 query 당 시간(ms)"""
+    x = normalize_rows(vectors)
+    rng = np.random.default_rng(seed)
+    q_idx = np.sort(rng.choice(len(x), min(sample, len(x)), replace=False))
+
+    exact_idx, _ = topk_block(x[q_idx], x, top_k, q_idx)
+
+    t0 = time.time()
+    ann_idx, _ = index.search(x[q_idx], top_k=top_k, nprobe=nprobe, self_rows=q_idx, normalized=True)
+    elapsed = time.time() - t0
+
+    hits = sum(len(np.intersect1d(a[a >= 0], e)) for a, e in zip(ann_idx, exact_idx))
+    return {
+        "nlist": index.nlist,
+        "nprobe": min(nprobe or index.nprobe, index.nlist),
+        "k": top_k,
+        "queries": len(q_idx),
+        "recall": hits / max(exact_idx.size, 1),
+        "ms_per_query": 1000 * elapsed / max(len(q_idx), 1),
+    }
+
+
+def recall_report(
+    index: IVFFlatIndex,
+    vectors: np.ndarray,
+    top_k: int = 20,
+    nprobe_values: Sequence[int] = (1, 2, 4, 8, 16, 32, 64),
+    sample: int = 1000,
+) -> List[Dict]:
+    print(f"\n📊 IVF-flat recall@{top_k} (nlist={index.nlist}, sample={sample})")
+    print(f"{'nprobe':>8} {'recall':>8} {'ms/query':>10}")
+
+    results = []
+    for nprobe in nprobe_values:
+        if nprobe > index.nlist:
+            break
+        r = recall_at_k(index, vectors, top_k=top_k, nprobe=nprobe, sample=sample)
+        results.append(r)
+        print(f"{r['nprobe']:>8} {r['recall']:>8.3f} {r['ms_per_query']:>10.3f}")
+
+    return results
+
+
+if __name__ == "__main__":
+    from backend.pipeline.embedding_store import embedding_fingerprint, load_embedding_store
+
+    ids, vectors = load_embedding_store()
+    idx = get_or_build_index(ids, vectors, fingerprint=embedding_fingerprint())
+    recall_report(idx, vectors)
@@ -0,0 +1,205 @@
+# backend/pipeline/embedding_store.py
+
+"""
+Binary Embedding Store (float32 .npy matrix + id index)
+
+Creates:
+    processed/protein_embeddings.npy        (N × D float32, row i ↔ ids[i])
+    processed/protein_embeddings.ids.json   ({"ids": [...], "dim": D, "count": N, ...})
+    processed/therapeutic_protein_embeddings.npy (+ .ids.json, therapeutic_embeddings_builder)
+
+Consumers open the matrix with np.memmap (mmap_mode="r"), so similarity / GDS
+steps read the vectors zero-copy instead of re-parsing JSON floats.
+"""
+
+import os
+import json
+import hashlib
+import logging
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+import numpy as np
+
+from backend.config import Config
+
+logger = logging.getLogger("embedding_store")
+
+EMBED_STORE = Config.PROCESSED_DATA_ROOT / "protein_embeddings.npy"
+TP_EMBED_STORE = Config.PROCESSED_DATA_ROOT / "therapeutic_protein_embeddings.npy"
+LEGACY_JSONL = Config.PROCESSED_DATA_ROOT / "protein_embeddings.jsonl"
+
+STORE_DTYPE = np.float32
+
+
+def index_path(store_path: Path) -> Path:
+    """protein_embeddings.npy → protein_embeddings.ids.json"""
+    store_path = Path(store_path)
+    return store_path.with_suffix(".ids.json")
+
+
+# -------------------------------------------------------
+# Write
+# -------------------------------------------------------
+def save_embedding_store(store_path: Path, ids: List[str], vectors: np.ndarray, meta: Dict | None = None) -> Path:
+    """
+    ids / vectors 를 float32 .npy + id index 로 저장.
+    임시 파일에 쓴 뒤 os.replace 로 교체하므로 읽는 쪽은 항상 완전한 파일만 본다.
+    """
+    store_path = Path(store_path)
+    store_path.parent.mkdir(parents=True, exist_ok=True)
+
+    vectors = np.asarray(vectors, dtype=STORE_DTYPE)
+    if vectors.ndim != 2 or vectors.shape[0] != len(ids):
+        raise ValueError(f"❌ ids ({len(ids)}) and vectors {vectors.shape} do not match")
+
+    tmp_matrix = store_path.with_name(store_path.name + ".tmp")
+    out = np.lib.format.open_memmap(tmp_matrix, mode="w+", dtype=STORE_DTYPE, shape=vectors.shape)
+    out[:] = vectors
+    out.flush()
+    del out
+
+    index = dict(meta or {})
+    index.update({
+        "ids": list(ids),
+        "count": int(vectors.shape[0]),
+        "dim": int(vectors.shape[1]),
+        "dtype": np.dtype(STORE_DTYPE).name,
+    })
+    idx_path = index_path(store_path)
+    tmp_index = idx_path.with_name(idx_path.name + ".tmp")
+    with open(tmp_index, "w", encoding="utf-8") as f:
+        json.dump(index, f)
+
+    os.replace(tmp_matrix, store_path)
+    os.replace(tmp_index, idx_path)
+
+    logger.info(f"[EmbeddingStore] Saved {vectors.shape[0]}×{vectors.shape[1]} → {store_path}")
+    return store_path
+
+
+# -------------------------------------------------------
+# Read
+# -------------------------------------------------------
+def load_embedding_index(store_path: Path) -> Dict:
+    with open(index_path(store_path), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_embedding_store(store_path: Path = EMBED_STORE) -> Tuple[List[str], np.ndarray]:
+    """
+    (ids, matrix) 반환. matrix 는 read-only np.memmap (복사 없음).
+    .npy 가 없고 같은 이름의 legacy JSONL 이 있으면 한 번 변환해서 사용한다.
+    """
+    store_path = Path(store_path)
+
+    if store_path.suffix == ".jsonl":
+        legacy = store_path
+        store_path = store_path.with_suffix(".npy")
+    else:
+        legacy = store_path.with_suffix(".jsonl")
+
+    if not store_path.exists() or not index_path(store_path).exists():
+        if legacy.exists():
+            logger.info(f"[EmbeddingStore] Converting legacy JSONL → {store_path}")
+            convert_jsonl(legacy, store_path)
+        else:
+            raise FileNotFoundError(f"❌ Embedding store not found: {store_path}")
+
+    index = load_embedding_index(store_path)
+    matrix = np.load(store_path, mmap_mode="r")
+
+    ids = index["ids"]
+    if matrix.shape[0] != len(ids):
+        raise ValueError(f"❌ Embedding store is inconsistent: {len(ids)} ids vs {matrix.shape[0]} rows")
+
+    logger.info(f"[EmbeddingStore] Opened {matrix.shape[0]}×{matrix.shape[1]} (memmap) from {store_path}")
+    return ids, matrix
+
+
+def embedding_fingerprint(store_path: Path = EMBED_STORE) -> str:
+    """
+    embedding 집합의 fingerprint (sha256).
+    id index 에 서열 hash 가 있으면 (ids, hashes, model) 기준, 없으면 .npy 파일 내용 기준.
+    """
+    store_path = Path(store_path)
+    if store_path.suffix == ".jsonl":
+        store_path = store_path.with_suffix(".npy")
+    if not index_path(store_path).exists():
+        load_embedding_store(store_path)  # legacy JSONL 이면 변환
+
+    h = hashlib.sha256()
+    index = load_embedding_index(store_path)
+    if index.get("hashes"):
+        h.update(json.dumps([index["ids"], index["hashes"], index.get("model")]).encode("utf-8"))
+    else:
+        with open(store_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+        h.update(json.dumps(index["ids"]).encode("utf-8"))
+    return h.hexdigest()
+
+
+def vectors_fingerprint(ids: List[str], vectors: np.ndarray, block_rows: int = 65536) -> str:
+    """
+    store 파일이 없는 in-memory (ids, vectors) 의 fingerprint (sha256).
+    memmap 도 block 단위로 읽어서 전체 복사 없이 계산한다.
+    """
+    h = hashlib.sha256()
+    h.update(json.dumps(list(ids)).encode("utf-8"))
+    h.update(str(np.shape(vectors)).encode("utf-8"))
+    for s in range(0, len(vectors), block_rows):
+        h.update(np.ascontiguousarray(vectors[s:s + block_rows], dtype=STORE_DTYPE).tobytes())
+    return h.hexdigest()
+
+
+def save_npy_atomic(path: Path, array: np.ndarray) -> Path:
+    """임시 파일에 np.save 후 os.replace (읽는 쪽은 완전한 파일만 봄)"""
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        np.save(f, array)
+    os.replace(tmp, path)
+    return path
+
+
+def dump_json_atomic(path: Path, obj: Dict) -> Path:
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(obj, f)
+    os.replace(tmp, path)
+    return path
+
+
+def iter_embedding_rows(ids: List[str], matrix: np.ndarray) -> Iterator[Dict]:
+    """Neo4j 파라미터용 {"id", "embedding"} row 를 한 줄씩 생성"""
+    for i, pid in enumerate(ids):
+        yield {"id": pid, "embedding": matrix[i].tolist()}
+
+
+# -------------------------------------------------------
+# Legacy JSONL migration
+# -------------------------------------------------------
+def convert_jsonl(jsonl_path: Path, store_path: Path) -> Path:
+    ids = []
+    vectors = []
+    with open(jsonl_path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            obj = json.loads(line)
+            if "id" not in obj or "embedding" not in obj:
+                continue
+            ids.append(obj["id"])
+            vectors.append(np.asarray(obj["embedding"], dtype=STORE_DTYPE))
+
+    if not vectors:
+        raise ValueError(f"❌ No embeddings found in {jsonl_path}")
+
+    return save_embedding_store(store_path, ids, np.vstack(vectors), meta={"source": str(jsonl_path)})
+
+
+if __name__ == "__main__":
+    convert_jsonl(LEGACY_JSONL, EMBED_STORE)
@@ -0,0 +1,227 @@
+# backend/pipeline/kmer_similarity.py
+
+"""
+k-mer MinHash / LSH Similarity Builder (sequence-only SIMILAR_TO, no model inference)
+
+Creates:
+    raw/protein_similarity_kmer.csv
+
+Format:
+    src_uniprot_id, tgt_uniprot_id, sim_score, method   (method = "kmer")
+
+Pipeline:
+    1) proteins.csv 서열 → k-mer 집합 (정수 코드)
+    2) num_perm 개 universal hash 로 MinHash signature 생성
+    3) LSH banding (bands × rows_per_band = num_perm) → 같은 bucket 의 쌍만 후보
+    4) 후보 쌍을 signature 일치율 (Jaccard 추정치) 로 점수화 → 단백질별 top-k
+
+후보 생성이 bucket 단위이므로 all-pairs 비교 없이 수백만 서열도 CPU 로 처리 가능.
+"""
+
+import os
+import logging
+
+import numpy as np
+import pandas as pd
+from tqdm import tqdm
+
+from backend.config import Config
+from backend.pipeline.similarity_engine import write_pairs_csv
+
+logger = logging.getLogger("kmer_similarity")
+
+RAW_DATA_ROOT = Config.RAW_DATA_ROOT
+PROTEIN_CSV = RAW_DATA_ROOT / "proteins.csv"
+KMER_SIM_OUTPUT = RAW_DATA_ROOT / "protein_similarity_kmer.csv"
+
+KMER_K = int(os.getenv("KMER_K", "4"))
+KMER_NUM_PERM = int(os.getenv("KMER_NUM_PERM", "128"))
+KMER_BANDS = int(os.getenv("KMER_BANDS", "64"))
+
+_PRIME = np.int64((1 << 31) - 1)
+_ALPHABET = 26
+# 26^k 가 int64 안에 들어가는 최대 k
+_MAX_K = 13
+
+if not 1 <= KMER_K <= _MAX_K:
+    raise ValueError(f"❌ KMER_K must be in [1, {_MAX_K}] (got {KMER_K})")
+
+
+# -------------------------------------------------------
+# 1) k-mer shingling
+# -------------------------------------------------------
+def kmer_codes(seq: str, k: int = KMER_K) -> np.ndarray:
+    """서열 → 고유 k-mer 정수 코드 배열 (A–Z 를 base-26 숫자로 인코딩)"""
+    if not 1 <= k <= _MAX_K:
+        raise ValueError(f"❌ k must be in [1, {_MAX_K}] (got {k})")
+    s = "".join(ch for ch in seq.upper() if "A" <= ch <= "Z")
+    if len(s) < k:
+        return np.empty(0, dtype=np.int64)
+
+    arr = np.frombuffer(s.encode("ascii"), dtype=np.uint8).astype(np.int64) - ord("A")
+    windows = np.lib.stride_tricks.sliding_window_view(arr, k)
+    weights = _ALPHABET ** np.arange(k - 1, -1, -1, dtype=np.int64)
+    return np.unique(windows @ weights)
+
+
+# -------------------------------------------------------
+# 2) MinHash
+# -------------------------------------------------------
+class MinHasher:
+    """h_i(x) = (a_i · x + b_i) mod p 로 num_perm 개 min-hash 계산"""
+
+    def __init__(self, num_perm: int = KMER_NUM_PERM, seed: int = 1):
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self.a = rng.integers(1, _PRIME, size=num_perm, dtype=np.int64)
+        self.b = rng.integers(0, _PRIME, size=num_perm, dtype=np.int64)
+
+    def signature(self, codes: np.ndarray) -> np.ndarray:
+        if not len(codes):
+            # 빈 서열: 최대값으로 채우고 LSH 단계에서 bucket 매칭에서 제외
+            return np.full(self.num_perm, _PRIME, dtype=np.int64)
+        # 코드를 먼저 mod p 로 줄이면 x < 2^31, a < 2^31 → a·x + b < 2^63 으로 k 와 무관하게 overflow 없음
+        codes = codes % _PRIME
+        h = (self.a[:, None] * codes[None, :] + self.b[:, None]) % _PRIME
+        return h.min(axis=1)
+
+
+def build_signatures(seqs, k: int = KMER_K, num_perm: int = KMER_NUM_PERM, seed: int = 1) -> np.ndarray:
+    hasher = MinHasher(num_perm, seed)
+    sigs = np.empty((len(seqs), num_perm), dtype=np.int64)
+    for i, seq in enumerate(tqdm(seqs, desc="MinHash")):
+        sigs[i] = hasher.signature(kmer_codes(seq, k))
+    return sigs
+
+
+# -------------------------------------------------------
+# 3) LSH banding → candidate pairs
+# -------------------------------------------------------
+def lsh_candidate_pairs(sigs: np.ndarray, bands: int = KMER_BANDS, max_bucket: int = 1000) -> np.ndarray:
+    """
+    band 별로 signature 조각을 hash 해서 같은 bucket 인 쌍을 후보로 반환.
+    max_bucket 보다 큰 bucket (저복잡도 서열 등) 은 무시.
+
+    반환: (M×2) int64, i < j, 중복 제거
+    """
+    n, num_perm = sigs.shape
+    if num_perm % bands:
+        raise ValueError(f"❌ num_perm ({num_perm}) must be divisible by bands ({bands})")
+    rows = num_perm // bands
+
+    empty = (sigs == _PRIME).all(axis=1)
+    mult = np.uint64(0x9E3779B97F4A7C15)
+
+    chunks = []
+    for b in range(bands):
+        band = sigs[:, b * rows:(b + 1) * rows].astype(np.uint64)
+        key = np.zeros(n, dtype=np.uint64)
+        for c in range(rows):
+            key = (key ^ band[:, c]) * mult
+        key[empty] = np.arange(empty.sum(), dtype=np.uint64) ^ np.uint64(0xFFFFFFFFFFFFFFFF)
+
+        order = np.argsort(key, kind="stable")
+        sorted_key = key[order]
+        bounds = np.flatnonzero(np.diff(sorted_key)) + 1
+        starts = np.concatenate([[0], bounds])
+        ends = np.concatenate([bounds, [n]])
+
+        # 크기 2 이상인 bucket 만 순회
+        sizes = ends - starts
+        multi = np.flatnonzero((sizes >= 2) & (sizes <= max_bucket))
+        for g in multi:
+            members = np.sort(order[starts[g]:ends[g]])
+            ii, jj = np.triu_indices(sizes[g], k=1)
+            # (i, j) → i·n + j 로 인코딩해서 band 간 중복 제거
+            chunks.append(members[ii] * n + members[jj])
+
+    if not chunks:
+        return np.empty((0, 2), dtype=np.int64)
+
+    keys = np.unique(np.concatenate(chunks))
+    return np.stack([keys // n, keys % n], axis=1)
+
+
+# -------------------------------------------------------
+# 4) Scoring + top-k
+# -------------------------------------------------------
+def score_pairs(sigs: np.ndarray, pairs: np.ndarray, chunk: int = 200_000) -> np.ndarray:
+    """signature 일치율 = Jaccard(k-mer set) 추정치"""
+    scores = np.empty(len(pairs), dtype=np.float32)
+    for s in range(0, len(pairs), chunk):
+        p = pairs[s:s + chunk]
+        scores[s:s + chunk] = (sigs[p[:, 0]] == sigs[p[:, 1]]).mean(axis=1)
+    return scores
+
+
+def topk_per_source(pairs: np.ndarray, scores: np.ndarray, top_k: int, min_score: float):
+    """대칭 쌍 → (src, tgt, score) 단백질별 top-k, src 순서 / 점수 내림차순"""
+    keep = scores >= min_score
+    pairs, scores = pairs[keep], scores[keep]
+
+    src = np.concatenate([pairs[:, 0], pairs[:, 1]])
+    tgt = np.concatenate([pairs[:, 1], pairs[:, 0]])
+    sc = np.concatenate([scores, scores])
+
+    order = np.lexsort((-sc, src))
+    src, tgt, sc = src[order], tgt[order], sc[order]
+
+    if not len(src):
+        return src, tgt, sc
+
+    group_start = np.concatenate([[0], np.flatnonzero(np.diff(src)) + 1])
+    rank = np.arange(len(src)) - np.repeat(group_start, np.diff(np.concatenate([group_start, [len(src)]])))
+    sel = rank < top_k
+    return src[sel], tgt[sel], sc[sel]
+
+
+# -------------------------------------------------------
+# Main Builder function
+# -------------------------------------------------------
+def build_kmer_similarity(
+    protein_csv=PROTEIN_CSV,
+    out_csv=KMER_SIM_OUTPUT,
+    k: int = KMER_K,
+    num_perm: int = KMER_NUM_PERM,
+    bands: int = KMER_BANDS,
+    top_k_per_protein: int = 20,
+    min_score: float = 0.2,
+    max_bucket: int = 1000,
+):
+    print("\n===============================================")
+    print("🧩 Building k-mer MinHash/LSH Similarity (SIMILAR_TO, method=kmer)")
+    print("===============================================")
+
+    df = pd.read_csv(protein_csv)
+    if "uniprot_id" not in df.columns or "sequence" not in df.columns:
+        raise ValueError("❌ CSV must contain 'uniprot_id' and 'sequence' columns.")
+
+    df = df.drop_duplicates(subset=["uniprot_id"])
+    ids = df["uniprot_id"].astype(str).tolist()
+    seqs = df["sequence"].fillna("").astype(str).tolist()
+
+    print(f"🔎 Loaded {len(ids)} sequences (k={k}, num_perm={num_perm}, bands={bands})")
+
+    sigs = build_signatures(seqs, k=k, num_perm=num_perm)
+
+    pairs = lsh_candidate_pairs(sigs, bands=bands, max_bucket=max_bucket)
+    print(f"🪣 LSH candidate pairs: {len(pairs)}")
+
+    scores = score_pairs(sigs, pairs)
+    src, tgt, sc = topk_per_source(pairs, scores, top_k_per_protein, min_score)
+
+    print(f"💾 Writing CSV → {out_csv}")
+    n_rows = write_pairs_csv(
+        out_csv,
+        ["src_uniprot_id", "tgt_uniprot_id", "sim_score", "method"],
+        ((ids[i], ids[j], float(s)) for i, j, s in zip(src, tgt, sc)),
+        method="kmer",
+        float_fmt="{:.4f}",
+    )
+
+    print(f"🎉 Done: {n_rows} k-mer SIMILAR_TO edges generated.\n")
+    return out_csv
+
+
+if __name__ == "__main__":
+    build_kmer_similarity()
@@ -1,7 +1,8 @@
 #backend/pipeline/protein_embeddings_builder.py
 
 import os
-import json
+import csv
+import hashlib
 import torch
 import pandas as pd
 import numpy as np
@@ -11,7 +12,23 @@ from dotenv import load_dotenv
 from sentence_transformers import SentenceTransformer
 import chromadb
 
-from backend.config import RAW_DATA_ROOT, PROCESSED_DATA_ROOT
+from backend.config import RAW_DATA_ROOT
+from backend.pipeline.embedding_store import (
+    EMBED_STORE,
+    embedding_fingerprint,
+    save_embedding_store,
+    load_embedding_store,
+    load_embedding_index,
+)
+from backend.pipeline.similarity_engine import (
+    SIM_MAX_MEMORY_MB,
+    iter_topk,
+    iter_topk_pairs,
+    topk_against,
+    write_pairs_csv,
+)
+from backend.pipeline.ann_index import ANN_NPROBE, get_or_build_index
+from backend.pipeline.quantization import QUANT_MODES, get_or_build_quantized
 
 # =============================================================================
 # 0) 환경 설정
@@ -20,12 +37,15 @@ BASE_DIR = Path(__file__).resolve().parents[2]
 ENV_PATH = BASE_DIR / ".env"
 load_dotenv(ENV_PATH)
 
-# JSONL (processed)
-EMBED_OUTPUT = PROCESSED_DATA_ROOT / "protein_embeddings.jsonl"
+# float32 .npy + id index (processed)
+EMBED_OUTPUT = EMBED_STORE
 
 # similarity.csv → RAW (Neo4j builder가 RAW에서 찾기 때문)
 SIM_OUTPUT = RAW_DATA_ROOT / "protein_similarity.csv"
 
+# 증분 실행 시 Neo4j 에 적용할 SIMILAR_TO add/remove delta
+SIM_DELTA_OUTPUT = RAW_DATA_ROOT / "protein_similarity_delta.csv"
+
 # ChromaDB 저장 위치
 VECTORDB_PATH = BASE_DIR / "data" / "vectordb" / "proteins"
 VECTORDB_PATH.mkdir(parents=True, exist_ok=True)
@@ -33,6 +53,12 @@ VECTORDB_PATH.mkdir(parents=True, exist_ok=True)
 # Proteins CSV (RAW)
 PROTEIN_CSV = RAW_DATA_ROOT / "proteins.csv"
 
+# ChromaDB upsert / 조회 chunk 크기
+CHROMA_CHUNK_SIZE = int(os.getenv("CHROMA_CHUNK_SIZE", "1000"))
+
+# 배치 임베딩: padded batch 하나당 최대 토큰 수 (batch_size × 최장 서열 길이)
+EMBED_BATCH_TOKENS = int(os.getenv("EMBED_BATCH_TOKENS", "16384"))
+
 
 # =============================================================================
 # 1) GPU 자동 탐지
@@ -44,15 +70,198 @@ def get_device():
 # =============================================================================
 # 2) ESM2 기반 단백질 임베딩
 # =============================================================================
+EMBED_MODEL_NAME = "facebook/esm2_t6_8M_UR50D"
+
+
 def load_embedding_model():
     print("🔬 Loading ESM2 embedding model...")
-    model_name = "facebook/esm2_t6_8M_UR50D"
+    model_name = EMBED_MODEL_NAME
     model = SentenceTransformer(model_name, device=get_device())
     print(f"✅ Loaded model: {model_name}")
     return model
 
 
-def generate_protein_embeddings():
+def _token_length(seq: str, max_seq_length: int | None = None) -> int:
+    """ESM2 토큰 길이 (<cls> + residues + <eos>), 모델 최대 길이에서 잘림"""
+    n = len(seq) + 2
+    if max_seq_length:
+        n = min(n, max_seq_length)
+    return n
+
+
+def length_buckets(seqs, max_tokens_per_batch: int, max_seq_length: int | None = None):
+    """
+    서열을 길이순으로 정렬한 뒤, padded batch 크기
+    (배치 내 최장 토큰 길이 × 배치 크기)가 max_tokens_per_batch 를
+    넘지 않도록 묶어서 원본 index 리스트를 yield 한다.
+
+    - 비슷한 길이끼리 묶이므로 padding 낭비가 적음
+    - 한 배치의 메모리 사용량이 토큰 예산으로 제한됨
+    - 예산보다 긴 단일 서열은 혼자 하나의 배치가 됨
+    """
+    lengths = [_token_length(s, max_seq_length) for s in seqs]
+    order = sorted(range(len(seqs)), key=lambda i: lengths[i])
+
+    batch = []
+    batch_max = 0
+    for i in order:
+        new_max = max(batch_max, lengths[i])
+        if batch and new_max * (len(batch) + 1) > max_tokens_per_batch:
+            yield batch
+            batch, new_max = [], lengths[i]
+        batch.append(i)
+        batch_max = new_max
+
+    if batch:
+        yield batch
+
+
+def encode_sequences(model, seqs, max_tokens_per_batch: int | None = EMBED_BATCH_TOKENS) -> np.ndarray:
+    """
+    길이 bucket 단위로 model.encode 를 호출하고, 결과를 입력 순서대로 반환.
+    max_tokens_per_batch=None 이면 서열 하나씩 encode (기존 per-row 방식).
+    """
+    if max_tokens_per_batch is None:
+        buckets = ([i] for i in range(len(seqs)))
+    else:
+        max_seq_length = getattr(model, "max_seq_length", None)
+        buckets = length_buckets(seqs, max_tokens_per_batch, max_seq_length)
+
+    out = None
+    with tqdm(total=len(seqs)) as pbar:
+        for idx in buckets:
+            embs = model.encode(
+                [seqs[i] for i in idx],
+                batch_size=len(idx),
+                convert_to_numpy=True,
+                show_progress_bar=False,
+            )
+            if out is None:
+                out = np.empty((len(seqs), embs.shape[1]), dtype=embs.dtype)
+            out[idx] = embs
+            pbar.update(len(idx))
+
+    if out is None:
+        return np.empty((0, 0), dtype=np.float32)
+    return out
+
+
+def sequence_hash(uniprot_id: str, sequence: str, model_name: str = EMBED_MODEL_NAME) -> str:
+    """(model, uniprot_id, sequence) content hash — 임베딩 재사용 여부 판단용"""
+    h = hashlib.sha256()
+    for part in (model_name, uniprot_id, sequence):
+        h.update(part.encode("utf-8"))
+        h.update(b"\x1f")
+    return h.hexdigest()
+
+
+def _load_previous_embeddings(store_path=EMBED_OUTPUT):
+    """
+    이전 실행의 store 를 {uniprot_id: (row, hash)} 와 matrix 로 로드.
+    store 가 없거나 hash 정보가 없으면 (None, None).
+    """
+    if not store_path.exists():
+        return None, None
+
+    try:
+        index = load_embedding_index(store_path)
+        prev_ids, prev_matrix = load_embedding_store(store_path)
+    except Exception as e:
+        print(f"⚠️ Previous embedding store unreadable, re-embedding all: {e}")
+        return None, None
+
+    prev_hashes = index.get("hashes")
+    if index.get("model") != EMBED_MODEL_NAME or not prev_hashes or len(prev_hashes) != len(prev_ids):
+        return None, None
+
+    prev = {pid: (i, h) for i, (pid, h) in enumerate(zip(prev_ids, prev_hashes))}
+    return prev, prev_matrix
+
+
+def embed_to_store(
+    ids,
+    seqs,
+    store_path,
+    max_tokens_per_batch: int | None = EMBED_BATCH_TOKENS,
+    incremental: bool = True,
+):
+    """
+    (ids, seqs) → embedding store (store_path).
+
+    incremental=True 이면 이전 store 의 (model, uniprot_id, sequence) hash 가 같은
+    행은 기존 벡터를 재사용하고, 신규/변경된 서열만 모델로 임베딩한다.
+    ids 에서 사라진 행의 벡터는 store 에서 제거된다.
+
+    반환: (embeddings, hashes, delta)
+      delta = {"changed": [...], "removed": [...], "full": bool}
+    """
+    hashes = [sequence_hash(pid, seq) for pid, seq in zip(ids, seqs)]
+
+    prev, prev_matrix = _load_previous_embeddings(store_path) if incremental else (None, None)
+
+    # 재사용 가능한 벡터 / 새로 임베딩할 index 분리
+    reuse = {}
+    todo = []
+    for i, (pid, h) in enumerate(zip(ids, hashes)):
+        hit = prev.get(pid) if prev else None
+        if hit is not None and hit[1] == h:
+            reuse[i] = hit[0]
+        else:
+            todo.append(i)
+
+    current = set(ids)
+    removed = [pid for pid in prev if pid not in current] if prev else []
+
+    print(f"🔁 Reused: {len(reuse)}  🆕 To embed: {len(todo)}  🗑️ Removed: {len(removed)}")
+
+    new_embs = None
+    if todo:
+        model = load_embedding_model()
+        if max_tokens_per_batch is None:
+            print("⚙️ Generating embeddings (per-row)...")
+        else:
+            print(f"⚙️ Generating embeddings (length-bucketed, {max_tokens_per_batch} tokens/batch)...")
+        new_embs = encode_sequences(model, [seqs[i] for i in todo], max_tokens_per_batch)
+
+    if new_embs is not None:
+        dim = new_embs.shape[1]
+    else:
+        dim = prev_matrix.shape[1] if prev_matrix is not None else 0
+    embeddings = np.empty((len(ids), dim), dtype=np.float32)
+    if reuse:
+        dst = np.fromiter(reuse.keys(), dtype=np.int64, count=len(reuse))
+        src = np.fromiter(reuse.values(), dtype=np.int64, count=len(reuse))
+        embeddings[dst] = prev_matrix[src]
+    if todo:
+        embeddings[todo] = new_embs
+
+    # 입력 순서 그대로 저장 (float32 matrix + id index + hash)
+    save_embedding_store(
+        store_path,
+        ids,
+        embeddings,
+        meta={"model": EMBED_MODEL_NAME, "hashes": hashes},
+    )
+
+    print(f"✅ Embeddings saved to: {store_path}")
+
+    delta = {
+        "changed": [ids[i] for i in todo],
+        "removed": removed,
+        "full": prev is None,
+    }
+    return embeddings, hashes, delta
+
+
+def generate_protein_embeddings(
+    max_tokens_per_batch: int | None = EMBED_BATCH_TOKENS,
+    incremental: bool = True,
+):
+    """
+    proteins.csv → embedding store (embed_to_store 참고).
+
+    반환: (ids, embeddings, delta)
+    """
     print(f"📄 Loading protein list: {PROTEIN_CSV}")
     df = pd.read_csv(PROTEIN_CSV)
 
@@ -67,130 +276,334 @@ def generate_protein_embeddings():
     if "uniprot_id" not in df.columns or "sequence" not in df.columns:
         raise ValueError("❌ CSV must contain 'uniprot_id' and 'sequence' columns.")
 
-    model = load_embedding_model()
-    embeddings = []
-    ids = []
-
-    # JSONL 초기화
-    if EMBED_OUTPUT.exists():
-        EMBED_OUTPUT.unlink()
-
-    print("⚙️ Generating embeddings...")
-    with open(EMBED_OUTPUT, "w", encoding="utf-8") as f:
-        for _, row in tqdm(df.iterrows(), total=len(df)):
-            seq = row["sequence"]
-            pid = row["uniprot_id"]
-
-            emb = model.encode(seq, convert_to_numpy=True)
-            embeddings.append(emb)
-            ids.append(pid)
+    ids = df["uniprot_id"].tolist()
+    seqs = df["sequence"].fillna("").astype(str).tolist()
 
-            f.write(json.dumps({"id": pid, "embedding": emb.tolist()}) + "\n")
-
-    print(f"✅ Embeddings saved to: {EMBED_OUTPUT}")
-    return ids, np.vstack(embeddings)
+    embeddings, _, delta = embed_to_store(
+        ids,
+        seqs,
+        EMBED_OUTPUT,
+        max_tokens_per_batch=max_tokens_per_batch,
+        incremental=incremental,
+    )
+    return ids, embeddings, delta
 
 
 # =============================================================================
 # 3) ChromaDB 저장
 # =============================================================================
-def save_to_chroma(ids, vectors):
-    print(f"🗄️ Saving embeddings to ChromaDB: {VECTORDB_PATH}")
-
-    # 🛠️ 중복 ID 완전 제거
-    if len(ids) != len(set(ids)):
+def _existing_chroma_hashes(collection, page_size):
+    """collection 에 저장된 {id: seq_hash} (page 단위 조회)"""
+    existing = {}
+    offset = 0
+    while True:
+        page = collection.get(include=["metadatas"], limit=page_size, offset=offset)
+        page_ids = page["ids"]
+        if not page_ids:
+            break
+        for pid, meta in zip(page_ids, page["metadatas"] or [None] * len(page_ids)):
+            existing[pid] = (meta or {}).get("seq_hash")
+        offset += len(page_ids)
+    return existing
+
+
+def save_to_chroma(
+    ids,
+    vectors,
+    hashes=None,
+    chunk_size=CHROMA_CHUNK_SIZE,
+    vectordb_path=VECTORDB_PATH,
+    collection_name="proteins",
+):
+    """
+    collection 을 지우지 않고 chunk 단위로 upsert (갱신 중에도 읽기 가능).
+
+    - hashes (sequence hash) 가 주어지면 collection 에 같은 seq_hash 로
+      저장된 id 는 건너뜀 → 변경된 벡터만 전송
+    - 현재 ids 에 없는 id 는 collection 에서 삭제
+    - 벡터 → list 변환은 chunk 별로만 수행 (메모리 피크 = chunk_size)
+    """
+    print(f"🗄️ Saving embeddings to ChromaDB: {vectordb_path} ({collection_name})")
+
+    # 🛠️ 중복 ID 제거 (첫 번째 row 유지)
+    seen = set()
+    rows = []
+    for i, pid in enumerate(ids):
+        if pid not in seen:
+            seen.add(pid)
+            rows.append(i)
+    if len(rows) != len(ids):
         print("⚠️ Fixing duplicate IDs before saving to ChromaDB...")
-        unique = {}
-        for i, pid in enumerate(ids):
-            if pid not in unique:
-                unique[pid] = vectors[i]
-
-        ids = list(unique.keys())
-        vectors = np.vstack(list(unique.values()))
 
     # ChromaDB 클라이언트 초기화
-    client = chromadb.PersistentClient(path=str(VECTORDB_PATH))
-
-    # 기존 collection 삭제
-    try:
-        client.delete_collection("proteins")
-    except Exception:
-        pass
-
-    collection = client.create_collection(
-        name="proteins",
+    client = chromadb.PersistentClient(path=str(vectordb_path))
+    collection = client.get_or_create_collection(
+        name=collection_name,
         embedding_function=None
     )
 
-    collection.add(
-        ids=ids,
-        embeddings=[v.tolist() for v in vectors],
-        metadatas=[{"uniprot_id": pid} for pid in ids]
+    existing = _existing_chroma_hashes(collection, chunk_size)
+
+    # 변경 없는 id 건너뛰기
+    if hashes is not None:
+        todo = [i for i in rows if existing.get(ids[i]) != hashes[i]]
+    else:
+        todo = rows
+
+    for s in tqdm(range(0, len(todo), chunk_size), desc="Chroma upsert"):
+        chunk = todo[s:s + chunk_size]
+        metas = []
+        for i in chunk:
+            meta = {"uniprot_id": ids[i]}
+            if hashes is not None:
+                meta["seq_hash"] = hashes[i]
+            metas.append(meta)
+
+        collection.upsert(
+            ids=[ids[i] for i in chunk],
+            embeddings=np.asarray(vectors[chunk], dtype=np.float32).tolist(),
+            metadatas=metas
+        )
+
+    # 제거된 단백질 삭제
+    stale = [pid for pid in existing if pid not in seen]
+    for s in range(0, len(stale), chunk_size):
+        collection.delete(ids=stale[s:s + chunk_size])
+
+    print(
+        f"✅ ChromaDB 저장 완료 (upsert={len(todo)}, "
+        f"unchanged={len(rows) - len(todo)}, delete={len(stale)})"
     )
-
-    print("✅ ChromaDB 저장 완료")
     return collection
 
 
 # =============================================================================
 # 4) Protein similarity matrix 생성
 # =============================================================================
-def build_protein_similarity(top_k_per_protein=20, min_score=0.7):
-    print("📐 Computing protein similarity matrix...")
-
-    # JSONL에서 로드
-    ids = []
-    vectors = []
-
-    with open(EMBED_OUTPUT, "r", encoding="utf-8") as f:
-        for line in f:
-            obj = json.loads(line)
-            ids.append(obj["id"])
-            vectors.append(np.array(obj["embedding"]))
-
-    vectors = np.vstack(vectors)
-
-    # 정규화
-    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
-    vectors_norm = vectors / norms
-
-    # cosine similarity
-    sim_matrix = np.dot(vectors_norm, vectors_norm.T)
+def build_protein_similarity(
+    top_k_per_protein=20,
+    min_score=0.7,
+    max_memory_mb=SIM_MAX_MEMORY_MB,
+    n_jobs=1,
+    index="exact",
+    nprobe=ANN_NPROBE,
+    pca_dim=None,
+    rerank_factor=4,
+):
+    """
+    Tiled top-k cosine similarity → protein_similarity.csv
+
+    index="exact": N×N 행렬 없이 query block 단위로 계산하며,
+                   block 하나의 메모리는 max_memory_mb 로 제한된다.
+                   n_jobs > 1 이면 block 을 여러 프로세스로 나눠 계산.
+    index="ivf"  : Config.VECTORDB_PROTEIN 의 IVF-flat ANN index 로 근사 top-k
+                   (nprobe 로 recall/속도 조절, ann_index.recall_report 참고)
+    index="int8" | "float16":
+                   양자화 code (선택적으로 PCA pca_dim) 로 후보 검색 후
+                   full-precision 벡터로 exact 재정렬 (quantization.recall_report 참고)
+    """
+    print(f"📐 Computing protein similarity (top-k, index={index})...")
+
+    # embedding store 에서 memmap 으로 로드 (JSON 파싱 없음)
+    ids, vectors = load_embedding_store(EMBED_OUTPUT)
+
+    if index == "ivf":
+        ann = get_or_build_index(ids, vectors, nprobe=nprobe, fingerprint=embedding_fingerprint(EMBED_OUTPUT))
+        blocks = ann.iter_topk(vectors, top_k=top_k_per_protein)
+    elif index in QUANT_MODES:
+        quant = get_or_build_quantized(
+            ids, vectors, mode=index, pca_dim=pca_dim, rerank_factor=rerank_factor,
+            fingerprint=embedding_fingerprint(EMBED_OUTPUT),
+        )
+        blocks = quant.iter_topk(vectors, top_k=top_k_per_protein, max_memory_mb=max_memory_mb)
+    elif index == "exact":
+        blocks = iter_topk(
+            vectors,
+            top_k=top_k_per_protein,
+            max_memory_mb=max_memory_mb,
+            n_jobs=n_jobs,
+        )
+    else:
+        raise ValueError(f"❌ Unknown similarity index: {index}")
 
-    rows = []
     print("✨ Selecting top similar proteins...")
 
-    for i, pid in enumerate(ids):
-        sims = sim_matrix[i]
-        sims[i] = -1  # 자기 자신 제외
-
-        top_idx = sims.argsort()[::-1][:top_k_per_protein]
+    # block 이 끝날 때마다 바로 기록
+    n_rows = write_pairs_csv(
+        SIM_OUTPUT,
+        ["source_uniprot", "target_uniprot", "similarity"],
+        iter_topk_pairs(ids, blocks, min_score),
+    )
 
-        for j in top_idx:
-            score = sims[j]
-            if score < min_score:
+    print(f"✅ Protein similarity saved: {SIM_OUTPUT} ({n_rows} edges)")
+
+    return pd.read_csv(SIM_OUTPUT)
+
+
+def _read_similarity_csv(path):
+    """protein_similarity.csv → {source: [(target, score), ...]}"""
+    edges = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            edges.setdefault(row["source_uniprot"], []).append(
+                (row["target_uniprot"], float(row["similarity"]))
+            )
+    return edges
+
+
+def _read_similarity_delta(path):
+    """protein_similarity_delta.csv → {(source, target): (similarity, op)}"""
+    ops = {}
+    if not path.exists():
+        return ops
+    with open(path, "r", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            ops[(row["source_uniprot"], row["target_uniprot"])] = (row["similarity"], row["op"])
+    return ops
+
+
+def update_protein_similarity(
+    delta,
+    top_k_per_protein=20,
+    min_score=0.7,
+    max_memory_mb=SIM_MAX_MEMORY_MB,
+    n_jobs=1,
+):
+    """
+    증분 SIMILAR_TO 갱신 (O(ΔN·N)).
+
+      1) 신규/변경 단백질 → 전체 corpus 대상 top-k 새로 계산
+      2) 기존 단백질 → 신규/변경 단백질과의 점수만 계산해서 기존 top-k 와 병합
+         (top-k 에서 제거/변경된 단백질이 빠진 경우는 해당 행만 다시 계산)
+      3) 이전 protein_similarity.csv 와 비교해 add/remove delta 기록
+         → protein_similarity_delta.csv (op = add | remove)
+         Neo4j 에 아직 적용되지 않은 이전 delta 가 남아 있으면 병합 (같은 edge 는 최신 op 가 우선).
+
+    이전 결과가 없거나 delta 가 full 이면 build_protein_similarity() 로 전체 계산.
+
+    반환: Neo4j 에 적용할 delta 파일 경로, 전체 계산이면 None (graph step 에서 전체 로드).
+    """
+    if delta is None or delta.get("full") or not SIM_OUTPUT.exists():
+        if SIM_DELTA_OUTPUT.exists():
+            print(f"⚠️ Discarding unapplied delta {SIM_DELTA_OUTPUT} (full rebuild → graph step 에서 전체 로드 필요)")
+            SIM_DELTA_OUTPUT.unlink()
+        build_protein_similarity(
+            top_k_per_protein=top_k_per_protein,
+            min_score=min_score,
+            max_memory_mb=max_memory_mb,
+            n_jobs=n_jobs,
+        )
+        return None
+
+    print("📐 Updating protein similarity incrementally...")
+
+    ids, vectors = load_embedding_store(EMBED_OUTPUT)
+    pos = {pid: i for i, pid in enumerate(ids)}
+
+    changed = {pid for pid in delta.get("changed", []) if pid in pos}
+    stale = changed | set(delta.get("removed", []))
+
+    old = _read_similarity_csv(SIM_OUTPUT)
+
+    # 변경/제거된 단백질이 들어 있던 edge 제거
+    kept = {}
+    deficient = set()
+    for src, lst in old.items():
+        if src in stale or src not in pos:
+            continue
+        remaining = [(t, sc) for t, sc in lst if t not in stale]
+        if len(remaining) < len(lst):
+            deficient.add(src)
+        kept[src] = remaining
+
+    # 1) 신규/변경 + top-k 가 비게 된 단백질: 전체 대상 재계산
+    requery = sorted(pos[pid] for pid in changed | deficient)
+    fresh = {ids[i]: [] for i in requery}
+    if requery:
+        blocks = iter_topk(
+            vectors,
+            top_k=top_k_per_protein,
+            query_indices=requery,
+            max_memory_mb=max_memory_mb,
+            n_jobs=n_jobs,
+        )
+        for src, tgt, score in iter_topk_pairs(ids, blocks, min_score):
+            fresh[src].append((tgt, score))
+
+    # 2) 나머지 기존 단백질: 신규/변경 단백질이 top-k 에 들어오면 병합
+    if changed:
+        nb_idx, nb_scores = topk_against(
+            vectors,
+            sorted(pos[pid] for pid in changed),
+            top_k=top_k_per_protein,
+            max_memory_mb=max_memory_mb,
+        )
+        for j, pid in enumerate(ids):
+            if pid in fresh:
                 continue
+            extra = [
+                (ids[t], float(sc))
+                for t, sc in zip(nb_idx[j], nb_scores[j])
+                if t >= 0 and sc >= min_score
+            ]
+            if extra:
+                merged = sorted(kept.get(pid, []) + extra, key=lambda x: x[1], reverse=True)
+                fresh[pid] = merged[:top_k_per_protein]
+
+    current = {**kept, **fresh}
+
+    # 3) add / remove delta
+    old_edges = {(s_, t): sc for s_, lst in old.items() for t, sc in lst}
+    new_edges = {(s_, t): sc for s_, lst in current.items() for t, sc in lst}
+
+    adds = [(k, sc) for k, sc in new_edges.items() if k not in old_edges or abs(old_edges[k] - sc) > 1e-6]
+    removes = [k for k in old_edges if k not in new_edges]
+
+    write_pairs_csv(
+        SIM_OUTPUT,
+        ["source_uniprot", "target_uniprot", "similarity"],
+        ((pid, t, sc) for pid in ids for t, sc in current.get(pid, [])),
+    )
 
-            rows.append({
-                "source_uniprot": pid,
-                "target_uniprot": ids[j],
-                "similarity": float(score)
-            })
-
-    df_sim = pd.DataFrame(rows)
-    df_sim.to_csv(SIM_OUTPUT, index=False)
-    print(f"✅ Protein similarity saved: {SIM_OUTPUT}")
-
-    return df_sim
+    # 적용 안 된 이전 delta 위에 이번 delta 를 덮어씀 (remove 먼저 적용되므로 파일 안 순서는 무관)
+    ops = _read_similarity_delta(SIM_DELTA_OUTPUT)
+    pending = len(ops)
+    for key, sc in adds:
+        ops[key] = (sc, "add")
+    for key in removes:
+        ops[key] = ("", "remove")
+
+    tmp = SIM_DELTA_OUTPUT.with_name(SIM_DELTA_OUTPUT.name + ".tmp")
+    with open(tmp, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(["source_uniprot", "target_uniprot", "similarity", "op"])
+        for (src, tgt), (sc, op) in ops.items():
+            w.writerow([src, tgt, sc, op])
+    tmp.replace(SIM_DELTA_OUTPUT)
+
+    print(
+        f"✅ Protein similarity updated: requeried={len(requery)}, "
+        f"+{len(adds)} / -{len(removes)} edges → {SIM_DELTA_OUTPUT}"
+        + (f" (merged with {pending} unapplied ops)" if pending else "")
+    )
+    return SIM_DELTA_OUTPUT
 
 
 # =============================================================================
 # 5) 전체 파이프라인 실행
 # =============================================================================
+def build_search_index(nprobe=ANN_NPROBE):
+    """/protein/similar (index="ivf") 가 쓰는 IVF-flat index 를 offline 으로 빌드 (embedding 이 같으면 재사용)"""
+    ids, vectors = load_embedding_store(EMBED_OUTPUT)
+    return get_or_build_index(ids, vectors, nprobe=nprobe, fingerprint=embedding_fingerprint(EMBED_OUTPUT))
+
+
 def run_all():
-    ids, vectors = generate_protein_embeddings()
-    save_to_chroma(ids, vectors)
-    build_protein_similarity()
+    ids, vectors, delta = generate_protein_embeddings()
+    hashes = load_embedding_index(EMBED_OUTPUT).get("hashes")
+    save_to_chroma(ids, vectors, hashes)
+    update_protein_similarity(delta)
+    build_search_index()
     print("🎉 Protein embedding pipeline completed.")
 
 
@@ -0,0 +1,158 @@
+# backend/pipeline/protein_search.py
+
+"""
+Sequence → nearest known proteins (online similarity search)
+
+임의의 아미노산 서열을 protein_embeddings_builder 와 같은 ESM2 모델로 임베딩하고,
+protein embedding store (또는 IVF-flat ANN index) 에서 cosine top-k 를 반환한다.
+
+Cross-label 검색 (그래프 SIMILAR_TO 탐색 없이 embedding 으로 직접):
+    nearest_therapeutics_for_protein()  Protein → 가까운 TherapeuticProtein
+    nearest_proteins_for_therapeutic()  TherapeuticProtein → 가까운 Protein
+
+- ESM2 embedding 모델과 정규화된 embedding matrix 는 프로세스에 상주 (요청마다 재로드 없음)
+- embedding store 파일이 갱신되면 다음 요청에서 자동으로 다시 읽음
+"""
+
+import time
+import logging
+from typing import Dict, List
+
+import numpy as np
+
+from backend.pipeline.embedding_store import EMBED_STORE, TP_EMBED_STORE, embedding_fingerprint, load_embedding_store
+from backend.pipeline.similarity_engine import normalize_rows, topk_block
+from backend.pipeline.ann_index import ANN_NPROBE, load_current_index
+from backend.utils.model_cache import get_model_cache
+
+logger = logging.getLogger("protein_search")
+
+# ---------------------------------------------------
+# Global caches (모델 / corpus 는 한 번만 로드)
+# ---------------------------------------------------
+_EMBED_MODEL = None
+_CORPORA = {}  # store path → (store mtime, ids, normalized matrix, {id: row})
+_ANN = None
+
+
+class IndexUnavailable(RuntimeError):
+    """요청한 검색 index 가 아직 (현재 embedding 기준으로) 빌드되지 않음"""
+
+
+def load_search_model_once():
+    """protein_embeddings_builder 와 동일한 ESM2 SentenceTransformer 를 한 번만 로드"""
+    global _EMBED_MODEL
+    if _EMBED_MODEL is None:
+        from backend.pipeline.protein_embeddings_builder import load_embedding_model
+
+        logger.info("[ProteinSearch] Loading ESM2 embedding model (lazy)...")
+        _EMBED_MODEL = load_embedding_model()
+    return _EMBED_MODEL
+
+
+def _load_corpus(store_path=EMBED_STORE):
+    global _ANN
+    mtime = store_path.stat().st_mtime if store_path.exists() else None
+
+    cached = _CORPORA.get(store_path)
+    if cached is None or cached[0] != mtime:
+        logger.info(f"[ProteinSearch] Loading embedding store: {store_path}")
+        ids, matrix = load_embedding_store(store_path)
+        cached = (mtime, ids, normalize_rows(matrix), {pid: i for i, pid in enumerate(ids)})
+        _CORPORA[store_path] = cached
+        if store_path == EMBED_STORE:
+            _ANN = None
+
+    return cached[1], cached[2], cached[3]
+
+
+def _clean_sequence(seq: str) -> str:
+    return "".join(seq.split()).upper()
+
+
+def embed_sequence(sequence: str) -> np.ndarray:
+    """(1×D) float32 embedding. model_cache 의 배열을 그대로 돌려주므로 read-only (수정하려면 복사)"""
+    from backend.pipeline.protein_embeddings_builder import EMBED_MODEL_NAME
+
+    # 정규화한 서열로 추론하고 같은 서열로 cache key 생성 (대소문자 / 공백만 다른 입력은 같은 항목)
+    clean = _clean_sequence(sequence)
+
+    def _encode():
+        model = load_search_model_once()
+        emb = model.encode([clean], convert_to_numpy=True, show_progress_bar=False)
+        return np.asarray(emb, dtype=np.float32)
+
+    return get_model_cache().get_or_compute(f"{EMBED_MODEL_NAME}:embedding", clean, _encode)
+
+
+def search_embedding(embedding: np.ndarray, top_k: int = 10, index: str = "exact", nprobe: int = ANN_NPROBE) -> List[Dict]:
+    """이미 계산된 embedding (1×D) 으로 protein store 검색"""
+    global _ANN
+    ids, corpus, _ = _load_corpus()
+    q = normalize_rows(np.atleast_2d(embedding))
+
+    if index == "ivf":
+        # 요청 처리 중에는 학습하지 않음 (offline: python -m backend.pipeline.ann_index)
+        if _ANN is None:
+            _ANN = load_current_index(embedding_fingerprint(EMBED_STORE))
+            if _ANN is None:
+                raise IndexUnavailable("IVF index is not built for the current embeddings")
+        top_idx, top_scores = _ANN.search(q, top_k=top_k, nprobe=nprobe, normalized=True)
+    elif index == "exact":
+        top_idx, top_scores = topk_block(q, corpus, top_k)
+    else:
+        raise ValueError(f"❌ Unknown search index: {index}")
+
+    return [
+        {"rank": r + 1, "uniprot_id": ids[j], "score": float(sc)}
+        for r, (j, sc) in enumerate(zip(top_idx[0], top_scores[0]))
+        if j >= 0
+    ]
+
+
+def search_similar_sequences(sequence: str, top_k: int = 10, index: str = "exact") -> Dict:
+    """
+    입력: 아미노산 서열
+    출력: {"query_length", "hits": [{"rank", "uniprot_id", "score"}], "elapsed_ms"}
+    """
+    t0 = time.time()
+    emb = embed_sequence(sequence)
+    hits = search_embedding(emb, top_k=top_k, index=index)
+
+    return {
+        "query_length": len(_clean_sequence(sequence)),
+        "hits": hits,
+        "elapsed_ms": round(1000 * (time.time() - t0), 2),
+    }
+
+
+# ---------------------------------------------------
+# Cross-label nearest neighbours
+# ---------------------------------------------------
+def _cross_search(query_id: str, query_store, target_store, top_k: int, id_key: str) -> List[Dict]:
+    """store 가 없으면 FileNotFoundError (API 에서 404)"""
+    _, q_matrix, q_pos = _load_corpus(query_store)
+    if query_id not in q_pos:
+        return []
+
+    t_ids, t_matrix, _ = _load_corpus(target_store)
+    q = q_matrix[q_pos[query_id]][None, :]
+
+    # 같은 uniprot_id 가 양쪽에 있으면 자기 자신은 제외
+    top_idx, top_scores = topk_block(q, t_matrix, top_k + 1)
+    hits = [(t_ids[j], float(sc)) for j, sc in zip(top_idx[0], top_scores[0]) if t_ids[j] != query_id]
+
+    return [
+        {"rank": r + 1, id_key: pid, "score": sc}
+        for r, (pid, sc) in enumerate(hits[:top_k])
+    ]
+
+
+def nearest_therapeutics_for_protein(uniprot_id: str, top_k: int = 10) -> List[Dict]:
+    """Protein embedding → 가장 가까운 TherapeuticProtein top-k"""
+    return _cross_search(uniprot_id, EMBED_STORE, TP_EMBED_STORE, top_k, "tp_id")
+
+
+def nearest_proteins_for_therapeutic(tp_uniprot_id: str, top_k: int = 10) -> List[Dict]:
+    """TherapeuticProtein embedding → 가장 가까운 Protein top-k"""
+    return _cross_search(tp_uniprot_id, TP_EMBED_STORE, EMBED_STORE, top_k, "uniprot_id")
@@ -10,30 +10,26 @@ Format:
     src_uniprot_id, tgt_uniprot_id, sim_score, method
 """
 
-import csv
+from pathlib import Path
+
 import numpy as np
-from typing import List, Tuple
 
 import chromadb
 
 from backend.config import Config
+from backend.pipeline.similarity_engine import (
+    SIM_MAX_MEMORY_MB,
+    normalize_rows,
+    iter_topk,
+    iter_topk_pairs,
+    write_pairs_csv,
+)
+from backend.pipeline.ann_index import ANN_NPROBE, get_or_build_index
+from backend.pipeline.quantization import QUANT_MODES, get_or_build_quantized
 
 RAW_DATA_ROOT = Config.RAW_DATA_ROOT
 
 
-# -------------------------------------------------------
-# Utility: l2 normalization
-# -------------------------------------------------------
-def l2_norm(x: np.ndarray) -> np.ndarray:
-    denom = np.linalg.norm(x)
-    return x / (denom + 1e-9)
-
-
-def cosine(a: np.ndarray, b: np.ndarray) -> float:
-    """Cosine similarity between normalized vectors."""
-    return float(np.dot(a, b))
-
-
 # -------------------------------------------------------
 # Main Builder function
 # -------------------------------------------------------
@@ -43,9 +39,25 @@ def build_protein_embeddings(
     collection_name="protein_embeddings",
     top_k_per_protein: int = 20,
     min_score: float = 0.70,
+    max_memory_mb: int = SIM_MAX_MEMORY_MB,
+    n_jobs: int = 1,
+    index: str = "exact",
+    nprobe: int = ANN_NPROBE,
+    pca_dim: int | None = None,
+    rerank_factor: int = 4,
 ):
     """
     Build SIMILAR_TO edges based on ESM2 embeddings stored in ChromaDB.
+
+    Similarity is computed block-wise (matrix product + argpartition top-k),
+    and CSV rows are streamed out as each block finishes.
+    index="ivf" uses the persisted IVF-flat ANN index instead of exact search.
+    index="int8" / "float16" searches quantized codes (optionally PCA-reduced)
+    and re-ranks the candidates exactly against the full-precision vectors.
+
+    Persisted indexes live next to the collection (ivf_flat_<collection>,
+    quantized_<collection>), separate from protein_embeddings_builder's, so
+    the two builders do not invalidate each other's index.
     """
 
     print("\n===============================================")
@@ -63,62 +75,62 @@ def build_protein_embeddings(
     col = client.get_collection(collection_name)
 
     # fetch ids + embeddings + metadata
-    data = col.get(include=["embeddings", "metadatas", "documents"])
+    data = col.get(include=["embeddings", "metadatas"])
     ids = data["ids"]
-    embeddings = np.array(data["embeddings"], dtype=np.float32)
-    metas = data["metadatas"]
+    embeddings = np.asarray(data["embeddings"], dtype=np.float32)
+    metas = data["metadatas"] or [{} for _ in ids]
 
     print(f"🔎 Loaded {len(ids)} protein embeddings")
 
+    uniprot_ids = [(m or {}).get("uniprot_id", pid) for m, pid in zip(metas, ids)]
+
     # --------------------------------------------
-    # 2. Normalize embeddings
+    # 2. Normalize embeddings (vectorized)
     # --------------------------------------------
     print("📐 Normalizing embeddings...")
-    embeddings = np.array([l2_norm(e) for e in embeddings], dtype=np.float32)
-
-    n = len(embeddings)
-    rows: List[Tuple[str, str, float]] = []
+    embeddings = normalize_rows(embeddings)
 
     # --------------------------------------------
-    # 3. Compute similarity
+    # 3. Compute similarity (blocked top-k)
     # --------------------------------------------
     print(f"🧮 Computing SIMILAR_TO edges (threshold={min_score})")
 
-    for i in range(n):
-        v1 = embeddings[i]
-        src_uniprot = metas[i].get("uniprot_id", ids[i])
-
-        sims = []
-
-        for j in range(n):
-            if i == j:
-                continue
-
-            sim_score = cosine(v1, embeddings[j])
-            if sim_score >= min_score:
-                tgt_uniprot = metas[j].get("uniprot_id", ids[j])
-                sims.append((tgt_uniprot, sim_score))
-
-        # 정렬 및 top-k 제한
-        sims.sort(key=lambda x: x[1], reverse=True)
-        sims = sims[:top_k_per_protein]
-
-        for tgt_uniprot, sc in sims:
-            rows.append((src_uniprot, tgt_uniprot, sc))
+    if index == "ivf":
+        ann = get_or_build_index(
+            uniprot_ids, embeddings, nprobe=nprobe,
+            path=Path(vectordb_path) / f"ivf_flat_{collection_name}",
+        )
+        blocks = ann.iter_topk(embeddings, top_k=top_k_per_protein)
+    elif index in QUANT_MODES:
+        quant = get_or_build_quantized(
+            uniprot_ids, embeddings, mode=index, pca_dim=pca_dim, rerank_factor=rerank_factor,
+            path=Path(vectordb_path) / f"quantized_{collection_name}",
+        )
+        blocks = quant.iter_topk(embeddings, top_k=top_k_per_protein, max_memory_mb=max_memory_mb)
+    elif index == "exact":
+        blocks = iter_topk(
+            embeddings,
+            top_k=top_k_per_protein,
+            max_memory_mb=max_memory_mb,
+            n_jobs=n_jobs,
+            normalized=True,
+        )
+    else:
+        raise ValueError(f"❌ Unknown similarity index: {index}")
 
     # --------------------------------------------
-    # 4. Write CSV output
+    # 4. Write CSV output (streamed per block)
     # --------------------------------------------
     out_csv = raw_root / "protein_similarity.csv"
-    out_csv.parent.mkdir(parents=True, exist_ok=True)
 
     print(f"💾 Writing CSV → {out_csv}")
 
-    with open(out_csv, "w", newline="", encoding="utf-8") as f:
-        w = csv.writer(f)
-        w.writerow(["src_uniprot_id", "tgt_uniprot_id", "sim_score", "method"])
-
-        for src, tgt, sc in rows:
-            w.writerow([src, tgt, f"{sc:.4f}", "esm2"])
+    n_rows = write_pairs_csv(
+        out_csv,
+        ["src_uniprot_id", "tgt_uniprot_id", "sim_score", "method"],
+        iter_topk_pairs(uniprot_ids, blocks, min_score),
+        method="esm2",
+        float_fmt="{:.4f}",
+    )
 
-    print(f"🎉 Done: {len(rows)} SIMILAR_TO edges generated.\n")
+    print(f"🎉 Done: {n_rows} SIMILAR_TO edges generated.\n")
@@ -0,0 +1,367 @@
+# backend/pipeline/quantization.py
+
+"""
+Quantized Embedding Index (int8 / float16, optional PCA) + exact re-ranking
+
+후보 검색은 압축된 벡터로, 최종 점수는 full-precision 벡터로 계산한다.
+
+    float32 (D)      : 4·D bytes / protein
+    float16 (D)      : 2·D bytes          (2x)
+    int8    (D)      : 1·D bytes          (4x, per-dimension scale)
+    int8 + PCA (d<D) : 1·d bytes          (4·D/d x, 내적 비용도 d/D 로 감소)
+
+검색 흐름:
+    1) query(float32) × corpus codes → 근사 점수, 행별 top-(k·rerank_factor) 후보
+    2) 후보만 full-precision embedding store 에서 읽어 exact cosine 으로 재정렬 → top-k
+
+Persisted at:
+    Config.VECTORDB_PROTEIN / "quantized" / {codes,scale,mean,components,bias}.npy + meta.json
+
+recall_report() 로 exact top-k 대비 recall@k / 메모리 절감률을 측정한다.
+"""
+
+import json
+import time
+import logging
+from pathlib import Path
+from typing import Dict, Iterator, List, Sequence
+
+import numpy as np
+
+from backend.config import Config
+from backend.pipeline.embedding_store import dump_json_atomic, save_npy_atomic, vectors_fingerprint
+from backend.pipeline.similarity_engine import (
+    Block,
+    SIM_MAX_MEMORY_MB,
+    normalize_rows,
+    plan_block_rows,
+    topk_block,
+)
+
+logger = logging.getLogger("quantization")
+
+QUANT_INDEX_DIR = Config.VECTORDB_PROTEIN / "quantized"
+
+QUANT_MODES = ("int8", "float16")
+
+
+class QuantizedIndex:
+    """
+    mode      : "int8" (per-dimension symmetric scale) | "float16"
+    pca_dim   : 지정 시 PCA 로 차원 축소 후 양자화
+    rerank_factor : 후보 수 = top_k × rerank_factor (exact 재정렬 대상)
+    """
+
+    def __init__(
+        self,
+        mode: str = "int8",
+        pca_dim: int | None = None,
+        rerank_factor: int = 4,
+        train_size: int = 50_000,
+        seed: int = 0,
+    ):
+        if mode not in QUANT_MODES:
+            raise ValueError(f"❌ Unknown quantization mode: {mode}")
+
+        self.mode = mode
+        self.pca_dim = pca_dim
+        self.rerank_factor = rerank_factor
+        self.train_size = train_size
+        self.seed = seed
+
+        self.ids: List[str] = []
+        self.fingerprint: str | None = None
+        self.full: np.ndarray | None = None
+        self.codes: np.ndarray | None = None
+        self.scale: np.ndarray | None = None
+        self.mean: np.ndarray | None = None
+        self.components: np.ndarray | None = None
+        self.bias: np.ndarray | None = None
+
+    # ------------------------------------------------------------
+    # Transform
+    # ------------------------------------------------------------
+    def _project(self, x: np.ndarray) -> np.ndarray:
+        if self.components is None:
+            return x
+        return (x - self.mean) @ self.components.T
+
+    def _query_weights(self, q: np.ndarray) -> np.ndarray:
+        """asymmetric 검색: query 는 float32 그대로, int8 scale 을 query 쪽에 곱함"""
+        w = self._project(q)
+        if self.mode == "int8":
+            w = w * self.scale
+        return w.astype(np.float32)
+
+    # ------------------------------------------------------------
+    # Build
+    # ------------------------------------------------------------
+    def build(self, ids: List[str], vectors: np.ndarray) -> "QuantizedIndex":
+        t0 = time.time()
+        x = normalize_rows(vectors)
+
+        if self.pca_dim:
+            rng = np.random.default_rng(self.seed)
+            sample = x if len(x) <= self.train_size else x[rng.choice(len(x), self.train_size, replace=False)]
+            self.mean = sample.mean(axis=0).astype(np.float32)
+            _, _, vt = np.linalg.svd(sample - self.mean, full_matrices=False)
+            self.components = vt[: self.pca_dim].astype(np.float32)
+            # PCA 는 중심화하므로 query 와 무관한 μ·x 항을 행별 bias 로 보존
+            self.bias = (x @ self.mean).astype(np.float32)
+
+        z = self._project(x)
+
+        if self.mode == "int8":
+            self.scale = (np.abs(z).max(axis=0) / 127.0 + 1e-12).astype(np.float32)
+            self.codes = np.clip(np.rint(z / self.scale), -127, 127).astype(np.int8)
+        else:
+            self.codes = z.astype(np.float16)
+
+        self.ids = list(ids)
+        self.full = vectors
+
+        logger.info(
+            f"[Quant] Built {self.mode}{'+PCA' + str(self.pca_dim) if self.pca_dim else ''} "
+            f"codes {self.codes.shape} in {time.time() - t0:.1f}s "
+            f"({self.memory_ratio():.1f}x smaller than float32)"
+        )
+        return self
+
+    def memory_ratio(self) -> float:
+        full_bytes = len(self.ids) * self.full.shape[1] * 4
+        return full_bytes / max(self.codes.nbytes, 1)
+
+    # ------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------
+    def _candidates(self, q: np.ndarray, n_cand: int, self_rows, max_memory_mb: int):
+        """압축 code 대상 근사 top-n_cand (corpus 를 chunk 단위로 float32 변환)"""
+        w = self._query_weights(q)
+        n = len(self.codes)
+        chunk = plan_block_rows(len(q), max_memory_mb)
+
+        best_idx = np.full((len(q), n_cand), -1, dtype=np.int64)
+        best_scores = np.full((len(q), n_cand), -np.inf, dtype=np.float32)
+
+        for s in range(0, n, chunk):
+            block = self.codes[s:s + chunk].astype(np.float32)
+            tile = w @ block.T
+            if self.bias is not None:
+                tile += self.bias[s:s + chunk]
+            if self_rows is not None:
+                r = np.flatnonzero((self_rows >= s) & (self_rows < s + len(block)))
+                tile[r, self_rows[r] - s] = -np.inf
+
+            all_scores = np.hstack([best_scores, tile])
+            all_idx = np.hstack([best_idx, np.broadcast_to(np.arange(s, s + len(block)), tile.shape)])
+            part = np.argpartition(all_scores, -n_cand, axis=1)[:, -n_cand:]
+            best_scores = np.take_along_axis(all_scores, part, axis=1)
+            best_idx = np.take_along_axis(all_idx, part, axis=1)
+
+        return best_idx
+
+    def search(
+        self,
+        queries: np.ndarray,
+        top_k: int = 20,
+        self_rows: Sequence[int] | None = None,
+        normalized: bool = False,
+        max_memory_mb: int = SIM_MAX_MEMORY_MB,
+    ):
+        """
+        근사 후보 → full-precision exact 재정렬.
+        반환: (top_idx, top_scores) — b×k, 원래 행 번호 기준, 내림차순
+        """
+        q = np.ascontiguousarray(queries, dtype=np.float32) if normalized else normalize_rows(queries)
+        if self_rows is not None:
+            self_rows = np.asarray(self_rows, dtype=np.int64)
+
+        n_avail = len(self.codes) - (1 if self_rows is not None else 0)
+        k = min(top_k, n_avail)
+        n_cand = min(max(k * self.rerank_factor, k), n_avail)
+        if k <= 0:
+            empty = np.empty((len(q), 0))
+            return empty.astype(np.int64), empty.astype(np.float32)
+
+        cand = self._candidates(q, n_cand, self_rows, max_memory_mb)
+
+        # exact 재정렬 (후보 행만 full-precision 에서 읽음)
+        flat = np.unique(cand)
+        exact = normalize_rows(self.full[flat])
+        pos = np.searchsorted(flat, cand)
+        scores = np.einsum("bd,bcd->bc", q, exact[pos])
+
+        order = np.argsort(-scores, axis=1)[:, :k]
+        return np.take_along_axis(cand, order, axis=1), np.take_along_axis(scores, order, axis=1)
+
+    def iter_topk(
+        self,
+        vectors: np.ndarray,
+        top_k: int = 20,
+        query_indices: Sequence[int] | None = None,
+        exclude_self: bool = True,
+        block_rows: int = 1024,
+        max_memory_mb: int = SIM_MAX_MEMORY_MB,
+    ) -> Iterator[Block]:
+        """similarity_engine.iter_topk 와 같은 (q_idx, top_idx, top_scores) block 을 yield"""
+        n = len(vectors)
+        if query_indices is None:
+            query_indices = np.arange(n, dtype=np.int64)
+        else:
+            query_indices = np.asarray(query_indices, dtype=np.int64)
+
+        for s in range(0, len(query_indices), block_rows):
+            q_idx = query_indices[s:s + block_rows]
+            top_idx, top_scores = self.search(
+                vectors[q_idx],
+                top_k=top_k,
+                self_rows=q_idx if exclude_self else None,
+                max_memory_mb=max_memory_mb,
+            )
+            yield q_idx, top_idx, top_scores
+
+    # ------------------------------------------------------------
+    # Persist
+    # ------------------------------------------------------------
+    def save(self, path: Path = QUANT_INDEX_DIR) -> Path:
+        """ann_index.IVFFlatIndex.save 와 같은 방식 (meta.json 을 마지막에 교체)"""
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        (path / "meta.json").unlink(missing_ok=True)
+
+        save_npy_atomic(path / "codes.npy", self.codes)
+        for name in ("scale", "mean", "components", "bias"):
+            f = path / f"{name}.npy"
+            value = getattr(self, name)
+            if value is not None:
+                save_npy_atomic(f, value)
+            elif f.exists():
+                f.unlink()
+
+        dump_json_atomic(path / "meta.json", {
+            "mode": self.mode,
+            "pca_dim": self.pca_dim,
+            "rerank_factor": self.rerank_factor,
+            "fingerprint": self.fingerprint,
+            "ids": self.ids,
+        })
+
+        logger.info(f"[Quant] Index saved → {path}")
+        return path
+
+    @classmethod
+    def load(cls, full_vectors: np.ndarray, path: Path = QUANT_INDEX_DIR) -> "QuantizedIndex":
+        path = Path(path)
+        with open(path / "meta.json", "r", encoding="utf-8") as f:
+            meta = json.load(f)
+
+        index = cls(mode=meta["mode"], pca_dim=meta["pca_dim"], rerank_factor=meta["rerank_factor"])
+        index.ids = meta["ids"]
+        index.fingerprint = meta.get("fingerprint")
+        index.full = full_vectors
+        index.codes = np.load(path / "codes.npy", mmap_mode="r")
+        for name in ("scale", "mean", "components", "bias"):
+            f = path / f"{name}.npy"
+            setattr(index, name, np.load(f) if f.exists() else None)
+
+        logger.info(f"[Quant] Index loaded ← {path} ({index.mode}, N={len(index.ids)})")
+        return index
+
+
+# -------------------------------------------------------
+# Build-or-load helper
+# -------------------------------------------------------
+def get_or_build_quantized(
+    ids: List[str],
+    vectors: np.ndarray,
+    mode: str = "int8",
+    pca_dim: int | None = None,
+    rerank_factor: int = 4,
+    path: Path = QUANT_INDEX_DIR,
+    rebuild: bool = False,
+    fingerprint: str | None = None,
+) -> QuantizedIndex:
+    """
+    저장된 code 의 embedding fingerprint / 설정이 현재와 같으면 재사용, 아니면 새로 빌드 후 저장.
+    (오래된 code 로 고른 후보는 exact 재정렬로도 복구되지 않으므로 id 목록이 아니라 벡터 내용으로 비교)
+    """
+    path = Path(path)
+    fingerprint = fingerprint or vectors_fingerprint(ids, vectors)
+    if not rebuild and (path / "meta.json").exists():
+        try:
+            index = QuantizedIndex.load(vectors, path)
+            if index.fingerprint == fingerprint and index.mode == mode and index.pca_dim == pca_dim:
+                index.rerank_factor = rerank_factor
+                return index
+            logger.info("[Quant] Stored codes are stale, rebuilding")
+        except Exception as e:
+            logger.warning(f"[Quant] Failed to load codes, rebuilding: {e}")
+
+    index = QuantizedIndex(mode=mode, pca_dim=pca_dim, rerank_factor=rerank_factor).build(ids, vectors)
+    index.fingerprint = fingerprint
+    index.save(path)
+    return index
+
+
+# -------------------------------------------------------
+# Recall@k report
+# -------------------------------------------------------
+def recall_at_k(index: QuantizedIndex, vectors: np.ndarray, top_k: int = 20, sample: int = 1000, seed: int = 0) -> Dict:
+    x = normalize_rows(vectors)
+    rng = np.random.default_rng(seed)
+    q_idx = np.sort(rng.choice(len(x), min(sample, len(x)), replace=False))
+
+    exact_idx, _ = topk_block(x[q_idx], x, top_k, q_idx)
+
+    t0 = time.time()
+    approx_idx, _ = index.search(x[q_idx], top_k=top_k, self_rows=q_idx, normalized=True)
+    elapsed = time.time() - t0
+
+    hits = sum(len(np.intersect1d(a, e)) for a, e in zip(approx_idx, exact_idx))
+    return {
+        "mode": index.mode,
+        "pca_dim": index.pca_dim,
+        "rerank_factor": index.rerank_factor,
+        "k": top_k,
+        "recall": hits / max(exact_idx.size, 1),
+        "memory_ratio": index.memory_ratio(),
+        "ms_per_query": 1000 * elapsed / max(len(q_idx), 1),
+    }
+
+
+def recall_report(
+    ids: List[str],
+    vectors: np.ndarray,
+    top_k: int = 20,
+    configs: Sequence[Dict] = (
+        {"mode": "float16"},
+        {"mode": "int8"},
+        {"mode": "int8", "pca_dim": 128},
+        {"mode": "int8", "pca_dim": 64},
+    ),
+    rerank_factors: Sequence[int] = (1, 2, 4),
+    sample: int = 1000,
+) -> List[Dict]:
+    print(f"\n📊 Quantized recall@{top_k} (sample={sample})")
+    print(f"{'mode':>8} {'pca':>6} {'rerank':>7} {'recall':>8} {'mem':>7} {'ms/query':>10}")
+
+    results = []
+    for cfg in configs:
+        index = QuantizedIndex(**cfg).build(ids, vectors)
+        for rf in rerank_factors:
+            index.rerank_factor = rf
+            r = recall_at_k(index, vectors, top_k=top_k, sample=sample)
+            results.append(r)
+            print(
+                f"{r['mode']:>8} {str(r['pca_dim'] or '-'):>6} {rf:>7} "
+                f"{r['recall']:>8.3f} {r['memory_ratio']:>6.1f}x {r['ms_per_query']:>10.3f}"
+            )
+
+    return results
+
+
+if __name__ == "__main__":
+    from backend.pipeline.embedding_store import load_embedding_store
+
+    ids, vectors = load_embedding_store()
+    recall_report(ids, vectors)
@@ -0,0 +1,242 @@
+# backend/pipeline/similarity_engine.py
+
+"""
+Tiled Top-k Cosine Similarity Engine
+
+N×N similarity matrix 를 만들지 않고, query block × corpus 타일 단위로
+float32 내적을 계산한 뒤 argpartition 으로 행별 top-k 만 유지한다.
+
+    memory  : O(block_rows × N)  (max_memory_mb 로 제한)
+    time    : O(N² · D) 내적 + O(N²) argpartition (전체 argsort 없음)
+
+사용 예:
+    for q_idx, top_idx, top_scores in iter_topk(vectors, top_k=20):
+        ...
+"""
+
+import os
+import csv
+import logging
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger("similarity_engine")
+
+# 타일 하나가 쓰는 메모리 상한 (similarity tile float32 + argpartition index int64)
+SIM_MAX_MEMORY_MB = int(os.getenv("SIM_MAX_MEMORY_MB", "1024"))
+_BYTES_PER_CELL = 4 + 8
+
+Block = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+# -------------------------------------------------------
+# Utility
+# -------------------------------------------------------
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """행 단위 l2 정규화 (float32 사본 반환)"""
+    x = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(x, axis=1, keepdims=True)
+    return x / (norms + 1e-9)
+
+
+def plan_block_rows(n_corpus: int, max_memory_mb: int = SIM_MAX_MEMORY_MB) -> int:
+    """max_memory_mb 안에 들어가는 query block 행 수"""
+    budget = int(max_memory_mb * 1024 * 1024)
+    return max(1, budget // (_BYTES_PER_CELL * max(n_corpus, 1)))
+
+
+def topk_block(
+    queries: np.ndarray,
+    corpus: np.ndarray,
+    top_k: int,
+    self_idx: np.ndarray | None = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    queries (b×D) × corpus (N×D) 타일의 행별 top-k.
+    self_idx[r] 가 주어지면 해당 corpus 열(자기 자신)은 제외.
+
+    반환: (top_idx, top_scores) — 둘 다 b×k, 점수 내림차순
+    """
+    tile = queries @ corpus.T
+
+    if self_idx is not None:
+        tile[np.arange(len(self_idx)), self_idx] = -np.inf
+
+    k = min(top_k, tile.shape[1])
+    if k <= 0:
+        empty = np.empty((tile.shape[0], 0))
+        return empty.astype(np.int64), empty.astype(np.float32)
+
+    part = np.argpartition(tile, -k, axis=1)[:, -k:]
+    part_scores = np.take_along_axis(tile, part, axis=1)
+
+    order = np.argsort(-part_scores, axis=1)
+    top_idx = np.take_along_axis(part, order, axis=1)
+    top_scores = np.take_along_axis(part_scores, order, axis=1)
+    return top_idx, top_scores
+
+
+# -------------------------------------------------------
+# Multi-process workers
+# -------------------------------------------------------
+_WORKER_CORPUS = None
+
+
+def _init_worker(corpus: np.ndarray):
+    global _WORKER_CORPUS
+    _WORKER_CORPUS = corpus
+
+
+def _worker_block(args) -> Block:
+    q_idx, top_k, exclude_self = args
+    q = _WORKER_CORPUS[q_idx]
+    top_idx, top_scores = topk_block(q, _WORKER_CORPUS, top_k, q_idx if exclude_self else None)
+    return q_idx, top_idx, top_scores
+
+
+# -------------------------------------------------------
+# Main API
+# -------------------------------------------------------
+def iter_topk(
+    vectors: np.ndarray,
+    top_k: int = 20,
+    query_indices: Sequence[int] | None = None,
+    exclude_self: bool = True,
+    max_memory_mb: int = SIM_MAX_MEMORY_MB,
+    n_jobs: int = 1,
+    normalized: bool = False,
+) -> Iterator[Block]:
+    """
+    vectors 전체를 corpus 로 두고, query_indices (기본: 전체) 행의 top-k 이웃을
+    block 단위로 yield 한다.
+
+    yield: (q_idx, top_idx, top_scores)
+      - q_idx      : 이 block 의 query 행 번호 (vectors 기준)
+      - top_idx    : (b×k) 이웃 행 번호
+      - top_scores : (b×k) cosine similarity, 내림차순
+
+    n_jobs > 1 이면 block 들을 여러 프로세스에서 계산 (출력 순서는 유지).
+    """
+    corpus = np.ascontiguousarray(vectors, dtype=np.float32) if normalized else normalize_rows(vectors)
+    n = corpus.shape[0]
+
+    if query_indices is None:
+        query_indices = np.arange(n, dtype=np.int64)
+    else:
+        query_indices = np.asarray(query_indices, dtype=np.int64)
+
+    k = min(top_k, n - 1 if exclude_self else n)
+    block_rows = plan_block_rows(n, max_memory_mb)
+    blocks = [query_indices[s:s + block_rows] for s in range(0, len(query_indices), block_rows)]
+
+    logger.info(
+        f"[SimilarityEngine] N={n}, queries={len(query_indices)}, k={k}, "
+        f"block_rows={block_rows}, blocks={len(blocks)}, n_jobs={n_jobs}"
+    )
+
+    if k <= 0 or not blocks:
+        return
+
+    if n_jobs and n_jobs > 1 and len(blocks) > 1:
+        # block 마다 타일 메모리를 쓰므로 전체 상한을 worker 수로 나눔
+        block_rows = max(1, block_rows // n_jobs)
+        blocks = [query_indices[s:s + block_rows] for s in range(0, len(query_indices), block_rows)]
+
+        with ProcessPoolExecutor(
+            max_workers=n_jobs,
+            initializer=_init_worker,
+            initargs=(corpus,),
+        ) as ex:
+            yield from ex.map(_worker_block, [(b, k, exclude_self) for b in blocks])
+        return
+
+    for q_idx in blocks:
+        top_idx, top_scores = topk_block(corpus[q_idx], corpus, k, q_idx if exclude_self else None)
+        yield q_idx, top_idx, top_scores
+
+
+def topk_against(
+    vectors: np.ndarray,
+    candidate_indices: Sequence[int],
+    top_k: int = 20,
+    exclude_self: bool = True,
+    max_memory_mb: int = SIM_MAX_MEMORY_MB,
+    normalized: bool = False,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    모든 행에 대해 candidate_indices 행들 중 top-k 를 계산 (ΔN × N).
+    신규 단백질이 기존 단백질의 top-k 에 들어가는지 확인할 때 사용.
+
+    반환: (top_idx, top_scores) — N×k, 내림차순, 후보가 부족하면 -1 / -inf
+    """
+    corpus = np.ascontiguousarray(vectors, dtype=np.float32) if normalized else normalize_rows(vectors)
+    cand = np.asarray(candidate_indices, dtype=np.int64)
+    n = corpus.shape[0]
+    k = min(top_k, len(cand))
+
+    best_idx = np.full((n, k), -1, dtype=np.int64)
+    best_scores = np.full((n, k), -np.inf, dtype=np.float32)
+    if k <= 0:
+        return best_idx, best_scores
+
+    block_cols = plan_block_rows(n, max_memory_mb)
+    for s in range(0, len(cand), block_cols):
+        cb = cand[s:s + block_cols]
+        tile = corpus @ corpus[cb].T
+        if exclude_self:
+            tile[cb, np.arange(len(cb))] = -np.inf
+
+        all_scores = np.hstack([best_scores, tile])
+        all_idx = np.hstack([best_idx, np.broadcast_to(cb, tile.shape)])
+        part = np.argpartition(all_scores, -k, axis=1)[:, -k:]
+        best_scores = np.take_along_axis(all_scores, part, axis=1)
+        best_idx = np.take_along_axis(all_idx, part, axis=1)
+
+    order = np.argsort(-best_scores, axis=1)
+    return np.take_along_axis(best_idx, order, axis=1), np.take_along_axis(best_scores, order, axis=1)
+
+
+def iter_topk_pairs(
+    ids: List[str],
+    blocks: Iterator[Block],
+    min_score: float | None = None,
+) -> Iterator[Tuple[str, str, float]]:
+    """block 결과를 (src_id, tgt_id, score) 로 풀어서 yield (min_score 미만 제외)"""
+    for q_idx, top_idx, top_scores in blocks:
+        for r, i in enumerate(q_idx):
+            src = ids[i]
+            for j, score in zip(top_idx[r], top_scores[r]):
+                # j < 0: ANN 후보 부족으로 비어 있는 슬롯
+                if j < 0 or (min_score is not None and score < min_score):
+                    break
+                yield src, ids[j], float(score)
+
+
+def write_pairs_csv(
+    path: Path,
+    header: List[str],
+    pairs: Iterator[Tuple[str, str, float]],
+    method: str | None = None,
+    float_fmt: str | None = None,
+) -> int:
+    """
+    (src, tgt, score) 스트림을 CSV 로 바로 기록 (block 이 끝날 때마다 flush 되는 형태).
+    method 가 주어지면 마지막 컬럼으로 추가. 기록한 행 수 반환.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    n_rows = 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(header)
+        for src, tgt, score in pairs:
+            row = [src, tgt, float_fmt.format(score) if float_fmt else score]
+            if method is not None:
+                row.append(method)
+            w.writerow(row)
+            n_rows += 1
+    return n_rows
@@ -1,12 +1,49 @@
 # backend/pipeline/steps/step_embeddings.py
 
 import logging
-from backend.pipeline.protein_embeddings_builder import run_all
+from backend.pipeline.protein_embeddings_builder import run_all, SIM_DELTA_OUTPUT
 
 logger = logging.getLogger("step_embeddings")
 logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
 
 
+def _apply_similarity_delta():
+    """
+    증분 실행으로 생성된 SIMILAR_TO delta 를 Neo4j 에 반영.
+    적용에 성공하면 delta 파일 삭제, 실패하면 남겨 두고 다음 실행의 delta 와 병합해서 다시 시도.
+    """
+    if not SIM_DELTA_OUTPUT.exists():
+        return
+
+    from backend.graph.relation_loader import RelationLoader
+
+    try:
+        rel = RelationLoader()
+        try:
+            rel.apply_protein_similarity_delta(str(SIM_DELTA_OUTPUT))
+        finally:
+            rel.close()
+    except Exception as e:
+        print(
+            f"⚠️ SIMILAR_TO delta 적용 실패 → {SIM_DELTA_OUTPUT} 를 pending 으로 유지 "
+            f"(다음 실행에서 병합 후 재시도, 또는 graph step 에서 전체 로드): {e}"
+        )
+        return
+
+    SIM_DELTA_OUTPUT.unlink()
+
+
+def _build_therapeutic_embeddings():
+    """TherapeuticProtein 전용 embedding collection (Config.VECTORDB_TP)"""
+    from backend.pipeline.therapeutic_embeddings_builder import TP_CSV, build_therapeutic_embeddings
+
+    if not TP_CSV.exists():
+        print(f"ℹ️ Optional missing: {TP_CSV}")
+        return
+
+    build_therapeutic_embeddings()
+
+
 def run():
     print("\n======================================")
     print(" 🧬 STEP: embeddings (Protein Embeddings + Similarity)")
@@ -14,6 +51,8 @@ def run():
 
     try:
         run_all()
+        _apply_similarity_delta()
+        _build_therapeutic_embeddings()
         print("✅ [STEP: embeddings] Completed")
     except Exception as e:
         print(f"❌ Step 'embeddings' 실패: {e}")
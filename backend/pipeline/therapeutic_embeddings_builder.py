@@ -0,0 +1,87 @@
+# backend/pipeline/therapeutic_embeddings_builder.py
+
+"""
+TherapeuticProtein Embeddings (ESM2) → dedicated vector collection
+
+Creates:
+    processed/therapeutic_protein_embeddings.npy (+ .ids.json)
+    Config.VECTORDB_TP / collection "therapeutic_proteins"
+
+서열은 therapeutic_proteins.csv 의 sequence 컬럼을 사용하고,
+없으면 proteins.csv 의 같은 uniprot_id 서열로 보완한다.
+임베딩 모델 / 증분 재사용 / Chroma chunk upsert 는 protein_embeddings_builder 와 동일.
+"""
+
+import pandas as pd
+
+from backend.config import Config
+from backend.pipeline.embedding_store import TP_EMBED_STORE
+from backend.pipeline.protein_embeddings_builder import (
+    PROTEIN_CSV,
+    EMBED_BATCH_TOKENS,
+    embed_to_store,
+    save_to_chroma,
+)
+
+TP_CSV = Config.RAW_DATA_ROOT / "therapeutic_proteins.csv"
+TP_COLLECTION = "therapeutic_proteins"
+
+
+def _load_tp_sequences():
+    print(f"📄 Loading therapeutic protein list: {TP_CSV}")
+    df = pd.read_csv(TP_CSV)
+
+    if "uniprot_id" not in df.columns:
+        raise ValueError("❌ therapeutic_proteins.csv must contain 'uniprot_id' column.")
+
+    df = df.drop_duplicates(subset=["uniprot_id"])
+    if "sequence" not in df.columns:
+        df["sequence"] = None
+
+    # 서열이 비어 있으면 proteins.csv 에서 보완
+    missing = df["sequence"].isna() | (df["sequence"].astype(str).str.strip() == "")
+    if missing.any() and PROTEIN_CSV.exists():
+        proteins = pd.read_csv(PROTEIN_CSV, usecols=["uniprot_id", "sequence"])
+        lookup = proteins.drop_duplicates(subset=["uniprot_id"]).set_index("uniprot_id")["sequence"]
+        df.loc[missing, "sequence"] = df.loc[missing, "uniprot_id"].map(lookup)
+
+    no_seq = df["sequence"].isna() | (df["sequence"].astype(str).str.strip() == "")
+    if no_seq.any():
+        print(f"⚠️ Skipped {int(no_seq.sum())} therapeutic proteins without sequence")
+        df = df[~no_seq]
+
+    return df["uniprot_id"].astype(str).tolist(), df["sequence"].astype(str).tolist()
+
+
+def build_therapeutic_embeddings(
+    max_tokens_per_batch: int | None = EMBED_BATCH_TOKENS,
+    incremental: bool = True,
+):
+    print("\n===============================================")
+    print("💊 Building TherapeuticProtein Embeddings")
+    print("===============================================")
+
+    ids, seqs = _load_tp_sequences()
+
+    embeddings, hashes, delta = embed_to_store(
+        ids,
+        seqs,
+        TP_EMBED_STORE,
+        max_tokens_per_batch=max_tokens_per_batch,
+        incremental=incremental,
+    )
+
+    save_to_chroma(
+        ids,
+        embeddings,
+        hashes,
+        vectordb_path=Config.VECTORDB_TP,
+        collection_name=TP_COLLECTION,
+    )
+
+    print(f"🎉 TherapeuticProtein embeddings ready: {len(ids)}")
+    return ids, embeddings, delta
+
+
+if __name__ == "__main__":
+    build_therapeutic_embeddings()
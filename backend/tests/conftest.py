@@ -0,0 +1,138 @@
+# backend/tests/conftest.py
+
+"""
+Loader 테스트용 fake Neo4j driver (DB 없이 BaseLoader 의 batch / bisect / snapshot 로직 검증)
+
+    FakeDriver(fail=lambda row: Exception | None)
+      - session().execute_write(work, ...) → work(FakeTx, ...)
+      - 노드 MERGE 쿼리 ($rows) 의 row 중 fail(row) 가 에러를 주면 transaction 전체가 그 에러로 실패
+      - 성공한 row 는 nodes[key] 에, row_hash 는 hashes[key] 에, DETACH DELETE 는 nodes / hashes 에서 제거
+      - 관계 upsert (RETURN row.key) 는 양 끝 (row.s / row.e) 이 nodes 에 있는 row 만 rels[key] 에 쓰고 그 key 를 반환,
+        관계 DELETE r 는 rels 에서 제거
+"""
+
+from typing import Any, Dict, List
+
+import pytest
+
+
+class FakeResult:
+    def __init__(self, record: Dict[str, Any] | None = None, records: List[Dict[str, Any]] | None = None):
+        self._record = record
+        self._records = records or []
+
+    def __iter__(self):
+        return iter(self._records)
+
+    def consume(self):
+        return None
+
+    def single(self):
+        return self._record
+
+
+class FakeTx:
+    def __init__(self, driver: "FakeDriver"):
+        self.driver = driver
+
+    def run(self, cypher: str, **params):
+        d = self.driver
+        d.statements.append(cypher)
+
+        if "DETACH DELETE" in cypher:
+            for k in params["keys"]:
+                d.nodes.pop(k, None)
+                d.hashes.pop(k, None)
+            return FakeResult()
+
+        rows = params["rows"]
+        if "RETURN row.key" in cypher:
+            d.transactions += 1
+            matched = [r for r in rows if r["s"] in d.nodes and r["e"] in d.nodes]
+            d.rels.update({r["key"]: r["row_hash"] for r in matched})
+            return FakeResult(records=[{"key": r["key"]} for r in matched])
+
+        if "DELETE r" in cypher:
+            for r in rows:
+                d.rels.pop(r["key"], None)
+            return FakeResult()
+
+        if "row_hash" in cypher:
+            d.hashes.update({r["key"]: r["row_hash"] for r in rows})
+            return FakeResult()
+
+        d.transactions += 1
+        for row in rows:
+            error = d.fail(row)
+            if error is not None:
+                raise error
+        d.nodes.update({r["id"]: r for r in rows})
+        return FakeResult()
+
+
+class FakeSession:
+    def __init__(self, driver: "FakeDriver"):
+        self.driver = driver
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute_write(self, work, *args, **kwargs):
+        return work(FakeTx(self.driver), *args, **kwargs)
+
+    def run(self, cypher: str, **params):
+        # _count_hashed_nodes / _count_hashed_relations
+        d = self.driver
+        return FakeResult({"c": len(d.rels) if "]->" in cypher else len(d.hashes)})
+
+
+class FakeDriver:
+    def __init__(self, fail=lambda row: None):
+        self.fail = fail
+        self.nodes: Dict[str, Dict[str, Any]] = {}
+        self.hashes: Dict[str, str] = {}
+        self.rels: Dict[str, str] = {}
+        self.statements: List[str] = []
+        self.transactions = 0
+
+    def session(self, **kwargs):
+        return FakeSession(self)
+
+
+@pytest.fixture
+def fake_driver():
+    return FakeDriver()
+
+
+@pytest.fixture
+def dead_letter_root(tmp_path, monkeypatch):
+    """DeadLetterWriter 기본 경로를 tmp 로 (data/dead_letter 를 건드리지 않게)"""
+    pytest.importorskip("neo4j")
+    from backend.graph.loaders.dead_letter import DeadLetterWriter
+
+    root = tmp_path / "dead_letter"
+    monkeypatch.setattr(DeadLetterWriter.__init__, "__defaults__", (root,))
+    return root
+
+
+@pytest.fixture
+def make_loader(dead_letter_root):
+    """value 컬럼은 정수여야 하는 Thing loader (아니면 전처리 실패)"""
+    from backend.graph.loaders.base_loader import BaseLoader
+
+    class ThingLoader(BaseLoader):
+        label = "Thing"
+        key = "id"
+
+        def _preprocess_row(self, row):
+            return {"id": row["id"], "value": int(row["value"])}
+
+        def _prepare_cypher_and_params(self, batch):
+            return "UNWIND $rows AS row MERGE (n:Thing {id: row.id}) SET n.value = row.value", {"rows": batch}
+
+    def _make(fail=lambda row: None, batch_size=8, workers=1):
+        return ThingLoader(driver=FakeDriver(fail), batch_size=batch_size, workers=workers, adaptive=False)
+    return _make
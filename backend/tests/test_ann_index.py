@@ -0,0 +1,96 @@
+# backend/tests/test_ann_index.py
+
+"""
+IVF-flat index: 기본 nprobe 에서의 recall@k, 저장 / fingerprint 재사용
+
+    pytest backend/tests/test_ann_index.py
+"""
+
+import numpy as np
+import pytest
+
+from backend.pipeline.ann_index import (
+    ANN_NPROBE,
+    IVFFlatIndex,
+    get_or_build_index,
+    load_current_index,
+    recall_at_k,
+)
+from backend.pipeline.embedding_store import vectors_fingerprint
+
+K = 10
+
+
+def clustered(n=3000, d=32, clusters=60, noise=0.15, seed=0):
+    """embedding 처럼 군집이 있는 합성 데이터 (균일 난수는 ANN 이 의미 없음)"""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, d))
+    labels = rng.integers(0, clusters, size=n)
+    return (centers[labels] + noise * rng.normal(size=(n, d))).astype(np.float32)
+
+
+@pytest.fixture(scope="module")
+def data():
+    x = clustered()
+    ids = [f"P{i:05d}" for i in range(len(x))]
+    return ids, x
+
+
+@pytest.fixture(scope="module")
+def index(data):
+    ids, x = data
+    return IVFFlatIndex().build(ids, x)
+
+
+def test_recall_at_default_nprobe(index, data):
+    report = recall_at_k(index, data[1], top_k=K, sample=300)
+    assert report["nprobe"] == min(ANN_NPROBE, index.nlist)
+    assert report["recall"] >= 0.9, report
+
+
+def test_recall_all_cells_is_exact(index, data):
+    report = recall_at_k(index, data[1], top_k=K, nprobe=index.nlist, sample=100)
+    assert report["recall"] == pytest.approx(1.0)
+
+
+def test_search_excludes_self_and_sorts(index, data):
+    x = data[1]
+    q = np.arange(0, 50)
+    top_idx, top_scores = index.search(x[q], top_k=K, self_rows=q)
+    assert not (top_idx == q[:, None]).any()
+    assert (np.diff(top_scores, axis=1) <= 1e-6).all()
+
+
+def test_save_load_roundtrip(index, data, tmp_path):
+    index.fingerprint = "fp"
+    index.save(tmp_path)
+
+    loaded = load_current_index("fp", tmp_path)
+    assert loaded is not None and loaded.ids == index.ids
+    q = data[1][:20]
+    np.testing.assert_array_equal(loaded.search(q, top_k=K)[0], index.search(q, top_k=K)[0])
+
+    assert load_current_index("other", tmp_path) is None
+    assert load_current_index("fp", tmp_path, nlist=index.nlist + 1) is None
+
+
+def test_rebuilds_when_vectors_change_under_same_ids(tmp_path):
+    x = clustered(n=400)
+    ids = [f"P{i}" for i in range(len(x))]
+
+    first = get_or_build_index(ids, x, path=tmp_path)
+    assert first.fingerprint == vectors_fingerprint(ids, x)
+    assert get_or_build_index(ids, x, path=tmp_path).fingerprint == first.fingerprint
+
+    moved = x.copy()
+    moved[0] = -moved[0]
+    rebuilt = get_or_build_index(ids, moved, path=tmp_path)
+    assert rebuilt.fingerprint == vectors_fingerprint(ids, moved) != first.fingerprint
+    assert load_current_index(first.fingerprint, tmp_path) is None
+
+
+def test_interrupted_save_is_not_reused(index, tmp_path):
+    index.fingerprint = "fp"
+    index.save(tmp_path)
+    (tmp_path / "meta.json").unlink()  # 배열 교체 도중 중단된 상태
+    assert load_current_index("fp", tmp_path) is None
@@ -0,0 +1,106 @@
+# backend/tests/test_dead_letter.py
+
+"""
+데이터 에러 batch 의 bisect 재시도 → dead-letter JSONL (fake driver, conftest.py)
+
+    pytest backend/tests/test_dead_letter.py
+"""
+
+import json
+
+import pytest
+
+pytest.importorskip("neo4j")
+
+from neo4j.exceptions import CypherSyntaxError, CypherTypeError, Neo4jError  # noqa: E402
+
+
+def rows(n):
+    return [{"id": f"T{i}", "value": str(i)} for i in range(n)]
+
+
+def fail_ids(ids, error=lambda: CypherTypeError("bad value")):
+    return lambda row: error() if row["id"] in ids else None
+
+
+def read_dead_letters(root):
+    files = list(root.glob("*.jsonl"))
+    assert len(files) == 1
+    with open(files[0], encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_bisects_down_to_bad_rows(make_loader, dead_letter_root):
+    bad = {"T3", "T17", "T18", "T36"}
+    loader = make_loader(fail=fail_ids(bad), batch_size=16)
+
+    stats = loader.load_from_records(rows(37))
+
+    assert set(loader.driver.nodes) == {f"T{i}" for i in range(37)} - bad
+    assert stats.rows == 37 - len(bad)
+    assert stats.lost_rows == len(bad)
+    assert sorted(stats.lost_keys) == sorted(bad)
+
+    records = read_dead_letters(dead_letter_root)
+    assert stats.dead_letter_path == str(next(dead_letter_root.glob("*.jsonl")))
+    assert sorted(r["row"]["id"] for r in records) == sorted(bad)
+    assert all(r["stage"] == "write" and r["error"].startswith("CypherTypeError") for r in records)
+    assert all(r["loader"] == "ThingLoader" for r in records)
+
+
+def test_single_bad_row_costs_log_n_transactions(make_loader, dead_letter_root):
+    loader = make_loader(fail=fail_ids({"T5"}), batch_size=16)
+    loader.load_from_records(rows(16))
+    # 16 → 8 → 4 → 2 → 1: 처음 1 번 + 단계마다 (성공 절반 1 + 실패 절반 1)
+    assert loader.driver.transactions == 1 + 2 * 4
+    assert len(loader.driver.nodes) == 15
+
+
+def test_data_error_by_code_is_bisected(make_loader, dead_letter_root):
+    def argument_error():
+        return Neo4jError._hydrate_neo4j(code="Neo.ClientError.Statement.ArgumentError", message="bad argument")
+
+    loader = make_loader(fail=fail_ids({"T1"}, argument_error))
+    stats = loader.load_from_records(rows(8))
+    assert stats.lost_rows == 1 and len(loader.driver.nodes) == 7
+
+
+def test_non_data_error_is_raised_without_bisecting(make_loader, dead_letter_root):
+    loader = make_loader(fail=lambda row: CypherSyntaxError("Invalid input"), batch_size=16)
+
+    with pytest.raises(CypherSyntaxError):
+        loader.load_from_records(rows(40))
+
+    assert loader.driver.transactions == 1
+    assert not loader.driver.nodes
+    assert not dead_letter_root.exists()
+
+
+def test_preprocess_failure_goes_to_dead_letter(make_loader, dead_letter_root):
+    loader = make_loader()
+    records = rows(5)
+    records[2]["value"] = "oops"
+
+    stats = loader.load_from_records(records)
+
+    assert stats.lost_rows == 1 and stats.rows == 4
+    (record,) = read_dead_letters(dead_letter_root)
+    assert record["stage"] == "preprocess" and record["row"] == records[2]
+    assert record["error"].startswith("ValueError")
+
+
+def test_clean_load_writes_no_dead_letter_file(make_loader, dead_letter_root):
+    stats = make_loader().load_from_records(rows(20))
+    assert stats.lost_rows == 0 and stats.dead_letter_path is None
+    assert not dead_letter_root.exists()
+
+
+def test_parallel_workers_bisect_too(make_loader, dead_letter_root):
+    bad = {"T7", "T40"}
+    loader = make_loader(fail=fail_ids(bad), batch_size=8, workers=3)
+
+    stats = loader.load_from_records(rows(60))
+
+    assert set(loader.driver.nodes) == {f"T{i}" for i in range(60)} - bad
+    assert sorted(stats.lost_keys) == sorted(bad)
+    assert sorted(r["row"]["id"] for r in read_dead_letters(dead_letter_root)) == sorted(bad)
@@ -0,0 +1,111 @@
+# backend/tests/test_kmer_similarity.py
+
+"""
+k-mer MinHash / LSH: 후보 쌍 생성, 단백질별 top-k, 큰 k 에서의 overflow
+
+    pytest backend/tests/test_kmer_similarity.py
+"""
+
+import numpy as np
+import pytest
+
+from backend.pipeline.kmer_similarity import (
+    _MAX_K,
+    _PRIME,
+    MinHasher,
+    build_signatures,
+    kmer_codes,
+    lsh_candidate_pairs,
+    score_pairs,
+    topk_per_source,
+)
+
+AA = "ACDEFGHIKLMNPQRSTVWY"
+
+
+def random_seq(rng, n=200):
+    return "".join(rng.choice(list(AA), size=n))
+
+
+def mutate(rng, seq, n_sites):
+    s = list(seq)
+    for i in rng.choice(len(s), n_sites, replace=False):
+        s[i] = rng.choice(list(AA))
+    return "".join(s)
+
+
+@pytest.fixture(scope="module")
+def seqs():
+    rng = np.random.default_rng(0)
+    base = [random_seq(rng) for _ in range(30)]
+    # 0–9 의 근연 서열 (점 돌연변이 몇 개) 을 30–39 에 추가
+    return base + [mutate(rng, base[i], 3) for i in range(10)]
+
+
+def test_kmer_codes():
+    assert kmer_codes("AB", k=1).tolist() == [0, 1]
+    assert kmer_codes("abab", k=2).tolist() == [1, 26]  # "AB" = 1, "BA" = 26
+    assert len(kmer_codes("AC", k=3)) == 0
+    with pytest.raises(ValueError):
+        kmer_codes("A" * 20, k=_MAX_K + 1)
+
+
+def test_signature_does_not_overflow_at_max_k():
+    codes = kmer_codes("Z" * _MAX_K + "Y" * _MAX_K, k=_MAX_K)
+    assert codes.max() > np.iinfo(np.int64).max // int(_PRIME)  # 줄이지 않으면 a·x 가 overflow 나는 크기
+
+    sig = MinHasher(num_perm=64).signature(codes)
+    assert ((sig >= 0) & (sig < _PRIME)).all()
+
+
+def test_related_sequences_are_candidates(seqs):
+    sigs = build_signatures(seqs, k=3, num_perm=128)
+    pairs = lsh_candidate_pairs(sigs, bands=32)
+
+    assert pairs.dtype == np.int64 and pairs.shape[1] == 2
+    assert (pairs[:, 0] < pairs[:, 1]).all()
+    assert len(np.unique(pairs, axis=0)) == len(pairs)
+
+    found = {tuple(p) for p in pairs.tolist()}
+    assert all((i, 30 + i) in found for i in range(10))
+
+    scores = score_pairs(sigs, pairs)
+    related = np.isin(pairs[:, 0], np.arange(10)) & (pairs[:, 1] == pairs[:, 0] + 30)
+    assert scores[related].min() > scores[~related].max(initial=0.0)
+
+
+def test_empty_sequences_are_never_paired():
+    sigs = build_signatures(["", "", "XY", "MKTAYIAKQR"], k=3, num_perm=16)
+    assert len(lsh_candidate_pairs(sigs, bands=8)) == 0
+
+
+def test_max_bucket_drops_low_complexity_buckets():
+    sigs = build_signatures(["AAAAAAAAAA"] * 5, k=3, num_perm=16)
+    assert len(lsh_candidate_pairs(sigs, bands=8)) == 10
+    assert len(lsh_candidate_pairs(sigs, bands=8, max_bucket=4)) == 0
+
+
+def test_bands_must_divide_num_perm():
+    with pytest.raises(ValueError):
+        lsh_candidate_pairs(np.zeros((3, 10), dtype=np.int64), bands=4)
+
+
+def test_topk_per_source():
+    pairs = np.array([[0, 1], [0, 2], [0, 3], [1, 2], [2, 3]], dtype=np.int64)
+    scores = np.array([0.9, 0.5, 0.7, 0.1, 0.6], dtype=np.float32)
+
+    src, tgt, sc = topk_per_source(pairs, scores, top_k=2, min_score=0.2)
+    got = list(zip(src.tolist(), tgt.tolist()))
+
+    assert got == [
+        (0, 1), (0, 3),
+        (1, 0),
+        (2, 3), (2, 0),
+        (3, 0), (3, 2),
+    ]
+    np.testing.assert_allclose(sc, [0.9, 0.7, 0.9, 0.6, 0.5, 0.7, 0.6])
+
+
+def test_topk_per_source_empty():
+    src, tgt, sc = topk_per_source(np.empty((0, 2), dtype=np.int64), np.empty(0, dtype=np.float32), 5, 0.0)
+    assert len(src) == len(tgt) == len(sc) == 0
@@ -0,0 +1,151 @@
+# backend/tests/test_load_snapshot.py
+
+"""
+Change-aware loading: row_hash snapshot 과 load_changes_from_csv (fake driver, conftest.py)
+
+    pytest backend/tests/test_load_snapshot.py
+"""
+
+import csv
+from datetime import date
+
+import pytest
+
+pytest.importorskip("neo4j")
+
+from neo4j.exceptions import CypherTypeError  # noqa: E402
+
+from backend.graph.load_snapshot import (  # noqa: E402
+    LoadSnapshot,
+    diff_snapshot,
+    row_fingerprint,
+    snapshot_key,
+    split_snapshot_key,
+)
+
+
+def write_csv(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        w = csv.DictWriter(f, fieldnames=["id", "value"])
+        w.writeheader()
+        w.writerows(rows)
+    return str(path)
+
+
+# -------------------------------------------------------
+# Snapshot
+# -------------------------------------------------------
+def test_row_fingerprint():
+    a = {"id": "P1", "value": 1, "since": date(2024, 1, 2)}
+    assert row_fingerprint(a) == row_fingerprint({"since": date(2024, 1, 2), "value": 1, "id": "P1"})
+    assert row_fingerprint(a) != row_fingerprint({**a, "value": 2})
+    assert row_fingerprint(a) == row_fingerprint({**a, "since": "2024-01-02"})
+
+
+def test_snapshot_key_roundtrip():
+    key = snapshot_key(["P1", None, 3])
+    assert split_snapshot_key(key) == ("P1", "", "3")
+
+
+def test_snapshot_save_load(tmp_path):
+    snap = LoadSnapshot("nodes_Thing", root=tmp_path)
+    assert snap.load() == {}
+
+    snap.save({"a": "1", "b": "2"})
+    assert snap.load() == {"a": "1", "b": "2"}
+    assert not list(tmp_path.glob("*.tmp"))
+
+    snap.path.write_text("{not json", encoding="utf-8")
+    assert snap.load() == {}
+
+    snap.clear()
+    assert not snap.path.exists()
+
+
+def test_diff_snapshot():
+    previous = {"a": "1", "b": "2", "c": "3"}
+    current = {"a": "1", "b": "20", "d": "4"}
+    assert diff_snapshot(previous, current) == (["d"], ["b"], ["c"])
+    assert diff_snapshot({}, current) == (list(current), [], [])
+
+
+# -------------------------------------------------------
+# load_changes_from_csv
+# -------------------------------------------------------
+@pytest.fixture
+def snapshot(tmp_path):
+    return LoadSnapshot("nodes_Thing", root=tmp_path / "snapshots")
+
+
+def test_first_load_then_nothing_changed(make_loader, snapshot, tmp_path):
+    loader = make_loader()
+    path = write_csv(tmp_path / "things.csv", [{"id": f"T{i}", "value": i} for i in range(20)])
+
+    stats = loader.load_changes_from_csv(path, snapshot)
+    assert (stats["inserted"], stats["changed"], stats["deleted"], stats["unchanged"]) == (20, 0, 0, 0)
+    assert len(loader.driver.nodes) == len(loader.driver.hashes) == 20
+
+    writes = loader.driver.transactions
+    stats = loader.load_changes_from_csv(path, snapshot)
+    assert (stats["inserted"], stats["changed"], stats["deleted"], stats["unchanged"]) == (0, 0, 0, 20)
+    assert loader.driver.transactions == writes
+
+
+def test_insert_change_delete(make_loader, snapshot, tmp_path):
+    loader = make_loader()
+    rows = [{"id": f"T{i}", "value": i} for i in range(10)]
+    loader.load_changes_from_csv(write_csv(tmp_path / "v1.csv", rows), snapshot)
+
+    rows[3]["value"] = 33
+    rows = [r for r in rows if r["id"] != "T5"] + [{"id": "T10", "value": 10}]
+    stats = loader.load_changes_from_csv(write_csv(tmp_path / "v2.csv", rows), snapshot)
+
+    assert (stats["inserted"], stats["changed"], stats["deleted"], stats["unchanged"]) == (1, 1, 1, 8)
+    assert loader.driver.nodes["T3"]["value"] == 33
+    assert "T5" not in loader.driver.nodes and "T10" in loader.driver.nodes
+    assert set(snapshot.load()) == {r["id"] for r in rows}
+
+
+def test_malformed_row_is_not_treated_as_deleted(make_loader, snapshot, tmp_path, dead_letter_root):
+    loader = make_loader()
+    rows = [{"id": f"T{i}", "value": i} for i in range(10)]
+    loader.load_changes_from_csv(write_csv(tmp_path / "v1.csv", rows), snapshot)
+    before = snapshot.load()
+
+    rows[4]["value"] = "not-a-number"
+    stats = loader.load_changes_from_csv(write_csv(tmp_path / "v2.csv", rows), snapshot)
+
+    assert stats["deleted"] == 0 and stats["lost"] == 1
+    assert "T4" in loader.driver.nodes
+    assert snapshot.load()["T4"] == before["T4"]
+    assert len(list(dead_letter_root.glob("*.jsonl"))) == 1
+
+
+def test_write_failure_is_retried_next_run(make_loader, snapshot, tmp_path):
+    bad = {"T7"}
+    loader = make_loader(fail=lambda row: CypherTypeError("bad value") if row["id"] in bad else None)
+    path = write_csv(tmp_path / "things.csv", [{"id": f"T{i}", "value": i} for i in range(10)])
+
+    stats = loader.load_changes_from_csv(path, snapshot)
+    assert stats["inserted"] == 10 and stats["lost"] == 1
+    assert "T7" not in snapshot.load() and "T7" not in loader.driver.nodes
+
+    # snapshot 에서 빠졌으므로 DB 의 row_hash 노드 수와 일치 → 다음 실행은 T7 만 다시 시도
+    bad.clear()
+    writes = loader.driver.transactions
+    stats = loader.load_changes_from_csv(path, snapshot)
+    assert (stats["inserted"], stats["unchanged"], stats["lost"]) == (1, 9, 0)
+    assert loader.driver.transactions == writes + 1
+    assert "T7" in loader.driver.nodes
+
+
+def test_snapshot_ignored_when_db_was_reset(make_loader, snapshot, tmp_path):
+    loader = make_loader()
+    path = write_csv(tmp_path / "things.csv", [{"id": f"T{i}", "value": i} for i in range(5)])
+    loader.load_changes_from_csv(path, snapshot)
+
+    loader.driver.nodes.clear()
+    loader.driver.hashes.clear()
+    stats = loader.load_changes_from_csv(path, snapshot)
+    assert stats["inserted"] == 5
+    assert len(loader.driver.nodes) == 5
@@ -0,0 +1,120 @@
+# backend/tests/test_loader_stats.py
+
+"""
+AdaptiveBatchSizer / adaptive_batched / LoadStats
+
+    pytest backend/tests/test_loader_stats.py
+"""
+
+import pytest
+
+pytest.importorskip("neo4j")
+
+from backend.graph.loaders.stats import (  # noqa: E402
+    AdaptiveBatchSizer,
+    LoadStats,
+    adaptive_batched,
+    estimate_payload_bytes,
+)
+
+TARGET = 1.0
+MAX_BYTES = 10_000
+
+
+def sizer(initial=100, **kwargs):
+    kwargs = {"min_size": 10, "max_size": 1000, "target_latency_s": TARGET, "max_payload_bytes": MAX_BYTES, **kwargs}
+    return AdaptiveBatchSizer(initial, **kwargs)
+
+
+def fast(s):
+    s.observe(s.size, 0.1 * TARGET, 100)
+
+
+def test_grows_when_fast_and_small():
+    s = sizer()
+    fast(s)
+    assert s.size == 150
+    fast(s)
+    assert s.size == 225
+
+
+def test_shrinks_on_slow_batch():
+    s = sizer()
+    s.observe(100, 2 * TARGET, 100)
+    assert s.size == 50
+
+
+def test_shrinks_on_large_payload():
+    s = sizer()
+    s.observe(100, 0.1 * TARGET, MAX_BYTES + 1)
+    assert s.size == 50
+
+
+def test_shrinks_on_retry_even_for_short_batch():
+    s = sizer()
+    s.observe(30, 0.1 * TARGET, 100, retried=True)
+    assert s.size == 50
+
+
+def test_keeps_size_inside_target_band():
+    s = sizer()
+    s.observe(100, TARGET, 100)
+    s.observe(100, 0.1 * TARGET, MAX_BYTES * 3 // 4)
+    assert s.size == 100
+
+
+def test_ignores_truncated_batches():
+    s = sizer()
+    s.observe(99, 0.1 * TARGET, 100)
+    s.observe(40, 10 * TARGET, MAX_BYTES * 10)
+    assert s.size == 100
+
+
+def test_clamped_to_min_and_max():
+    s = sizer()
+    for _ in range(20):
+        fast(s)
+    assert s.size == 1000
+
+    for _ in range(20):
+        s.observe(s.size, 0.1 * TARGET, 100, retried=True)
+    assert s.size == 10
+
+
+def test_initial_size_outside_bounds_widens_them():
+    assert sizer(initial=5).min_size == 5
+    assert sizer(initial=5000).max_size == 5000
+
+
+def test_disabled_never_changes():
+    s = sizer(enabled=False)
+    fast(s)
+    s.observe(100, 10 * TARGET, 100, retried=True)
+    assert s.size == 100
+
+
+def test_adaptive_batched_rereads_size():
+    s = sizer(initial=10, min_size=1)
+    sizes = []
+    for batch in adaptive_batched(range(100), s):
+        sizes.append(len(batch))
+        fast(s)
+    assert sizes[:3] == [10, 15, 22]
+    assert sum(sizes) == 100
+
+
+def test_estimate_payload_bytes():
+    assert estimate_payload_bytes([{"id": "P1", "seq": "ACDE", "tags": ["a", "bc"], "x": None}]) == 2 + 2 + 3 + 4 + 4 + 3 + 1
+    assert estimate_payload_bytes([]) == 0
+
+
+def test_load_stats():
+    stats = LoadStats("Thing")
+    for n, latency in [(10, 0.1), (20, 0.2), (30, 0.9)]:
+        stats.record_batch(n, latency, 100)
+    stats.record_retry()
+    stats.finish()
+
+    d = stats.as_dict()
+    assert (d["rows"], d["batches"], d["retries"], d["batch_size_min"], d["batch_size_max"]) == (60, 3, 1, 10, 30)
+    assert stats.latency_percentiles() == {"p50": 0.2, "p90": 0.9, "p99": 0.9}
@@ -0,0 +1,163 @@
+# backend/tests/test_model_cache.py
+
+"""
+ModelOutputCache: memory LRU (bytes 상한), disk eviction, 깨진 항목, stripe lock 하 1회 계산
+
+    pytest backend/tests/test_model_cache.py
+"""
+
+import os
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from backend.utils import model_cache
+from backend.utils.model_cache import ModelOutputCache, sequence_key
+
+MODEL = "test-model:embedding"
+KB = 1024
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ModelOutputCache(root=tmp_path / "cache", memory_mb=16 * KB / 2**20, disk_mb=64 * KB / 2**20)
+
+
+def blob(i: int, size: int = 4 * KB) -> bytes:
+    return bytes([i % 256]) * size
+
+
+def test_sequence_key_is_exact_input():
+    assert sequence_key("MKT") == sequence_key("MKT")
+    assert sequence_key("MKT") != sequence_key("mkt")
+    assert sequence_key("MKT") != sequence_key("MKT ")
+
+
+def test_put_get_and_disk_reload(cache):
+    assert cache.get(MODEL, "AAA") is None
+    assert cache.get(MODEL, "AAA", default="x") == "x"
+
+    cache.put(MODEL, "AAA", {"score": 1.5})
+    assert cache.get(MODEL, "AAA") == {"score": 1.5}
+    assert cache.get("other-model", "AAA") is None
+
+    # 새 인스턴스 (빈 memory tier) 는 disk 에서 읽음
+    fresh = ModelOutputCache(root=cache.root)
+    assert fresh.get(MODEL, "AAA") == {"score": 1.5}
+
+
+def test_get_or_compute_hits_after_first_call(cache):
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return 42
+
+    assert cache.get_or_compute(MODEL, "SEQ", compute) == 42
+    assert cache.get_or_compute(MODEL, "SEQ", compute) == 42
+    assert ModelOutputCache(root=cache.root).get_or_compute(MODEL, "SEQ", compute) == 42
+
+    assert len(calls) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_memory_lru_is_bounded_by_bytes(cache):
+    for i in range(3):
+        cache.put(MODEL, f"S{i}", blob(i))
+    cache.get(MODEL, "S0")  # S0 를 최근 사용으로
+
+    cache.put(MODEL, "S3", blob(3))  # 16 KB 초과 → 가장 오래된 S1 제거
+    keys = [k for _, k in cache._memory]
+    assert sequence_key("S1") not in keys
+    assert {sequence_key(s) for s in ("S0", "S2", "S3")} <= set(keys)
+    assert cache._memory_bytes <= cache.memory_limit
+
+    # memory 에서 빠져도 disk 에는 남아 있음
+    assert cache.get(MODEL, "S1") == blob(1)
+
+
+def test_value_larger_than_memory_limit_is_disk_only(cache):
+    big = blob(7, size=32 * KB)
+    cache.put(MODEL, "BIG", big)
+    assert not cache._memory
+    assert cache.get(MODEL, "BIG") == big
+
+
+def test_disk_eviction_removes_oldest_down_to_90_percent(tmp_path):
+    cache = ModelOutputCache(root=tmp_path / "cache", memory_mb=1, disk_mb=1000)
+    for i in range(20):
+        cache.put(MODEL, f"S{i}", blob(i))
+
+    now = time.time()
+    for i in range(20):
+        os.utime(cache._path(MODEL, sequence_key(f"S{i}")), (now - 100 + i, now - 100 + i))
+
+    cache.disk_limit = 40 * KB
+    cache.evict()
+
+    sizes = [p.stat().st_size for p in cache.root.rglob("*.pkl")]
+    assert sum(sizes) <= 0.9 * cache.disk_limit
+    remaining = {p.stem for p in cache.root.rglob("*.pkl")}
+    assert sequence_key("S19") in remaining
+    assert sequence_key("S0") not in remaining
+
+
+def test_disk_put_triggers_eviction(cache):
+    for i in range(40):
+        cache.put(MODEL, f"S{i}", blob(i))
+    total = sum(p.stat().st_size for p in cache.root.rglob("*.pkl"))
+    assert total <= cache.disk_limit + cache.disk_limit // 20 + 5 * KB
+
+
+def test_corrupt_entry_is_ignored_and_recomputed(cache):
+    cache.put(MODEL, "SEQ", 1)
+    path = cache._path(MODEL, sequence_key("SEQ"))
+    path.write_bytes(b"not a pickle")
+    cache.clear_memory()
+
+    assert cache.get(MODEL, "SEQ") is None
+    assert cache.get_or_compute(MODEL, "SEQ", lambda: 2) == 2
+    assert ModelOutputCache(root=cache.root).get(MODEL, "SEQ") == 2
+
+
+@pytest.mark.skipif(model_cache.fcntl is None, reason="needs fcntl file locks")
+def test_concurrent_requests_compute_once(cache):
+    calls = []
+    start = threading.Barrier(8)
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.2)
+        return np.arange(4, dtype=np.float32)
+
+    results = []
+
+    def worker():
+        start.wait()
+        results.append(cache.get_or_compute(MODEL, "SEQ", compute))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert len(results) == 8
+    assert all(np.array_equal(r, np.arange(4)) for r in results)
+
+
+def test_cached_arrays_are_read_only(cache):
+    emb = cache.get_or_compute(MODEL, "SEQ", lambda: np.ones((1, 4), dtype=np.float32))
+    assert not emb.flags.writeable
+    with pytest.raises(ValueError):
+        emb *= 2
+
+    again = cache.get_or_compute(MODEL, "SEQ", lambda: None)
+    np.testing.assert_array_equal(again, np.ones((1, 4)))
+
+    cache.clear_memory()
+    from_disk = cache.get(MODEL, "SEQ")
+    assert not from_disk.flags.writeable
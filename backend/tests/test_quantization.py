@@ -0,0 +1,92 @@
+# backend/tests/test_quantization.py
+
+"""
+Quantized index: 압축 code 후보 + full-precision 재정렬을 exact top-k 와 비교
+
+    pytest backend/tests/test_quantization.py
+"""
+
+import numpy as np
+import pytest
+
+from backend.pipeline.embedding_store import vectors_fingerprint
+from backend.pipeline.quantization import QuantizedIndex, get_or_build_quantized, recall_at_k
+from backend.pipeline.similarity_engine import normalize_rows, topk_block
+
+N, D, K = 1200, 48, 10
+
+
+@pytest.fixture(scope="module")
+def data():
+    rng = np.random.default_rng(0)
+    centers = rng.normal(size=(40, D))
+    x = centers[rng.integers(0, 40, size=N)] + 0.3 * rng.normal(size=(N, D))
+    ids = [f"P{i:05d}" for i in range(N)]
+    return ids, x.astype(np.float32)
+
+
+CONFIGS = [("int8", None), ("float16", None), ("int8", 24), ("float16", 24)]
+
+
+@pytest.mark.parametrize("mode,pca_dim", CONFIGS)
+def test_rerank_matches_exact(data, mode, pca_dim):
+    ids, x = data
+    index = QuantizedIndex(mode=mode, pca_dim=pca_dim).build(ids, x)
+
+    q = np.arange(0, N, 7)
+    top_idx, top_scores = index.search(x[q], top_k=K, self_rows=q)
+
+    xn = normalize_rows(x)
+    exact_idx, exact_scores = topk_block(xn[q], xn, K, q)
+
+    recall = np.mean([len(np.intersect1d(a, e)) / K for a, e in zip(top_idx, exact_idx)])
+    assert recall >= (0.99 if pca_dim is None else 0.9), recall
+
+    # 재정렬 점수는 full-precision cosine 그대로
+    expected = np.einsum("bd,bkd->bk", xn[q], xn[top_idx])
+    np.testing.assert_allclose(top_scores, expected, rtol=1e-5, atol=1e-6)
+    assert (np.diff(top_scores, axis=1) <= 1e-6).all()
+    assert not (top_idx == q[:, None]).any()
+
+
+def test_recall_without_extra_candidates(data):
+    ids, x = data
+    index = QuantizedIndex(mode="int8", rerank_factor=1).build(ids, x)
+    report = recall_at_k(index, x, top_k=K, sample=200)
+    assert report["recall"] >= 0.9, report
+
+
+def test_codes_are_smaller(data):
+    ids, x = data
+    assert QuantizedIndex(mode="int8").build(ids, x).memory_ratio() == pytest.approx(4.0)
+    assert QuantizedIndex(mode="float16", pca_dim=24).build(ids, x).memory_ratio() == pytest.approx(4.0)
+
+
+def test_iter_topk_blocks_cover_queries(data):
+    ids, x = data
+    index = QuantizedIndex(mode="int8").build(ids, x)
+    q = np.concatenate([b[0] for b in index.iter_topk(x, top_k=K, block_rows=250)])
+    np.testing.assert_array_equal(q, np.arange(N))
+
+
+def test_unknown_mode():
+    with pytest.raises(ValueError):
+        QuantizedIndex(mode="int4")
+
+
+def test_get_or_build_reuses_only_matching_codes(data, tmp_path):
+    ids, x = data
+    first = get_or_build_quantized(ids, x, mode="int8", path=tmp_path)
+    assert first.fingerprint == vectors_fingerprint(ids, x)
+
+    again = get_or_build_quantized(ids, x, mode="int8", path=tmp_path)
+    np.testing.assert_array_equal(again.codes, first.codes)
+
+    moved = x.copy()
+    moved[:10] *= -1
+    rebuilt = get_or_build_quantized(ids, moved, mode="int8", path=tmp_path)
+    assert rebuilt.fingerprint == vectors_fingerprint(ids, moved)
+    assert not np.array_equal(rebuilt.codes[:10], first.codes[:10])
+
+    pca = get_or_build_quantized(ids, moved, mode="int8", pca_dim=24, path=tmp_path)
+    assert pca.codes.shape == (N, 24)
@@ -0,0 +1,45 @@
+# backend/tests/test_query_plans.py
+
+"""
+Query-plan regression test (local Neo4j 필요, 없으면 skip)
+
+    pytest backend/tests/test_query_plans.py
+
+모든 loader / relation / search Cypher 의 EXPLAIN plan 에
+NodeByLabelScan / AllNodesScan / CartesianProduct 가 없어야 함.
+"""
+
+import pytest
+
+pytest.importorskip("neo4j")
+
+from backend.graph.loaders.utils import get_driver, close_driver  # noqa: E402
+from backend.graph.query_preflight import (  # noqa: E402
+    ensure_constraints,
+    explain,
+    preflight_statements,
+)
+
+
+@pytest.fixture(scope="module")
+def driver():
+    d = get_driver()
+    try:
+        d.verify_connectivity()
+    except Exception as e:
+        close_driver()
+        pytest.skip(f"Neo4j not available: {e}")
+    yield d
+    close_driver()
+
+
+def test_required_constraints(driver):
+    assert ensure_constraints(driver) == []
+
+
+def test_statement_plans_use_indexes(driver):
+    checks = [explain(driver, *stmt) for stmt in preflight_statements(driver)]
+    assert checks
+
+    failed = {c.name: c.error or sorted(set(c.offending)) for c in checks if not c.ok}
+    assert not failed, f"Plan regressions: {failed}"
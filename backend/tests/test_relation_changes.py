@@ -0,0 +1,107 @@
+# backend/tests/test_relation_changes.py
+
+"""
+RelationLoader.load_changes: 관계 row_hash snapshot (fake driver, conftest.py)
+
+    pytest backend/tests/test_relation_changes.py
+
+양 끝 노드가 없어 MATCH 되지 않은 row 는 snapshot 에 들어가지 않고 dead-letter 로 가야 한다.
+(안 그러면 다음 실행에서 DB 관계 수 < snapshot 이 되어 매번 전체 적재)
+"""
+
+import csv
+import json
+
+import pytest
+
+pytest.importorskip("neo4j")
+
+from backend.graph.load_snapshot import LoadSnapshot, snapshot_key  # noqa: E402
+from backend.graph.relation_loader import RELATION_SPECS, RelationLoader  # noqa: E402
+
+SPECS = {spec.name: spec for spec in RELATION_SPECS}
+
+
+def write_csv(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        w = csv.DictWriter(f, fieldnames=list(rows[0]))
+        w.writeheader()
+        w.writerows(rows)
+    return str(path)
+
+
+@pytest.fixture
+def loader(fake_driver, dead_letter_root):
+    fake_driver.nodes.update({k: {} for k in ("NCT1", "NCT2", "P1", "P2", "P3", "D1")})
+    return RelationLoader(driver=fake_driver, workers=1)
+
+
+@pytest.fixture
+def snapshot(tmp_path):
+    return LoadSnapshot("rels_test", root=tmp_path / "snapshots")
+
+
+def test_dangling_rows_are_lost_not_snapshotted(loader, snapshot, tmp_path, dead_letter_root):
+    spec = SPECS["trial_protein"]
+    path = write_csv(tmp_path / "trial_protein.csv", [
+        {"trial_id": "NCT1", "uniprot_id": "P1"},
+        {"trial_id": "NCT1", "uniprot_id": "P2"},
+        {"trial_id": "NCT2", "uniprot_id": "P404"},
+    ])
+    dangling = snapshot_key(("NCT2", "P404"))
+
+    stats = loader.load_changes(spec, path, snapshot)
+    assert (stats["inserted"], stats["lost"]) == (3, 1)
+    assert len(loader.driver.rels) == 2
+    assert dangling not in snapshot.load() and len(snapshot.load()) == 2
+
+    files = list(dead_letter_root.glob("RelationLoader_trial_protein_*.jsonl"))
+    assert stats["dead_letter_path"] == str(files[0])
+    (record,) = [json.loads(line) for line in files[0].read_text(encoding="utf-8").splitlines()]
+    assert record["stage"] == "match" and record["row"]["e"] == "P404"
+
+    # snapshot 과 DB 관계 수가 같으므로 전체 적재 없이 dangling row 만 다시 시도
+    writes = loader.driver.transactions
+    stats = loader.load_changes(spec, path, snapshot)
+    assert (stats["inserted"], stats["unchanged"], stats["lost"]) == (1, 2, 1)
+    assert loader.driver.transactions == writes + 1
+
+    # 노드가 생기면 다음 실행에서 기록
+    loader.driver.nodes["P404"] = {}
+    stats = loader.load_changes(spec, path, snapshot)
+    assert (stats["inserted"], stats["unchanged"], stats["lost"]) == (1, 2, 0)
+    assert stats["dead_letter_path"] is None
+    assert dangling in snapshot.load() and len(loader.driver.rels) == 3
+
+
+def test_unmatched_change_keeps_previous_hash(loader, snapshot, tmp_path):
+    spec = SPECS["protein_disease"]
+    rows = [{"uniprot_id": "P1", "disease_id": "D1", "score": "0.5"}]
+    loader.load_changes(spec, write_csv(tmp_path / "v1.csv", rows), snapshot)
+    before = snapshot.load()
+
+    del loader.driver.nodes["D1"]
+    rows[0]["score"] = "0.9"
+    stats = loader.load_changes(spec, write_csv(tmp_path / "v2.csv", rows), snapshot)
+
+    assert (stats["changed"], stats["lost"]) == (1, 1)
+    assert snapshot.load() == before
+
+
+def test_insert_change_delete(loader, snapshot, tmp_path):
+    spec = SPECS["protein_disease"]
+    rows = [
+        {"uniprot_id": "P1", "disease_id": "D1", "score": "0.5"},
+        {"uniprot_id": "P2", "disease_id": "D1", "score": "0.6"},
+    ]
+    loader.load_changes(spec, write_csv(tmp_path / "v1.csv", rows), snapshot)
+
+    rows = [
+        {"uniprot_id": "P1", "disease_id": "D1", "score": "0.7"},
+        {"uniprot_id": "P3", "disease_id": "D1", "score": "0.1"},
+    ]
+    stats = loader.load_changes(spec, write_csv(tmp_path / "v2.csv", rows), snapshot)
+
+    assert (stats["inserted"], stats["changed"], stats["deleted"], stats["unchanged"], stats["lost"]) == (1, 1, 1, 0, 0)
+    assert set(loader.driver.rels) == {snapshot_key(("P1", "D1")), snapshot_key(("P3", "D1"))}
+    assert set(snapshot.load()) == set(loader.driver.rels)
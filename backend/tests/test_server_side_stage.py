@@ -0,0 +1,64 @@
+# backend/tests/test_server_side_stage.py
+
+"""
+server_side_loader.stage_node_csv: LOAD CSV 용 staging CSV 의 header / type
+
+    pytest backend/tests/test_server_side_stage.py
+"""
+
+import csv
+
+import pytest
+
+pytest.importorskip("neo4j")
+
+from backend.graph.server_side_loader import node_load_csv_cypher, stage_node_csv  # noqa: E402
+
+
+class SparseLoader:
+    """일부 row 에만 있는 컬럼 (alias, length) 을 만드는 loader"""
+
+    label = "Thing"
+    key = "id"
+
+    def _preprocess_row(self, row):
+        out = {"id": row["id"]}
+        if row.get("alias"):
+            out["alias"] = row["alias"]
+        if row.get("length"):
+            out["length"] = int(row["length"])
+        return out
+
+    def _prepare_cypher_and_params(self, batch):
+        return "UNWIND $rows AS row MERGE (n:Thing {id: row.id}) SET n += row", {"rows": batch}
+
+
+def write_csv(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        w = csv.DictWriter(f, fieldnames=["id", "alias", "length"])
+        w.writeheader()
+        w.writerows(rows)
+    return path
+
+
+def test_header_is_union_of_all_rows(tmp_path):
+    src = write_csv(tmp_path / "things.csv", [
+        {"id": "T1", "alias": "", "length": ""},
+        {"id": "", "alias": "skipped", "length": "1"},
+        {"id": "T2", "alias": "two", "length": ""},
+        {"id": "T3", "alias": "", "length": "30"},
+    ])
+
+    url, types, n = stage_node_csv(SparseLoader(), src, tmp_path / "import")
+
+    assert n == 3
+    assert url.endswith("/nodes_Thing.csv")
+    assert types == {"id": "string", "alias": "string", "length": "long"}
+
+    staged = next((tmp_path / "import").rglob("nodes_Thing.csv"))
+    with open(staged, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert [list(r.values()) for r in rows] == [["T1", "", ""], ["T2", "two", ""], ["T3", "", "30"]]
+
+    cypher = node_load_csv_cypher(SparseLoader(), types, 1000)
+    assert "alias: line.`alias`" in cypher and "line.`length`" in cypher
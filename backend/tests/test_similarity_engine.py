@@ -0,0 +1,110 @@
+# backend/tests/test_similarity_engine.py
+
+"""
+Tiled top-k (similarity_engine) 를 brute-force N×N 결과와 비교
+
+    pytest backend/tests/test_similarity_engine.py
+
+max_memory_mb 를 아주 작게 줘서 block / tile 경계가 여러 번 생기게 한다.
+"""
+
+import numpy as np
+import pytest
+
+from backend.pipeline.similarity_engine import (
+    iter_topk,
+    normalize_rows,
+    plan_block_rows,
+    topk_against,
+)
+
+N, D, K = 157, 16, 7
+TINY_MB = 0.02  # 12 B/cell × 157 → block 당 ~11 행 (N 의 약수가 아님)
+
+
+@pytest.fixture(scope="module")
+def vectors():
+    return np.random.default_rng(0).normal(size=(N, D)).astype(np.float32)
+
+
+def brute_force(vectors, top_k, columns=None, exclude_self=True):
+    x = normalize_rows(vectors)
+    sims = x @ x.T
+    if exclude_self:
+        np.fill_diagonal(sims, -np.inf)
+    if columns is not None:
+        mask = np.full(sims.shape, -np.inf, dtype=np.float32)
+        mask[:, columns] = 0
+        sims = sims + mask
+    idx = np.argsort(-sims, axis=1, kind="stable")[:, :top_k]
+    return idx, np.take_along_axis(sims, idx, axis=1)
+
+
+def collect(blocks):
+    q, idx, scores = zip(*blocks)
+    return np.concatenate(q), np.vstack(idx), np.vstack(scores)
+
+
+def test_block_plan_splits_unevenly():
+    rows = plan_block_rows(N, TINY_MB)
+    assert 1 < rows < N and N % rows
+
+
+@pytest.mark.parametrize("max_memory_mb", [TINY_MB, 1024])
+def test_iter_topk_matches_brute_force(vectors, max_memory_mb):
+    q, idx, scores = collect(iter_topk(vectors, top_k=K, max_memory_mb=max_memory_mb))
+    exp_idx, exp_scores = brute_force(vectors, K)
+
+    np.testing.assert_array_equal(q, np.arange(N))
+    np.testing.assert_array_equal(idx, exp_idx)
+    np.testing.assert_allclose(scores, exp_scores, rtol=1e-5, atol=1e-6)
+
+
+def test_iter_topk_excludes_self(vectors):
+    for q_idx, top_idx, _ in iter_topk(vectors, top_k=K, max_memory_mb=TINY_MB):
+        assert not (top_idx == q_idx[:, None]).any()
+
+
+def test_iter_topk_keeps_self_when_asked(vectors):
+    _, idx, scores = collect(iter_topk(vectors, top_k=K, exclude_self=False, max_memory_mb=TINY_MB))
+    np.testing.assert_array_equal(idx[:, 0], np.arange(N))
+    np.testing.assert_allclose(scores[:, 0], 1.0, atol=1e-5)
+
+
+def test_iter_topk_query_subset(vectors):
+    query = np.array([0, 3, 10, 11, 12, 100, N - 1])
+    q, idx, scores = collect(iter_topk(vectors, top_k=K, query_indices=query, max_memory_mb=TINY_MB))
+    exp_idx, exp_scores = brute_force(vectors, K)
+
+    np.testing.assert_array_equal(q, query)
+    np.testing.assert_array_equal(idx, exp_idx[query])
+    np.testing.assert_allclose(scores, exp_scores[query], rtol=1e-5, atol=1e-6)
+
+
+def test_iter_topk_k_larger_than_corpus():
+    small = np.random.default_rng(1).normal(size=(4, D))
+    _, idx, _ = collect(iter_topk(small, top_k=10))
+    assert idx.shape == (4, 3)
+
+
+@pytest.mark.parametrize("max_memory_mb", [TINY_MB, 1024])
+def test_topk_against_matches_brute_force(vectors, max_memory_mb):
+    cand = np.sort(np.random.default_rng(2).choice(N, 40, replace=False))
+    idx, scores = topk_against(vectors, cand, top_k=K, max_memory_mb=max_memory_mb)
+    exp_idx, exp_scores = brute_force(vectors, K, columns=cand)
+
+    np.testing.assert_array_equal(idx, exp_idx)
+    np.testing.assert_allclose(scores, exp_scores, rtol=1e-5, atol=1e-6)
+    assert np.isin(idx, cand).all()
+    assert not (idx == np.arange(N)[:, None]).any()
+
+
+def test_topk_against_pads_when_few_candidates(vectors):
+    cand = np.array([5, 6])
+    idx, scores = topk_against(vectors, cand, top_k=K)
+    assert idx.shape == (N, 2)
+
+    # 후보 자신은 자기 자신을 뺀 나머지 한 개만 남고 빈 자리는 -inf
+    assert idx[5, 0] == 6 and np.isneginf(scores[5, 1])
+    assert idx[6, 0] == 5 and np.isneginf(scores[6, 1])
+    assert np.isfinite(scores[np.setdiff1d(np.arange(N), cand)]).all()
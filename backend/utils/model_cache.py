@@ -0,0 +1,293 @@
+# backend/utils/model_cache.py
+
+"""
+Content-addressed cache for per-sequence model outputs
+
+key = (model id, sha256(sequence))   — sequence 는 모델 입력 그대로 (정규화는 호출하는 쪽에서)
+
+    1) in-memory LRU   : 프로세스 내, MODEL_CACHE_MEMORY_MB 초과 시 오래된 항목부터 제거
+    2) on-disk         : Config.DATA_ROOT / "cache" / "model_outputs" / <model>/<hh>/<hash>.pkl
+                         MODEL_CACHE_DISK_MB 초과 시 mtime 이 오래된 파일부터 제거
+
+프로세스 간 안전성:
+    - 쓰기는 temp file + os.replace (reader 는 항상 완성된 파일만 봄)
+    - 같은 key 의 계산은 fcntl lock 으로 직렬화 → 동시에 요청돼도 모델 호출은 1번
+    - eviction 은 전역 lock 하에서 수행
+
+반환값은 cache 에 든 객체 그대로 (memory tier) 이므로 numpy 배열은 read-only 로 표시한다.
+수정이 필요하면 호출하는 쪽에서 복사할 것.
+
+사용:
+    cache = get_model_cache()
+    score = cache.get_or_compute("esm2_t33_650M_UR50D:score", seq, lambda: model(seq))
+"""
+
+import os
+import pickle
+import hashlib
+import logging
+import tempfile
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+
+from backend.config import Config
+
+try:
+    import fcntl
+except ImportError:  # Windows: 프로세스 간 lock 없이 동작 (atomic replace 는 유지)
+    fcntl = None
+
+logger = logging.getLogger("model_cache")
+
+MODEL_CACHE_ROOT = Path(os.getenv("MODEL_CACHE_ROOT") or Config.DATA_ROOT / "cache" / "model_outputs")
+MODEL_CACHE_MEMORY_MB = int(os.getenv("MODEL_CACHE_MEMORY_MB", "256"))
+MODEL_CACHE_DISK_MB = int(os.getenv("MODEL_CACHE_DISK_MB", "4096"))
+
+_MISS = object()
+
+
+# key 규칙이 바뀌면 올림 (이전 규칙으로 저장된 파일은 다시 읽지 않음)
+_KEY_VERSION = "v2"
+
+
+def sequence_key(sequence: str) -> str:
+    """
+    모델에 실제로 들어가는 입력 그대로의 sha256 (정규화하지 않음).
+    대소문자 / 공백을 같은 항목으로 보려면 호출하는 쪽에서 정규화한 서열로 추론하고 그 서열을 넘길 것.
+    """
+    return hashlib.sha256(f"{_KEY_VERSION}:{sequence}".encode("utf-8")).hexdigest()
+
+
+def _freeze(value: Any) -> Any:
+    """numpy 배열은 read-only 로 (호출하는 쪽의 in-place 수정이 cache 항목을 바꾸지 않게)"""
+    if isinstance(value, np.ndarray):
+        value.setflags(write=False)
+    return value
+
+
+def _model_dir_name(model_id: str) -> str:
+    return "".join(ch if ch.isalnum() or ch in "-_." else "_" for ch in model_id)
+
+
+@contextmanager
+def _file_lock(path: Path):
+    if fcntl is None:
+        yield
+        return
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a+b") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+class ModelOutputCache:
+    def __init__(
+        self,
+        root: Path = MODEL_CACHE_ROOT,
+        memory_mb: int = MODEL_CACHE_MEMORY_MB,
+        disk_mb: int = MODEL_CACHE_DISK_MB,
+    ):
+        self.root = Path(root)
+        self.memory_limit = memory_mb * 1024 * 1024
+        self.disk_limit = disk_mb * 1024 * 1024
+
+        self._memory: "OrderedDict[tuple, tuple]" = OrderedDict()  # key → (value, nbytes)
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+
+        # 마지막 eviction 이후 이 프로세스가 쓴 bytes (전체 스캔 빈도 조절용)
+        self._written_since_sweep = 0
+
+        self.hits = 0
+        self.misses = 0
+
+    # ------------------------------------------------------------
+    # Paths
+    # ------------------------------------------------------------
+    def _path(self, model_id: str, digest: str) -> Path:
+        return self.root / _model_dir_name(model_id) / digest[:2] / f"{digest}.pkl"
+
+    # ------------------------------------------------------------
+    # Memory tier
+    # ------------------------------------------------------------
+    def _memory_get(self, key):
+        with self._lock:
+            item = self._memory.get(key)
+            if item is None:
+                return _MISS
+            self._memory.move_to_end(key)
+            return item[0]
+
+    def _memory_put(self, key, value, nbytes: int):
+        _freeze(value)
+        if nbytes > self.memory_limit:
+            return
+        with self._lock:
+            old = self._memory.pop(key, None)
+            if old is not None:
+                self._memory_bytes -= old[1]
+            self._memory[key] = (value, nbytes)
+            self._memory_bytes += nbytes
+            while self._memory_bytes > self.memory_limit:
+                _, (_, size) = self._memory.popitem(last=False)
+                self._memory_bytes -= size
+
+    # ------------------------------------------------------------
+    # Disk tier
+    # ------------------------------------------------------------
+    def _disk_get(self, path: Path):
+        try:
+            with open(path, "rb") as f:
+                payload = f.read()
+        except FileNotFoundError:
+            return _MISS, 0
+
+        try:
+            value = pickle.loads(payload)
+        except Exception as e:
+            logger.warning(f"[ModelCache] Corrupt entry ignored: {path} ({e})")
+            return _MISS, 0
+
+        try:
+            os.utime(path)  # disk eviction 은 mtime 기준 LRU
+        except OSError:
+            pass
+        return value, len(payload)
+
+    def _disk_put(self, path: Path, payload: bytes):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp, path)
+        except Exception:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+
+        self._written_since_sweep += len(payload)
+        if self._written_since_sweep > self.disk_limit // 20:
+            self.evict()
+
+    def evict(self):
+        """disk tier 가 MODEL_CACHE_DISK_MB 를 넘으면 오래된 파일부터 삭제"""
+        self._written_since_sweep = 0
+        if not self.root.exists():
+            return
+
+        with _file_lock(self.root / ".evict.lock"):
+            entries = []
+            total = 0
+            for p in self.root.rglob("*.pkl"):
+                try:
+                    st = p.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, p))
+                total += st.st_size
+
+            if total <= self.disk_limit:
+                return
+
+            entries.sort()
+            removed = 0
+            for _, size, p in entries:
+                if total <= self.disk_limit * 0.9:
+                    break
+                try:
+                    p.unlink()
+                    total -= size
+                    removed += 1
+                except FileNotFoundError:
+                    pass
+
+            logger.info(f"[ModelCache] Evicted {removed} entries (disk now {total / 1e6:.1f} MB)")
+
+    # ------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------
+    def get(self, model_id: str, sequence: str, default=None) -> Any:
+        digest = sequence_key(sequence)
+        key = (model_id, digest)
+
+        value = self._memory_get(key)
+        if value is not _MISS:
+            return value
+
+        value, nbytes = self._disk_get(self._path(model_id, digest))
+        if value is _MISS:
+            return default
+
+        self._memory_put(key, value, nbytes)
+        return value
+
+    def put(self, model_id: str, sequence: str, value: Any):
+        digest = sequence_key(sequence)
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        self._disk_put(self._path(model_id, digest), payload)
+        self._memory_put((model_id, digest), value, len(payload))
+
+    def get_or_compute(self, model_id: str, sequence: str, compute: Callable[[], Any]) -> Any:
+        """
+        cache 에 있으면 반환, 없으면 compute() 결과를 저장 후 반환.
+        같은 key 를 여러 프로세스/스레드가 동시에 요청해도 compute() 는 한 번만 실행.
+        """
+        digest = sequence_key(sequence)
+        key = (model_id, digest)
+
+        value = self._memory_get(key)
+        if value is not _MISS:
+            self.hits += 1
+            return value
+
+        path = self._path(model_id, digest)
+        value, nbytes = self._disk_get(path)
+        if value is not _MISS:
+            self.hits += 1
+            self._memory_put(key, value, nbytes)
+            return value
+
+        # key 별 lock 파일 대신 hash prefix 256 개 stripe 로 lock (lock 파일이 쌓이지 않게)
+        with _file_lock(self.root / ".locks" / f"{digest[:2]}.lock"):
+            # lock 대기 중 다른 프로세스가 계산을 끝냈을 수 있음
+            value, nbytes = self._disk_get(path)
+            if value is not _MISS:
+                self.hits += 1
+                self._memory_put(key, value, nbytes)
+                return value
+
+            self.misses += 1
+            value = compute()
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            self._disk_put(path, payload)
+
+        self._memory_put(key, value, len(payload))
+        return value
+
+    def clear_memory(self):
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+
+
+# ---------------------------------------------------
+# Process-wide singleton
+# ---------------------------------------------------
+_CACHE = None
+
+
+def get_model_cache() -> ModelOutputCache:
+    global _CACHE
+    if _CACHE is None:
+        _CACHE = ModelOutputCache()
+    return _CACHE